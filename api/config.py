@@ -5,6 +5,8 @@ class BaseConfig:
     JSON_SORT_KEYS = False
     CORS_ORIGINS = "*"
     RATELIMIT_DEFAULT = "100 per minute"
+    # Respuestas grandes en streaming (solo tiene sentido con gunicorn)
+    STREAM_RESPONSES = os.getenv("STREAM_RESPONSES", "false").lower() == "true"
 
 
 class DevelopmentConfig(BaseConfig):
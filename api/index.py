@@ -1,6 +1,10 @@
 from api.app import create_app
+from api.services import bundle
 from apig_wsgi import make_lambda_handler
 
+# En Lambda los datos vienen precompilados en la imagen: se cargan en el INIT
+bundle.load()
+
 app = create_app()
 
 handler = make_lambda_handler(app)
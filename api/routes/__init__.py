@@ -24,6 +24,7 @@ from .v1.uvi import uvi_v1_bp
 from .v1.rios import rios_v1_bp
 from .v1.personas import personas_desaparecidas_v1_bp
 from .v1.provincias import provincias_v1_bp
+from .v1.municipios import municipios_v1_bp
 from .v1.medicamentos import medicamentos_v1_bp
 from .v1.riesgo_pais import riesgo_pais_v1_bp
 from .v1.diputados import diputados_v1_bp
@@ -57,6 +58,7 @@ def register_routes(app):
     app.register_blueprint(rios_v1_bp)
     app.register_blueprint(personas_desaparecidas_v1_bp)
     app.register_blueprint(provincias_v1_bp)
+    app.register_blueprint(municipios_v1_bp)
     app.register_blueprint(medicamentos_v1_bp)
     app.register_blueprint(riesgo_pais_v1_bp)
     app.register_blueprint(diputados_v1_bp)
@@ -1,6 +1,6 @@
 # api/routes/legacy/combustibles.py
 from flask import Blueprint
-from api.services.data_loader import (
+from api.services.combustibles_service import (
     get_combustibles_by_provincia,
     get_combustibles_by_empresa,
     get_promedio_combustible,
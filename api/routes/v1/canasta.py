@@ -1,10 +1,18 @@
 # api/routes/v1/canasta.py
 import re
 from flask import Blueprint, request
-from api.services.data_loader import get_canasta, get_canasta_history, get_canasta_range
+from api.services.data_loader import (
+    get_canasta,
+    get_canasta_history,
+    get_canasta_range,
+    get_dataset_version,
+    get_history_last,
+    get_history_page,
+)
 from api.utils.responses import success, error
+from api.utils.paginacion import PARAMS_PAGINACION, leer_paginacion
 
-PARAMS_VALIDOS = {"desde", "hasta", "historico"}
+PARAMS_VALIDOS = {"desde", "hasta", "historico"} | PARAMS_PAGINACION
 FORMATO_FECHA = re.compile(r"^\d{4}-(0[1-9]|1[0-2])$")
 
 canasta_v1_bp = Blueprint("canasta_v1", __name__, url_prefix="/v1/canasta")
@@ -29,6 +37,16 @@ def obtener_canasta():
             400,
         )
 
+    limit, cursor, ultimos, err = leer_paginacion(request.args, validar_fecha)
+    if err:
+        return err
+
+    if ultimos is not None:
+        data = get_history_last("canasta", ultimos)
+        if not data:
+            return error("No hay histórico de canasta disponible", 404)
+        return success(data, version=get_dataset_version("canasta"))
+
     desde = request.args.get("desde")
     hasta = request.args.get("hasta")
     historico = request.args.get("historico", "").lower()
@@ -44,10 +62,18 @@ def obtener_canasta():
         if err:
             return err
 
+        if limit is not None:
+            data, siguiente = get_history_page("canasta", limit, cursor, desde, hasta)
+            return success(
+                data,
+                version=get_dataset_version("canasta"),
+                paginacion={"limit": limit, "siguiente_cursor": siguiente},
+            )
+
         data = get_canasta_range(desde, hasta)
         if data is None:
             return error("No hay datos para el rango solicitado", 404)
-        return success(data)
+        return success(data, version=get_dataset_version("canasta"))
 
     if "historico" in params_recibidos:
         if historico != "true":
@@ -55,10 +81,18 @@ def obtener_canasta():
                 "El parámetro 'historico' solo acepta el valor 'true' (ej: ?historico=true)",
                 400,
             )
+        if limit is not None:
+            data, siguiente = get_history_page("canasta", limit, cursor)
+            return success(
+                data,
+                version=get_dataset_version("canasta"),
+                paginacion={"limit": limit, "siguiente_cursor": siguiente},
+            )
+
         data = get_canasta_history()
         if not data:
             return error("No hay histórico de canasta disponible", 404)
-        return success(data)
+        return success(data, version=get_dataset_version("canasta"))
 
     data = get_canasta()
     if not data:
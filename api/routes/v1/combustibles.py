@@ -1,11 +1,29 @@
 # api/routes/v1/combustibles.py
+import re
 from flask import Blueprint, request
-from api.services.data_loader import (
-    get_combustibles_by_provincia,
-    get_combustibles_by_empresa,
+from api.services.combustibles_service import (
+    CAMPOS_CAMBIOS,
+    CAMPOS_FILTRO,
+    CAMPOS_HISTORICO,
+    DIMENSIONES_ESTADISTICAS,
+    buscar_combustibles,
+    get_cambios,
+    get_estadisticas,
+    get_combustibles_cercanos,
+    get_historico_combustibles,
     get_promedio_combustible,
 )
-from api.utils.responses import success, error
+from api.utils.responses import success, success_stream, error
+from api.utils.geo import leer_coordenadas
+
+PARAMS_VALIDOS = set(CAMPOS_FILTRO)
+PARAMS_CERCANAS = {"lat", "lon", "radio_km", "combustible", "limite", "orden"}
+RADIO_DEFAULT_KM = 10
+RADIO_MAX_KM = 200
+LIMITE_DEFAULT = 10
+LIMITE_MAX = 100
+PARAMS_CAMBIOS = {"desde"} | set(CAMPOS_CAMBIOS)
+FORMATO_FECHA = re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$")
 
 combustibles_v1_bp = Blueprint(
     "combustibles_v1", __name__, url_prefix="/v1/combustibles"
@@ -14,25 +32,28 @@ combustibles_v1_bp = Blueprint(
 
 @combustibles_v1_bp.route("/", methods=["GET"])
 def obtener_combustibles():
-    provincia = request.args.get("provincia")
-    empresa = request.args.get("empresa")
+    params_recibidos = set(request.args.keys())
+    params_invalidos = params_recibidos - PARAMS_VALIDOS
 
-    if provincia and empresa:
-        return error("Usar 'provincia' o 'empresa', no ambos a la vez", 400)
+    if params_invalidos:
+        return error(
+            f"Parámetro(s) no reconocido(s): {', '.join(params_invalidos)}. Parámetros válidos: {', '.join(CAMPOS_FILTRO)}",
+            400,
+        )
 
-    if provincia:
-        data = get_combustibles_by_provincia(provincia)
-        if not data:
-            return error("No se encontraron datos para esa provincia", 404)
-        return success(data)
+    filtros = {campo: request.args.get(campo) for campo in CAMPOS_FILTRO}
 
-    if empresa:
-        data = get_combustibles_by_empresa(empresa)
-        if not data:
-            return error("No se encontraron datos para esa empresa", 404)
-        return success(data)
+    if not any(filtros.values()):
+        return error(
+            "Debe proveer al menos uno de estos parámetros: "
+            + ", ".join(f"'{campo}'" for campo in CAMPOS_FILTRO),
+            400,
+        )
 
-    return error("Debe proveer 'provincia' o 'empresa' como parámetro", 400)
+    data = buscar_combustibles(**filtros)
+    if not data:
+        return error("No se encontraron datos para esos filtros", 404)
+    return success_stream(data)
 
 
 @combustibles_v1_bp.route("/promedio", methods=["GET"])
@@ -54,3 +75,135 @@ def promedio_combustible():
             "precio_promedio": promedio,
         }
     )
+
+
+@combustibles_v1_bp.route("/historico", methods=["GET"])
+def historico_combustibles():
+    params_invalidos = set(request.args.keys()) - set(CAMPOS_HISTORICO)
+
+    if params_invalidos:
+        return error(
+            f"Parámetro(s) no reconocido(s): {', '.join(params_invalidos)}. Parámetros válidos: {', '.join(CAMPOS_HISTORICO)}",
+            400,
+        )
+
+    filtros = {campo: request.args.get(campo) for campo in CAMPOS_HISTORICO}
+
+    if not any(filtros.values()):
+        return error(
+            "Debe proveer al menos uno de estos parámetros: "
+            + ", ".join(f"'{campo}'" for campo in CAMPOS_HISTORICO),
+            400,
+        )
+
+    try:
+        data = get_historico_combustibles(**filtros)
+    except FileNotFoundError as e:
+        return error(str(e), 503)
+    if not data:
+        return error("No se encontraron datos para esos filtros", 404)
+    return success_stream(data)
+
+
+@combustibles_v1_bp.route("/estadisticas", methods=["GET"])
+def estadisticas_combustible():
+    params_invalidos = set(request.args.keys()) - set(DIMENSIONES_ESTADISTICAS)
+
+    if params_invalidos:
+        return error(
+            f"Parámetro(s) no reconocido(s): {', '.join(params_invalidos)}. Parámetros válidos: {', '.join(DIMENSIONES_ESTADISTICAS)}",
+            400,
+        )
+
+    try:
+        data = get_estadisticas(
+            provincia=request.args.get("provincia"),
+            combustible=request.args.get("combustible"),
+            empresa=request.args.get("empresa"),
+        )
+    except FileNotFoundError as e:
+        return error(str(e), 503)
+    if data is None:
+        return error("No se encontraron datos para esos filtros", 404)
+
+    return success(data)
+
+
+@combustibles_v1_bp.route("/cercanas", methods=["GET"])
+def combustibles_cercanos():
+    params_invalidos = set(request.args.keys()) - PARAMS_CERCANAS
+
+    if params_invalidos:
+        return error(
+            f"Parámetro(s) no reconocido(s): {', '.join(params_invalidos)}. Parámetros válidos: {', '.join(sorted(PARAMS_CERCANAS))}",
+            400,
+        )
+
+    lat, lon, mensaje = leer_coordenadas(request.args)
+    if mensaje:
+        return error(mensaje, 400)
+
+    try:
+        radio_km = float(request.args.get("radio_km", RADIO_DEFAULT_KM))
+        limite = int(request.args.get("limite", LIMITE_DEFAULT))
+    except ValueError:
+        return error("Los parámetros 'radio_km' y 'limite' deben ser numéricos", 400)
+
+    if not 0 < radio_km <= RADIO_MAX_KM:
+        return error(
+            f"El parámetro 'radio_km' debe estar entre 0 y {RADIO_MAX_KM}", 400
+        )
+    if not 1 <= limite <= LIMITE_MAX:
+        return error(f"El parámetro 'limite' debe estar entre 1 y {LIMITE_MAX}", 400)
+
+    orden = request.args.get("orden", "precio")
+    if orden not in ("precio", "distancia"):
+        return error("El parámetro 'orden' debe ser 'precio' o 'distancia'", 400)
+
+    try:
+        data = get_combustibles_cercanos(
+            lat,
+            lon,
+            radio_km,
+            combustible=request.args.get("combustible"),
+            limite=limite,
+            orden=orden,
+        )
+    except FileNotFoundError as e:
+        return error(str(e), 503)
+    if data is None:
+        return error("No hay datos de estaciones en esa zona", 404)
+    if not data:
+        return error("No se encontraron estaciones en ese radio", 404)
+
+    return success(data)
+
+
+@combustibles_v1_bp.route("/cambios", methods=["GET"])
+def cambios_combustibles():
+    params_invalidos = set(request.args.keys()) - PARAMS_CAMBIOS
+
+    if params_invalidos:
+        return error(
+            f"Parámetro(s) no reconocido(s): {', '.join(params_invalidos)}. Parámetros válidos: {', '.join(sorted(PARAMS_CAMBIOS))}",
+            400,
+        )
+
+    desde = request.args.get("desde", "")
+    if not FORMATO_FECHA.match(desde):
+        return error(
+            "El parámetro 'desde' es requerido y debe tener formato YYYY-MM-DD (ej: 2026-08-01)",
+            400,
+        )
+
+    try:
+        data = get_cambios(
+            desde,
+            provincia=request.args.get("provincia"),
+            empresa=request.args.get("empresa"),
+            combustible=request.args.get("combustible"),
+        )
+    except FileNotFoundError as e:
+        return error(str(e), 503)
+
+    return success(data)
@@ -6,10 +6,14 @@ from api.services.data_loader import (
     get_icl_history,
     get_icl_range,
     get_icl_adelanto,
+    get_dataset_version,
+    get_history_last,
+    get_history_page,
 )
 from api.utils.responses import success, error
+from api.utils.paginacion import PARAMS_PAGINACION, leer_paginacion
 
-PARAMS_VALIDOS = {"desde", "hasta", "historico"}
+PARAMS_VALIDOS = {"desde", "hasta", "historico"} | PARAMS_PAGINACION
 FORMATO_FECHA = re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$")
 
 icl_v1_bp = Blueprint("icl_v1", __name__, url_prefix="/v1/icl")
@@ -43,6 +47,16 @@ def obtener_icl():
             400,
         )
 
+    limit, cursor, ultimos, err = leer_paginacion(request.args, validar_fecha)
+    if err:
+        return err
+
+    if ultimos is not None:
+        data = get_history_last("icl", ultimos)
+        if not data:
+            return error("No hay historial de ICL disponible", 404)
+        return success(data, version=get_dataset_version("icl"))
+
     desde = request.args.get("desde")
     hasta = request.args.get("hasta")
     historico = request.args.get("historico", "").lower()
@@ -53,10 +67,18 @@ def obtener_icl():
                 "El parámetro 'historico' solo acepta el valor 'true' (ej: ?historico=true)",
                 400,
             )
+        if limit is not None:
+            data, siguiente = get_history_page("icl", limit, cursor)
+            return success(
+                data,
+                version=get_dataset_version("icl"),
+                paginacion={"limit": limit, "siguiente_cursor": siguiente},
+            )
+
         data = get_icl_history()
         if not data:
             return error("No hay historial de ICL disponible", 404)
-        return success(data)
+        return success(data, version=get_dataset_version("icl"))
 
     if "desde" in params_recibidos or "hasta" in params_recibidos:
         if not desde or not hasta:
@@ -69,10 +91,18 @@ def obtener_icl():
         if err:
             return err
 
+        if limit is not None:
+            data, siguiente = get_history_page("icl", limit, cursor, desde, hasta)
+            return success(
+                data,
+                version=get_dataset_version("icl"),
+                paginacion={"limit": limit, "siguiente_cursor": siguiente},
+            )
+
         data = get_icl_range(desde, hasta)
         if data is None:
             return error("No hay datos para el rango solicitado", 404)
-        return success(data)
+        return success(data, version=get_dataset_version("icl"))
 
     data = get_icl()
     if not data:
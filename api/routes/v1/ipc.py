@@ -1,10 +1,18 @@
 # api/routes/v1/ipc.py
 import re
 from flask import Blueprint, request
-from api.services.data_loader import get_ipc, get_ipc_history, get_ipc_range
+from api.services.data_loader import (
+    get_ipc,
+    get_ipc_history,
+    get_ipc_range,
+    get_dataset_version,
+    get_history_last,
+    get_history_page,
+)
 from api.utils.responses import success, error
+from api.utils.paginacion import PARAMS_PAGINACION, leer_paginacion
 
-PARAMS_VALIDOS = {"desde", "hasta", "historico"}
+PARAMS_VALIDOS = {"desde", "hasta", "historico"} | PARAMS_PAGINACION
 FORMATO_FECHA = re.compile(r"^\d{4}-(0[1-9]|1[0-2])$")
 
 ipc_v1_bp = Blueprint("ipc_v1", __name__, url_prefix="/v1/ipc")
@@ -29,6 +37,16 @@ def obtener_ipc():
             400,
         )
 
+    limit, cursor, ultimos, err = leer_paginacion(request.args, validar_fecha)
+    if err:
+        return err
+
+    if ultimos is not None:
+        data = get_history_last("ipc", ultimos)
+        if not data:
+            return error("No hay histórico de IPC disponible", 404)
+        return success(data, version=get_dataset_version("ipc"))
+
     desde = request.args.get("desde")
     hasta = request.args.get("hasta")
     historico = request.args.get("historico", "").lower()
@@ -39,10 +57,18 @@ def obtener_ipc():
                 "El parámetro 'historico' solo acepta el valor 'true' (ej: ?historico=true)",
                 400,
             )
+        if limit is not None:
+            data, siguiente = get_history_page("ipc", limit, cursor)
+            return success(
+                data,
+                version=get_dataset_version("ipc"),
+                paginacion={"limit": limit, "siguiente_cursor": siguiente},
+            )
+
         data = get_ipc_history()
         if not data:
             return error("No hay histórico de IPC disponible", 404)
-        return success(data)
+        return success(data, version=get_dataset_version("ipc"))
 
     if "desde" in params_recibidos or "hasta" in params_recibidos:
         if not desde or not hasta:
@@ -55,10 +81,18 @@ def obtener_ipc():
         if err:
             return err
 
+        if limit is not None:
+            data, siguiente = get_history_page("ipc", limit, cursor, desde, hasta)
+            return success(
+                data,
+                version=get_dataset_version("ipc"),
+                paginacion={"limit": limit, "siguiente_cursor": siguiente},
+            )
+
         data = get_ipc_range(desde, hasta)
         if data is None:
             return error("No hay datos para el rango solicitado", 404)
-        return success(data)
+        return success(data, version=get_dataset_version("ipc"))
 
     data = get_ipc()
     if not data:
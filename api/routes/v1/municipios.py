@@ -0,0 +1,149 @@
+# api/routes/v1/municipios.py
+from flask import Blueprint, request
+from api.services.provincias_service import (
+    buscar_lugares,
+    get_municipio,
+    get_municipios_cercanos,
+    get_version,
+)
+from api.utils.geo import leer_coordenadas
+from api.utils.responses import success, error
+
+PARAMS_CERCANO = {"lat", "lon", "limite"}
+PARAMS_BUSCAR = {"q", "limite"}
+LIMITE_DEFAULT = 1
+LIMITE_MAX = 20
+LIMITE_BUSQUEDA_DEFAULT = 10
+LIMITE_BUSQUEDA_MAX = 50
+# Consulta por lote (POST): puntos por request y municipios en total
+# (puntos × limite), para que la respuesta no pase el límite de Lambda
+LOTE_MAX = 500
+LOTE_RESULTADOS_MAX = 2000
+
+municipios_v1_bp = Blueprint("municipios_v1", __name__, url_prefix="/v1/municipios")
+
+
+def leer_limite(valor, default=LIMITE_DEFAULT, maximo=LIMITE_MAX):
+    """(limite, mensaje de error o None)."""
+    try:
+        limite = int(valor if valor is not None else default)
+    except (TypeError, ValueError):
+        return None, "El parámetro 'limite' debe ser numérico"
+
+    if not 1 <= limite <= maximo:
+        return None, f"El parámetro 'limite' debe estar entre 1 y {maximo}"
+    return limite, None
+
+
+@municipios_v1_bp.route("/buscar", methods=["GET"])
+def buscar_municipios():
+    params_invalidos = set(request.args.keys()) - PARAMS_BUSCAR
+
+    if params_invalidos:
+        return error(
+            f"Parámetro(s) no reconocido(s): {', '.join(params_invalidos)}. Parámetros válidos: {', '.join(sorted(PARAMS_BUSCAR))}",
+            400,
+        )
+
+    texto = request.args.get("q", "").strip()
+    if not texto:
+        return error("El parámetro 'q' es requerido", 400)
+
+    limite, mensaje = leer_limite(
+        request.args.get("limite"), LIMITE_BUSQUEDA_DEFAULT, LIMITE_BUSQUEDA_MAX
+    )
+    if mensaje:
+        return error(mensaje, 400)
+
+    try:
+        return success(buscar_lugares(texto, limite))
+    except FileNotFoundError as e:
+        return error(str(e), 503)
+
+
+@municipios_v1_bp.route("/cercano", methods=["GET"])
+def municipio_cercano():
+    params_invalidos = set(request.args.keys()) - PARAMS_CERCANO
+
+    if params_invalidos:
+        return error(
+            f"Parámetro(s) no reconocido(s): {', '.join(params_invalidos)}. Parámetros válidos: {', '.join(sorted(PARAMS_CERCANO))}",
+            400,
+        )
+
+    lat, lon, mensaje = leer_coordenadas(request.args)
+    if mensaje:
+        return error(mensaje, 400)
+
+    limite, mensaje = leer_limite(request.args.get("limite"))
+    if mensaje:
+        return error(mensaje, 400)
+
+    try:
+        return success(get_municipios_cercanos(lat, lon, limite))
+    except FileNotFoundError as e:
+        return error(str(e), 503)
+
+
+@municipios_v1_bp.route("/cercano", methods=["POST"])
+def municipios_cercanos_lote():
+    """
+    Body: {"puntos": [{"lat": ..., "lon": ...}, ...], "limite": n}. Devuelve
+    una entrada por punto, en el mismo orden, con los municipios resumidos
+    (id, nombre, provincia y distancia_km).
+    """
+    body = request.get_json(silent=True)
+    puntos = body.get("puntos") if isinstance(body, dict) else None
+
+    if not isinstance(puntos, list) or not puntos:
+        return error(
+            "El body debe ser JSON con una lista 'puntos' de objetos {lat, lon}", 400
+        )
+    if len(puntos) > LOTE_MAX:
+        return error(f"Se aceptan hasta {LOTE_MAX} puntos por request", 400)
+
+    limite, mensaje = leer_limite(body.get("limite"))
+    if mensaje:
+        return error(mensaje, 400)
+    if len(puntos) * limite > LOTE_RESULTADOS_MAX:
+        return error(
+            f"Se aceptan hasta {LOTE_RESULTADOS_MAX} resultados por request (puntos × limite)",
+            400,
+        )
+
+    coordenadas = []
+    for n, punto in enumerate(puntos):
+        if not isinstance(punto, dict):
+            return error(f"Punto {n}: debe ser un objeto {{lat, lon}}", 400)
+        lat, lon, mensaje = leer_coordenadas(punto)
+        if mensaje:
+            return error(f"Punto {n}: {mensaje}", 400)
+        coordenadas.append((lat, lon))
+
+    try:
+        data = [
+            {
+                "lat": lat,
+                "lon": lon,
+                "municipios": get_municipios_cercanos(
+                    lat, lon, limite, resumido=True
+                ),
+            }
+            for lat, lon in coordenadas
+        ]
+    except FileNotFoundError as e:
+        return error(str(e), 503)
+
+    return success(data)
+
+
+@municipios_v1_bp.route("/<id_municipio>", methods=["GET"])
+def obtener_municipio(id_municipio):
+    try:
+        data = get_municipio(id_municipio)
+    except FileNotFoundError as e:
+        return error(str(e), 503)
+
+    if data is None:
+        return error("Municipio no encontrado", 404)
+    return success(data, version=get_version())
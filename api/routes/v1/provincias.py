@@ -1,14 +1,52 @@
 # api/routes/v1/provincias.py
 from flask import Blueprint
 from api.services.data_loader import get_provincias
-from api.utils.responses import success, error
+from api.services.provincias_service import (
+    get_municipios_de_provincia,
+    get_provincia,
+    get_version,
+)
+from api.utils.responses import success, success_stream, error
 
 provincias_v1_bp = Blueprint("provincias_v1", __name__, url_prefix="/v1/provincias")
 
 
+def _version_cacheable(provincia: str, id_provincia: str):
+    """
+    Solo se cachea la respuesta pedida por ID: los nombres admiten infinitas
+    variantes (mayúsculas, tildes) que llenarían la caché con copias.
+    """
+    return get_version() if provincia == id_provincia else None
+
+
 @provincias_v1_bp.route("/", methods=["GET"])
 def obtener_provincias():
     data = get_provincias()
     if not data:
         return error("No hay datos geográficos disponibles", 404)
-    return success(data)
+    return success_stream(data)
+
+
+@provincias_v1_bp.route("/<provincia>", methods=["GET"])
+def obtener_provincia(provincia):
+    try:
+        data = get_provincia(provincia)
+    except FileNotFoundError as e:
+        return error(str(e), 503)
+
+    if data is None:
+        return error("Provincia no encontrada", 404)
+    return success(data, version=_version_cacheable(provincia, data["id"]))
+
+
+@provincias_v1_bp.route("/<provincia>/municipios", methods=["GET"])
+def obtener_municipios_de_provincia(provincia):
+    try:
+        data = get_municipios_de_provincia(provincia)
+    except FileNotFoundError as e:
+        return error(str(e), 503)
+
+    if data is None:
+        return error("Provincia no encontrada", 404)
+    id_provincia = get_provincia(provincia)["id"]
+    return success(data, version=_version_cacheable(provincia, id_provincia))
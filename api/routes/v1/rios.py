@@ -1,9 +1,13 @@
 # api/routes/v1/rios.py
 from flask import Blueprint, request
-from api.services.data_loader import get_rios, get_rio_by_nombre
+from api.services.data_loader import get_rios, get_rio_by_nombre, get_puerto_by_nombre
+from api.services.rios_service import get_historico_puerto, get_resumen_diario_rio
+from api.utils.fechas import validar_rango
 from api.utils.responses import success, error
 
-PARAMS_VALIDOS = {"nombre"}
+PARAMS_VALIDOS = {"nombre", "puerto"}
+PARAMS_HISTORICO = {"puerto", "desde", "hasta"}
+PARAMS_RESUMEN = {"rio", "desde", "hasta"}
 
 rios_v1_bp = Blueprint("rios_v1", __name__, url_prefix="/v1/rios")
 
@@ -20,6 +24,16 @@ def obtener_rios():
         )
 
     nombre = request.args.get("nombre")
+    puerto = request.args.get("puerto")
+
+    if nombre and puerto:
+        return error("Use 'nombre' o 'puerto', no ambos", 400)
+
+    if puerto:
+        data = get_puerto_by_nombre(puerto)
+        if not data:
+            return error("Puerto no encontrado", 404)
+        return success(data)
 
     if nombre:
         data = get_rio_by_nombre(nombre)
@@ -31,3 +45,51 @@ def obtener_rios():
     if not data:
         return error("No hay datos de ríos disponibles", 404)
     return success(data)
+
+
+@rios_v1_bp.route("/historico", methods=["GET"])
+def obtener_historico_puerto():
+    err = validar_rango(PARAMS_HISTORICO)
+    if err:
+        return err
+
+    puerto = request.args.get("puerto")
+    if not puerto:
+        return error("El parámetro 'puerto' es requerido", 400)
+
+    try:
+        data = get_historico_puerto(
+            puerto, request.args.get("desde"), request.args.get("hasta")
+        )
+    except ValueError as e:
+        return error(str(e), 400)
+    except FileNotFoundError as e:
+        return error(str(e), 503)
+
+    if data is None:
+        return error("Puerto no encontrado", 404)
+    return success(data)
+
+
+@rios_v1_bp.route("/historico/resumen", methods=["GET"])
+def obtener_resumen_diario():
+    err = validar_rango(PARAMS_RESUMEN)
+    if err:
+        return err
+
+    rio = request.args.get("rio")
+    if not rio:
+        return error("El parámetro 'rio' es requerido", 400)
+
+    try:
+        data = get_resumen_diario_rio(
+            rio, request.args.get("desde"), request.args.get("hasta")
+        )
+    except ValueError as e:
+        return error(str(e), 400)
+    except FileNotFoundError as e:
+        return error(str(e), 503)
+
+    if data is None:
+        return error("Río no encontrado", 404)
+    return success(data)
@@ -1,9 +1,16 @@
 # api/routes/v1/rios_comahue.py
 from flask import Blueprint, request
-from api.services.rios_comahue_service import get_rios_comahue
+from api.services.rios_comahue_service import (
+    get_historico_estacion,
+    get_resumen_comahue,
+    get_rios_comahue,
+)
+from api.utils.fechas import validar_rango
 from api.utils.responses import success, error
 
 PARAMS_VALIDOS = {"rio"}
+PARAMS_HISTORICO = {"estacion", "desde", "hasta"}
+PARAMS_RESUMEN = {"rio", "desde", "hasta"}
 
 rios_comahue_v1_bp = Blueprint(
     "rios_comahue_v1", __name__, url_prefix="/v1/rios-comahue"
@@ -32,4 +39,50 @@ def obtener_rios_comahue():
     except FileNotFoundError as e:
         return error(str(e), 503)
     except Exception as e:
-        return error(f"Error interno: {e}", 500)
\ No newline at end of file
+        return error(f"Error interno: {e}", 500)
+
+
+@rios_comahue_v1_bp.route("/historico", methods=["GET"])
+def obtener_historico_estacion():
+    err = validar_rango(PARAMS_HISTORICO)
+    if err:
+        return err
+
+    estacion = request.args.get("estacion")
+    if not estacion:
+        return error("El parámetro 'estacion' (ID o nombre) es requerido", 400)
+
+    try:
+        data = get_historico_estacion(
+            estacion, request.args.get("desde"), request.args.get("hasta")
+        )
+    except ValueError as e:
+        return error(str(e), 400)
+    except FileNotFoundError as e:
+        return error(str(e), 503)
+
+    if data is None:
+        return error("Estación no encontrada", 404)
+    return success(data)
+
+
+@rios_comahue_v1_bp.route("/historico/resumen", methods=["GET"])
+def obtener_resumen_comahue():
+    err = validar_rango(PARAMS_RESUMEN)
+    if err:
+        return err
+
+    rio = request.args.get("rio")
+    if not rio:
+        return error("El parámetro 'rio' es requerido", 400)
+
+    try:
+        data = get_resumen_comahue(
+            rio, request.args.get("desde"), request.args.get("hasta")
+        )
+    except ValueError as e:
+        return error(str(e), 400)
+    except FileNotFoundError as e:
+        return error(str(e), 503)
+
+    return success(data)
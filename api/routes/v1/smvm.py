@@ -2,9 +2,17 @@
 import re
 from flask import Blueprint, request
 from api.utils.responses import success, error
-from api.services.data_loader import get_smvm, get_smvm_history, get_smvm_range
+from api.utils.paginacion import PARAMS_PAGINACION, leer_paginacion
+from api.services.data_loader import (
+    get_smvm,
+    get_smvm_history,
+    get_smvm_range,
+    get_dataset_version,
+    get_history_last,
+    get_history_page,
+)
 
-PARAMS_VALIDOS = {"desde", "hasta", "historico"}
+PARAMS_VALIDOS = {"desde", "hasta", "historico"} | PARAMS_PAGINACION
 FORMATO_FECHA = re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$")
 
 smvm_v1_bp = Blueprint("smvm_v1", __name__, url_prefix="/v1/smvm")
@@ -30,6 +38,16 @@ def obtener_smvm():
             400,
         )
 
+    limit, cursor, ultimos, err = leer_paginacion(request.args, validar_fecha)
+    if err:
+        return err
+
+    if ultimos is not None:
+        data = get_history_last("smvm", ultimos)
+        if not data:
+            return error("No hay histórico de SMVM disponible", 404)
+        return success(data, version=get_dataset_version("smvm"))
+
     desde = request.args.get("desde")
     hasta = request.args.get("hasta")
     historico = request.args.get("historico", "").lower()
@@ -40,10 +58,18 @@ def obtener_smvm():
                 "El parámetro 'historico' solo acepta el valor 'true' (ej: ?historico=true)",
                 400,
             )
+        if limit is not None:
+            data, siguiente = get_history_page("smvm", limit, cursor)
+            return success(
+                data,
+                version=get_dataset_version("smvm"),
+                paginacion={"limit": limit, "siguiente_cursor": siguiente},
+            )
+
         data = get_smvm_history()
         if not data:
             return error("No hay histórico de SMVM disponible", 404)
-        return success(data)
+        return success(data, version=get_dataset_version("smvm"))
 
     if "desde" in params_recibidos or "hasta" in params_recibidos:
         if not desde or not hasta:
@@ -56,10 +82,18 @@ def obtener_smvm():
         if err:
             return err
 
+        if limit is not None:
+            data, siguiente = get_history_page("smvm", limit, cursor, desde, hasta)
+            return success(
+                data,
+                version=get_dataset_version("smvm"),
+                paginacion={"limit": limit, "siguiente_cursor": siguiente},
+            )
+
         data = get_smvm_range(desde, hasta)
         if not data:
             return error("No hay datos en el rango especificado", 404)
-        return success(data)
+        return success(data, version=get_dataset_version("smvm"))
 
     try:
         data = get_smvm()
@@ -1,10 +1,18 @@
 # api/routes/v1/uva.py
 import re
 from flask import Blueprint, request
-from api.services.data_loader import get_uva, get_uva_history, get_uva_range
+from api.services.data_loader import (
+    get_uva,
+    get_uva_history,
+    get_uva_range,
+    get_dataset_version,
+    get_history_last,
+    get_history_page,
+)
 from api.utils.responses import success, error
+from api.utils.paginacion import PARAMS_PAGINACION, leer_paginacion
 
-PARAMS_VALIDOS = {"desde", "hasta", "historico"}
+PARAMS_VALIDOS = {"desde", "hasta", "historico"} | PARAMS_PAGINACION
 FORMATO_FECHA = re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$")
 
 uva_v1_bp = Blueprint("uva_v1", __name__, url_prefix="/v1/uva")
@@ -30,6 +38,16 @@ def obtener_uva():
             400,
         )
 
+    limit, cursor, ultimos, err = leer_paginacion(request.args, validar_fecha)
+    if err:
+        return err
+
+    if ultimos is not None:
+        data = get_history_last("uva", ultimos)
+        if not data:
+            return error("No hay historial de UVA disponible", 404)
+        return success(data, version=get_dataset_version("uva"))
+
     desde = request.args.get("desde")
     hasta = request.args.get("hasta")
     historico = request.args.get("historico", "").lower()
@@ -40,10 +58,18 @@ def obtener_uva():
                 "El parámetro 'historico' solo acepta el valor 'true' (ej: ?historico=true)",
                 400,
             )
+        if limit is not None:
+            data, siguiente = get_history_page("uva", limit, cursor)
+            return success(
+                data,
+                version=get_dataset_version("uva"),
+                paginacion={"limit": limit, "siguiente_cursor": siguiente},
+            )
+
         data = get_uva_history()
         if not data:
             return error("No hay historial de UVA disponible", 404)
-        return success(data)
+        return success(data, version=get_dataset_version("uva"))
 
     if "desde" in params_recibidos or "hasta" in params_recibidos:
         if not desde or not hasta:
@@ -56,10 +82,18 @@ def obtener_uva():
         if err:
             return err
 
+        if limit is not None:
+            data, siguiente = get_history_page("uva", limit, cursor, desde, hasta)
+            return success(
+                data,
+                version=get_dataset_version("uva"),
+                paginacion={"limit": limit, "siguiente_cursor": siguiente},
+            )
+
         data = get_uva_range(desde, hasta)
         if data is None:
             return error("No hay datos para el rango solicitado", 404)
-        return success(data)
+        return success(data, version=get_dataset_version("uva"))
 
     data = get_uva()
     if not data:
@@ -0,0 +1,87 @@
+"""
+Bundle precompilado de datasets para la imagen de Lambda.
+
+En el build de la imagen se cargan todos los datasets que sirve la API (JSON
+ya parseados y series indexadas) y se serializan en un único archivo. En
+Lambda ese archivo se carga durante el INIT, así que data/ no viaja en la
+imagen y el primer request no paga el parseo.
+
+    python -m api.services.bundle [build/datos.bundle]
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from api.services import (
+    combustibles_service,
+    data_loader,
+    provincias_service,
+    rios_comahue_service,
+    rios_service,
+)
+from api.services.dataset_registry import ROOT_PATH, registry
+from api.services.diputados_service import get_diputados
+from api.services.personas_service import get_resumen
+from api.services.timeseries import SERIES
+
+BUNDLE_PATH = Path(os.getenv("ARGLY_BUNDLE_PATH", ROOT_PATH / "build" / "datos.bundle"))
+
+# Funciones que, al llamarlas, cargan en el registry todo lo que lee la API
+_PRECARGA = [
+    combustibles_service.get_indice,
+    combustibles_service.get_estadisticas_tabla,
+    combustibles_service.get_historico_indice,
+    combustibles_service.get_cercania,
+    combustibles_service.get_cambios,
+    data_loader.get_icl,
+    data_loader.get_ipc,
+    data_loader.get_uvi,
+    data_loader.get_uva,
+    data_loader.get_cer,
+    data_loader.get_rios,
+    data_loader.get_indice_rios,
+    rios_service.get_historico_indice,
+    data_loader.get_construccion,
+    data_loader.get_provincias,
+    provincias_service.get_indice,
+    data_loader.get_canasta,
+    data_loader.get_smvm,
+    data_loader.get_icl_adelanto,
+    get_resumen,
+    get_diputados,
+    rios_comahue_service.get_rios_comahue,
+    rios_comahue_service.get_historico_indice,
+]
+
+
+def precargar():
+    for serie in SERIES.values():
+        serie.index()
+
+    for cargar in _PRECARGA:
+        try:
+            cargar()
+        except FileNotFoundError:
+            continue
+
+
+def build(out_path: Path = BUNDLE_PATH):
+    registry.clear()
+    precargar()
+    registry.dump_bundle(out_path)
+    print(f"📦 Bundle generado en {out_path} ({out_path.stat().st_size} bytes)")
+
+
+def load(path: Path = BUNDLE_PATH) -> bool:
+    """Carga el bundle si existe y deja todo listo en el registry."""
+    if not path.exists():
+        return False
+
+    registry.load_bundle(path)
+    precargar()
+    return True
+
+
+if __name__ == "__main__":
+    build(Path(sys.argv[1]) if len(sys.argv) > 1 else BUNDLE_PATH)
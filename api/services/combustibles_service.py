@@ -0,0 +1,823 @@
+# api/services/combustibles_service.py
+import hashlib
+import logging
+import sys
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from pathlib import Path
+
+from api.services.dataset_registry import (
+    archivos_snapshot,
+    leer_snapshots,
+    read_json,
+    registry,
+)
+from api.services.timeseries import formatear_ordinal, ordinal_fecha
+from api.utils.geo import GrillaEspacial
+from api.utils.normalizacion import normalizar
+from api.utils.numeros import a_float, a_json
+
+DATA_PATH = Path(__file__).resolve().parents[2] / "data" / "combustibles"
+LATEST_PATH = DATA_PATH / "latest.json"
+PROVINCIAS_PATH = DATA_PATH.parent / "provincias" / "latest.json"
+CAMBIOS_PATH = DATA_PATH / "cambios"
+
+logger = logging.getLogger(__name__)
+
+# Campos de texto de cada estación, en el orden en que aparecen en el JSON
+CAMPO_ID = "id_estacion"
+CAMPOS_ESTACION = ("provincia", "empresa", "localidad", "direccion")
+CAMPOS_TEXTO = (CAMPO_ID,) + CAMPOS_ESTACION + ("combustible",)
+CAMPO_VIGENCIA = "vigencia"
+
+# Franjas horarias de `precios`
+FRANJAS = ("día", "noche")
+
+# Campos por los que se puede filtrar (parámetro de query == campo del registro)
+CAMPOS_FILTRO = ("provincia", "empresa", "combustible", "localidad")
+
+
+def id_estacion(provincia, empresa, localidad, direccion) -> str:
+    """
+    ID estable de una estación (misma fórmula que scrapers/utils.py): hash de
+    la clave del scraper sin el combustible. Se calcula para los snapshots
+    anteriores a que el scraper lo guardara.
+    """
+    clave = "|".join(v or "" for v in (provincia, empresa, localidad, direccion))
+    return hashlib.blake2b(clave.encode("utf-8"), digest_size=6).hexdigest()
+
+
+# -------- REPRESENTACIÓN COMPACTA --------
+
+
+class TablaEstaciones:
+    """
+    Snapshot de combustibles en columnas: cada campo de texto es un array de
+    códigos sobre una tabla de strings internados (`textos`, con None en el
+    código 0) y los precios de cada franja son un array de floats (NaN si la
+    estación no informa esa franja). Ocupa una fracción de la lista de dicts
+    original y se recorre por columnas sin tocar los strings.
+    """
+
+    __slots__ = ("textos", "columnas", "precios")
+
+    def __init__(self, registros: list):
+        self.textos = [None]
+        self.columnas = {
+            campo: array("I") for campo in CAMPOS_TEXTO + (CAMPO_VIGENCIA,)
+        }
+        self.precios = {franja: array("d") for franja in FRANJAS}
+
+        codigos = {None: 0}
+        for registro in registros:
+            for campo, columna in self.columnas.items():
+                valor = registro.get(campo)
+                if valor is None and campo == CAMPO_ID:
+                    valor = id_estacion(*(registro.get(c) for c in CAMPOS_ESTACION))
+                codigo = codigos.get(valor)
+                if codigo is None:
+                    codigo = codigos[valor] = len(self.textos)
+                    self.textos.append(
+                        sys.intern(valor) if isinstance(valor, str) else valor
+                    )
+                columna.append(codigo)
+
+            precios = registro.get("precios") or {}
+            for franja, columna in self.precios.items():
+                columna.append(a_float(precios.get(franja)))
+
+    def __len__(self):
+        return len(self.columnas[CAMPO_VIGENCIA])
+
+    def texto(self, campo: str, i: int):
+        return self.textos[self.columnas[campo][i]]
+
+    def precio(self, franja: str, i: int):
+        """Precio de la franja, o None si la estación no lo informa."""
+        return a_json(self.precios[franja][i])
+
+    def precios_de(self, i: int) -> dict:
+        precios = {}
+        for franja, columna in self.precios.items():
+            precio = a_json(columna[i])
+            if precio is not None:  # sin precio en esa franja
+                precios[franja] = precio
+        return precios
+
+    def registro(self, i: int) -> dict:
+        """La estación i con el mismo formato que en latest.json."""
+        textos, columnas = self.textos, self.columnas
+        registro = {campo: textos[columnas[campo][i]] for campo in CAMPOS_TEXTO}
+        registro["precios"] = self.precios_de(i)
+        registro[CAMPO_VIGENCIA] = textos[columnas[CAMPO_VIGENCIA][i]]
+        return registro
+
+
+# -------- ÍNDICE --------
+
+
+class CombustiblesIndex:
+    """
+    Índice invertido de un snapshot de combustibles: para cada campo de
+    CAMPOS_FILTRO, valor normalizado → posiciones de las estaciones que lo
+    tienen. Se arma una vez por versión de latest.json (ver dataset_registry).
+    """
+
+    def __init__(self, tabla: TablaEstaciones):
+        self.tabla = tabla
+        self.postings = {}
+
+        for campo in CAMPOS_FILTRO:
+            # cada string distinto se normaliza una sola vez
+            normalizados = {}
+            postings = {}
+            for i, codigo in enumerate(tabla.columnas[campo]):
+                valor = normalizados.get(codigo)
+                if valor is None:
+                    valor = normalizados[codigo] = normalizar(
+                        tabla.textos[codigo] or ""
+                    )
+                postings.setdefault(valor, []).append(i)
+
+            # frozenset: el índice se comparte entre requests
+            self.postings[campo] = {
+                valor: frozenset(ids) for valor, ids in postings.items()
+            }
+
+    def ids(self, **filtros) -> list:
+        """
+        Posiciones (en orden original) de las estaciones que cumplen todos los
+        filtros {campo: valor}. Los filtros vacíos se ignoran.
+        """
+        conjuntos = []
+        for campo, valor in filtros.items():
+            if not valor:
+                continue
+            ids = self.postings[campo].get(normalizar(valor))
+            if not ids:
+                return []
+            conjuntos.append(ids)
+
+        if not conjuntos:
+            return list(range(len(self.tabla)))
+
+        # se intersecta desde el conjunto más chico
+        conjuntos.sort(key=len)
+        return sorted(conjuntos[0].intersection(*conjuntos[1:]))
+
+    def buscar(self, **filtros) -> list:
+        return [self.tabla.registro(i) for i in self.ids(**filtros)]
+
+
+def _cargar_indice(path: Path) -> CombustiblesIndex:
+    # se lee sin pasar por el registry: solo queda en memoria la tabla compacta
+    return CombustiblesIndex(TablaEstaciones(read_json(path)))
+
+
+def get_indice() -> CombustiblesIndex:
+    try:
+        return registry.get(LATEST_PATH, _cargar_indice)
+    except FileNotFoundError:
+        raise FileNotFoundError("No existe latest.json para combustibles")
+
+
+def buscar_combustibles(provincia=None, empresa=None, combustible=None, localidad=None):
+    """Estaciones que cumplen todos los filtros pasados (sin tildes ni mayúsculas)."""
+    return get_indice().buscar(
+        provincia=provincia,
+        empresa=empresa,
+        combustible=combustible,
+        localidad=localidad,
+    )
+
+
+def get_combustibles_by_provincia(provincia: str):
+    return buscar_combustibles(provincia=provincia)
+
+
+def get_combustibles_by_empresa(empresa: str):
+    return buscar_combustibles(empresa=empresa)
+
+
+def get_promedio_combustible(provincia: str, combustible: str):
+    indice = get_indice()
+    precios = []
+
+    for i in indice.ids(provincia=provincia, combustible=combustible):
+        for franja in FRANJAS:
+            precio = indice.tabla.precio(franja, i)
+            if precio is not None:
+                precios.append(precio)
+
+    if not precios:
+        return None
+
+    return round(sum(precios) / len(precios), 2)
+
+
+# -------- HISTÓRICO --------
+
+# Filtros del histórico
+CAMPOS_HISTORICO = (CAMPO_ID, "provincia", "empresa", "combustible")
+
+_SIN_PRECIO_HISTORICO = -1
+
+
+def _a_centavos(precio) -> int:
+    """Precio como entero en centavos (punto fijo): no se pierden decimales."""
+    return round(precio * 100)
+
+
+def _delta(valores) -> array:
+    deltas = array("i")
+    previo = 0
+    for valor in valores:
+        deltas.append(valor - previo)
+        previo = valor
+    return deltas
+
+
+class HistorialPrecios:
+    """
+    Precios de cada estación y combustible a lo largo de todos los snapshots
+    de data/combustibles/YYYY-MM-DD.json.
+
+    Cada serie (id_estacion, combustible) guarda las posiciones de los
+    snapshots en los que aparece y los precios de cada franja en centavos,
+    como arrays codificados en deltas (-1 = sin precio en esa franja), así que
+    casi todos los valores son 0 o diferencias chicas.
+    """
+
+    __slots__ = ("fechas", "estaciones", "series", "postings")
+
+    def __init__(self, snapshots):
+        """`snapshots`: iterable de (fecha YYYY-MM-DD, registros) en orden."""
+        self.fechas = []
+        self.estaciones = {}
+        crudas = {}
+
+        for posicion, (fecha, registros) in enumerate(snapshots):
+            self.fechas.append(formatear_ordinal(ordinal_fecha(fecha)))
+            tabla = TablaEstaciones(registros)
+
+            for i in range(len(tabla)):
+                id_ = tabla.texto(CAMPO_ID, i)
+                clave = (id_, tabla.texto("combustible", i))
+                # los datos de la estación quedan como en su último snapshot
+                self.estaciones[id_] = tuple(
+                    tabla.texto(campo, i) for campo in CAMPOS_ESTACION
+                )
+
+                serie = crudas.setdefault(clave, ([], {f: [] for f in FRANJAS}))
+                serie[0].append(posicion)
+                for franja in FRANJAS:
+                    precio = tabla.precio(franja, i)
+                    serie[1][franja].append(
+                        _SIN_PRECIO_HISTORICO if precio is None else _a_centavos(precio)
+                    )
+
+        self.series = {
+            clave: (
+                array("H", _delta(posiciones)),
+                {franja: _delta(valores) for franja, valores in precios.items()},
+            )
+            for clave, (posiciones, precios) in crudas.items()
+        }
+
+        postings = {campo: {} for campo in CAMPOS_HISTORICO}
+        for clave in self.series:
+            id_, combustible = clave
+            provincia, empresa = self.estaciones[id_][:2]
+            postings[CAMPO_ID].setdefault(id_, set()).add(clave)
+            for campo, valor in (
+                ("provincia", provincia),
+                ("empresa", empresa),
+                ("combustible", combustible),
+            ):
+                postings[campo].setdefault(normalizar(valor or ""), set()).add(clave)
+
+        self.postings = {
+            campo: {valor: frozenset(claves) for valor, claves in valores.items()}
+            for campo, valores in postings.items()
+        }
+
+    def claves(self, **filtros) -> list:
+        """Series (id_estacion, combustible) que cumplen todos los filtros."""
+        conjuntos = []
+        for campo, valor in filtros.items():
+            if not valor:
+                continue
+            if campo != CAMPO_ID:
+                valor = normalizar(valor)
+            claves = self.postings[campo].get(valor)
+            if not claves:
+                return []
+            conjuntos.append(claves)
+
+        if not conjuntos:
+            return sorted(self.series)
+
+        conjuntos.sort(key=len)
+        return sorted(conjuntos[0].intersection(*conjuntos[1:]))
+
+    def serie(self, clave: tuple) -> dict:
+        """La serie decodificada, con los datos de la estación."""
+        id_, combustible = clave
+        deltas_posiciones, deltas_precios = self.series[clave]
+
+        posiciones = list(accumulate(deltas_posiciones))
+        precios = {
+            franja: list(accumulate(deltas))
+            for franja, deltas in deltas_precios.items()
+        }
+
+        puntos = []
+        for n, posicion in enumerate(posiciones):
+            punto = {"fecha": self.fechas[posicion]}
+            for franja in FRANJAS:
+                precio = precios[franja][n]
+                if precio != _SIN_PRECIO_HISTORICO:
+                    punto[franja] = a_json(precio / 100)
+            puntos.append(punto)
+
+        return {
+            CAMPO_ID: id_,
+            **dict(zip(CAMPOS_ESTACION, self.estaciones[id_])),
+            "combustible": combustible,
+            "precios": puntos,
+        }
+
+
+def _cargar_historico(path: Path) -> HistorialPrecios:
+    return HistorialPrecios(leer_snapshots(path))
+
+
+def get_historico_indice() -> HistorialPrecios:
+    try:
+        return registry.get(DATA_PATH, _cargar_historico)
+    except FileNotFoundError:
+        raise FileNotFoundError("No hay histórico de combustibles")
+
+
+def get_historico_combustibles(
+    provincia=None, empresa=None, combustible=None, id_estacion=None
+):
+    """Series de precios por estación y combustible que cumplen los filtros."""
+    historial = get_historico_indice()
+    claves = historial.claves(
+        id_estacion=id_estacion,
+        provincia=provincia,
+        empresa=empresa,
+        combustible=combustible,
+    )
+    return [historial.serie(clave) for clave in claves]
+
+
+# -------- CAMBIOS --------
+
+# Filtros de /cambios (mismos nombres que en cada cambio)
+CAMPOS_CAMBIOS = ("provincia", "empresa", "combustible")
+TIPOS_CAMBIO = ("sube", "baja", "cambia", "nueva", "eliminada")
+
+
+def _listar_cambios(path: Path) -> list:
+    """Fechas (YYYY-MM-DD) con archivo de cambios, ordenadas."""
+    return [f.stem for f in archivos_snapshot(path)]
+
+
+def get_cambios(desde=None, provincia=None, empresa=None, combustible=None):
+    """
+    Cambios de precios de los snapshots posteriores a `desde` (YYYY-MM-DD),
+    uno por snapshot, del más viejo al más nuevo. Los archivos de cambios los
+    genera el scraper (scrapers/cambios_combustibles.py) y se leen de a uno.
+    """
+    try:
+        fechas = registry.get(CAMBIOS_PATH, _listar_cambios)
+    except FileNotFoundError:
+        raise FileNotFoundError("No hay cambios de combustibles disponibles")
+
+    filtros = {
+        campo: normalizar(valor)
+        for campo, valor in zip(CAMPOS_CAMBIOS, (provincia, empresa, combustible))
+        if valor
+    }
+
+    resultado = []
+    for fecha in fechas[bisect_right(fechas, desde) if desde else 0 :]:
+        conjunto = registry.get(CAMBIOS_PATH / f"{fecha}.json")
+
+        cambios = [
+            cambio
+            for cambio in conjunto["cambios"]
+            if all(
+                normalizar(cambio.get(campo) or "") == valor
+                for campo, valor in filtros.items()
+            )
+        ]
+
+        resumen = dict.fromkeys(TIPOS_CAMBIO, 0)
+        for cambio in cambios:
+            resumen[cambio["tipo"]] += 1
+
+        resultado.append(
+            {
+                "desde": conjunto["desde"],
+                "hasta": conjunto["hasta"],
+                "resumen": resumen,
+                "cambios": cambios,
+            }
+        )
+
+    return resultado
+
+
+# -------- CERCANÍA --------
+
+# Slugs del scraper que no coinciden con el nombre de data/provincias
+_ALIAS_PROVINCIAS = {
+    "capital federal caba": "ciudad autonoma de buenos aires",
+    "tierra del fuego": "tierra del fuego, antartida e islas del atlantico sur",
+}
+
+# Provincias que son una sola ciudad: si la localidad no coincide con un
+# municipio se usa el centroide de la provincia
+_PROVINCIAS_CIUDAD = {"ciudad autonoma de buenos aires"}
+
+# Abreviaturas habituales en las localidades de combustibles.ar
+_ABREVIATURAS = {
+    "gral.": "general",
+    "sgo.": "santiago",
+    "pto.": "puerto",
+    "cnel.": "coronel",
+    "cmte.": "comandante",
+    "tte.": "teniente",
+    "sta.": "santa",
+    "pte.": "presidente",
+    "dr.": "doctor",
+}
+
+
+# Localidades de combustibles.ar que no son municipios en data/provincias
+# (ciudades dentro de un partido, capitales con otro nombre): se ubican en
+# el centroide del municipio que las contiene
+_ALIAS_LOCALIDADES = {
+    "buenos aires": {
+        "mar del plata": "General Pueyrredón",
+        "san justo": "La Matanza",
+        "villa luzuriaga": "La Matanza",
+        "laferrere": "La Matanza",
+        "gregorio de la ferrere": "La Matanza",
+        "g. laferrere": "La Matanza",
+        "lomas del mirador": "La Matanza",
+        "isidro casanova": "La Matanza",
+        "tapiales": "La Matanza",
+        "tablada": "La Matanza",
+        "san martin": "General San Martín",
+        "villa ballester": "General San Martín",
+        "jose leon suarez": "General San Martín",
+        "ciudadela": "Tres de Febrero",
+        "caseros": "Tres de Febrero",
+        "loma hermosa": "Tres de Febrero",
+        "temperley": "Lomas de Zamora",
+        "banfield": "Lomas de Zamora",
+        "llavallol": "Lomas de Zamora",
+        "turdera": "Lomas de Zamora",
+        "villa albertina": "Lomas de Zamora",
+        "monte grande": "Esteban Echeverría",
+        "e. echeverria": "Esteban Echeverría",
+        "9 de abril": "Esteban Echeverría",
+        "burzaco": "Almirante Brown",
+        "adrogue": "Almirante Brown",
+        "tristan suarez": "Ezeiza",
+        "olivos": "Vicente López",
+        "florida": "Vicente López",
+        "munro": "Vicente López",
+        "martinez": "San Isidro",
+        "acassuso": "San Isidro",
+        "beccar": "San Isidro",
+        "boulogne": "San Isidro",
+        "victoria": "San Fernando",
+        "benavidez": "Tigre",
+        "general pacheco": "Tigre",
+        "el talar": "Tigre",
+        "el talar de pacheco": "Tigre",
+        "don torcuato": "Tigre",
+        "garin": "Escobar",
+        "ing. maschwitz": "Escobar",
+        "tortuguitas": "Malvinas Argentinas",
+        "grand bourg": "Malvinas Argentinas",
+        "pablo noghes": "Malvinas Argentinas",
+        "derqui": "Pilar",
+        "bella vista": "San Miguel",
+        "castelar": "Morón",
+        "haedo": "Morón",
+        "villa sarmiento": "Morón",
+        "villa tesei": "Hurlingham",
+        "paso del rey": "Moreno",
+        "san antonio de padua": "Merlo",
+        "libertad": "Merlo",
+        "bernal": "Quilmes",
+        "ezpeleta": "Quilmes",
+        "bosques": "Florencio Varela",
+        "wilde": "Avellaneda",
+        "sarandi": "Avellaneda",
+        "valentin alsina": "Lanús",
+        "villa elisa": "La Plata",
+        "city bell": "La Plata",
+        "manuel b. gonnet": "La Plata",
+        "abasto": "La Plata",
+        "lisandro olmos": "La Plata",
+        "jauregui": "Luján",
+        "coronel brandsen": "Brandsen",
+        "san miguel del monte": "Monte",
+        "mar del tuyu": "La Costa",
+        "valeria del mar": "Pinamar",
+        "carmen de patagones": "Patagones",
+        "stroeder": "Patagones",
+        "villalonga": "Patagones",
+        "mayor buratovich": "Villarino",
+        "pedro luro": "Villarino",
+        "adolfo gonzalez chavez": "Adolfo Gonzales Chaves",
+        "ameghino": "Florentino Ameghino",
+        "torquinst": "Tornquist",
+    },
+    "catamarca": {
+        "catamarca": "San Fernando del Valle de Catamarca",
+        "san fernando del valle": "San Fernando del Valle de Catamarca",
+        "s.f.v. de catamarca": "San Fernando del Valle de Catamarca",
+        "sumalao": "Valle Viejo",
+    },
+    "chaco": {"saenz pena": "Presidencia Roque Sáenz Peña"},
+    "chubut": {"colonia sarmiento": "Sarmiento"},
+    "cordoba": {
+        "arguello": "Córdoba",
+        "totoral": "Villa del Totoral",
+        "dalmacio velez sarsfield": "Dalmacio Vélez",
+    },
+    "mendoza": {"lujan": "Luján de Cuyo"},
+    "misiones": {
+        "jardin de america": "Jardín América",
+        "l.n. alem": "Leandro N. Alem",
+        "colonia andresito": "Comandante Andresito",
+    },
+    "rio negro": {"barda del medio": "Contralmirante Cordero"},
+    "san juan": {"pocitos": "Pocito"},
+    "santa fe": {"humbolt": "Humboldt", "hugues": "Hughes"},
+}
+
+# Provincias sin municipios en data/provincias: ubicación de sus ciudades
+# principales (lat, lon, nombre)
+_LUGARES_SIN_MUNICIPIO = {
+    ("santiago del estero", "santiago del estero"): (
+        -27.7951,
+        -64.2615,
+        "Santiago del Estero",
+    ),
+    ("santiago del estero", "la banda"): (-27.7341, -64.2429, "La Banda"),
+}
+
+
+def _clave_lugar(texto) -> str:
+    palabras = normalizar(texto or "").split()
+    return " ".join(_ABREVIATURAS.get(p, p) for p in palabras)
+
+
+class CercaniaEstaciones:
+    """
+    Ubicación aproximada de cada estación: su localidad se cruza con los
+    municipios de data/provincias (por nombre del municipio, de la localidad
+    de su centroide o por _ALIAS_LOCALIDADES). Las estaciones de una misma localidad comparten punto y
+    los puntos se indexan en una GrillaEspacial. Las que no se pueden ubicar
+    quedan fuera de /cercanas y se cuentan en `sin_ubicacion`. Guarda el
+    índice con el que se armó: las posiciones de la grilla solo valen en él.
+    """
+
+    def __init__(self, indice: CombustiblesIndex, provincias: list):
+        self.indice = indice
+        lugares = dict(_LUGARES_SIN_MUNICIPIO)
+        provincias_por_clave = {}
+
+        for provincia in provincias:
+            clave_provincia = _clave_lugar(provincia.get("nombre"))
+            provincias_por_clave[clave_provincia] = provincia
+
+            for municipio in provincia.get("municipios") or []:
+                centroide = municipio.get("centroide") or {}
+                if centroide.get("lat") is None or centroide.get("lon") is None:
+                    continue
+                lugar = (centroide["lat"], centroide["lon"], municipio.get("nombre"))
+                for nombre in (municipio.get("nombre"), centroide.get("localidad")):
+                    if nombre:
+                        lugares.setdefault(
+                            (clave_provincia, _clave_lugar(nombre)), lugar
+                        )
+
+        tabla = indice.tabla
+        puntos = {}
+        self.sin_ubicacion = 0
+
+        for i in range(len(tabla)):
+            clave_provincia = _clave_lugar(tabla.texto("provincia", i))
+            clave_provincia = _ALIAS_PROVINCIAS.get(clave_provincia, clave_provincia)
+            clave_localidad = _clave_lugar(tabla.texto("localidad", i))
+            lugar = lugares.get((clave_provincia, clave_localidad))
+
+            if lugar is None:
+                alias = _ALIAS_LOCALIDADES.get(clave_provincia, {}).get(clave_localidad)
+                if alias:
+                    lugar = lugares.get((clave_provincia, _clave_lugar(alias)))
+
+            if lugar is None and clave_provincia in _PROVINCIAS_CIUDAD:
+                provincia = provincias_por_clave.get(clave_provincia) or {}
+                centroide = provincia.get("centroide") or {}
+                if centroide.get("lat") is not None:
+                    lugar = (centroide["lat"], centroide["lon"], provincia["nombre"])
+
+            if lugar is None:
+                self.sin_ubicacion += 1
+                continue
+
+            puntos.setdefault(lugar, []).append(i)
+
+        self.grilla = GrillaEspacial(
+            (lat, lon, (municipio, ids))
+            for (lat, lon, municipio), ids in puntos.items()
+        )
+
+        if self.sin_ubicacion:
+            logger.warning(
+                "combustibles: %d de %d estaciones sin ubicación (localidad sin "
+                "municipio en data/provincias), fuera de /cercanas; %d localidades "
+                "en la grilla",
+                self.sin_ubicacion,
+                len(tabla),
+                self.grilla.total,
+            )
+
+
+def _cargar_cercania(path: Path) -> CercaniaEstaciones:
+    return CercaniaEstaciones(
+        registry.get(path, _cargar_indice), registry.get(PROVINCIAS_PATH)
+    )
+
+
+def get_cercania() -> CercaniaEstaciones:
+    try:
+        return registry.get(
+            LATEST_PATH, _cargar_cercania, depende_de=(PROVINCIAS_PATH,)
+        )
+    except FileNotFoundError:
+        raise FileNotFoundError("No hay datos de combustibles o provincias")
+
+
+def get_combustibles_cercanos(
+    lat: float,
+    lon: float,
+    radio_km: float,
+    combustible=None,
+    limite: int = 10,
+    orden: str = "precio",
+):
+    """
+    Estaciones dentro de `radio_km`, ordenadas por precio (y distancia para
+    desempatar) o por distancia. La ubicación es el centroide del municipio.
+    Devuelve None si no hay ninguna estación ubicada en el radio (sin datos
+    para esa zona), a diferencia de [] cuando los filtros no dejan ninguna.
+    """
+    cercania = get_cercania()
+    indice = cercania.indice
+    tabla = indice.tabla
+
+    permitidas = None
+    if combustible:
+        permitidas = indice.postings["combustible"].get(normalizar(combustible))
+        if not permitidas:
+            return []
+
+    lugares = cercania.grilla.cercanos(lat, lon, radio_km)
+    if not lugares:
+        return None
+
+    candidatos = []
+    for distancia, p_lat, p_lon, (municipio, ids) in lugares:
+        for i in ids:
+            if permitidas is not None and i not in permitidas:
+                continue
+            precio = tabla.precio("día", i)
+            if precio is None:
+                precio = tabla.precio("noche", i)
+            if precio is None:
+                continue
+            candidatos.append((precio, distancia, i, p_lat, p_lon, municipio))
+
+    if orden == "distancia":
+        candidatos.sort(key=lambda c: (c[1], c[0]))
+    else:
+        candidatos.sort(key=lambda c: (c[0], c[1]))
+
+    resultado = []
+    for _, distancia, i, p_lat, p_lon, municipio in candidatos[:limite]:
+        registro = tabla.registro(i)
+        registro["distancia_km"] = round(distancia, 2)
+        registro["ubicacion"] = {"lat": p_lat, "lon": p_lon, "municipio": municipio}
+        resultado.append(registro)
+
+    return resultado
+
+
+# -------- ESTADÍSTICAS --------
+
+# Dimensiones de la tabla de estadísticas
+DIMENSIONES_ESTADISTICAS = ("provincia", "combustible", "empresa")
+
+
+def _percentil(ordenados: list, p: float) -> float:
+    """Percentil con interpolación lineal entre los valores más cercanos."""
+    posicion = (len(ordenados) - 1) * p
+    inferior = int(posicion)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    fraccion = posicion - inferior
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * fraccion
+
+
+def _resumen(valores: list):
+    if not valores:
+        return None
+
+    ordenados = sorted(valores)
+    return {
+        "cantidad": len(ordenados),
+        "promedio": round(sum(ordenados) / len(ordenados), 2),
+        "mediana": round(_percentil(ordenados, 0.5), 2),
+        "minimo": a_json(ordenados[0]),
+        "maximo": a_json(ordenados[-1]),
+        "p10": round(_percentil(ordenados, 0.1), 2),
+        "p90": round(_percentil(ordenados, 0.9), 2),
+    }
+
+
+def _cargar_estadisticas(path: Path) -> dict:
+    """
+    Tabla materializada por snapshot: para cada combinación de
+    provincia × combustible × empresa (y cada subconjunto, con None como
+    comodín) guarda el resumen de precios de día y de noche por separado.
+    Las claves están normalizadas; cada fila lleva el nombre original de sus
+    valores (el primero que aparece en el snapshot).
+    """
+    tabla = registry.get(path, _cargar_indice).tabla
+
+    normalizados = [normalizar(texto or "") for texto in tabla.textos]
+    columnas = [tabla.columnas[d] for d in DIMENSIONES_ESTADISTICAS]
+    nombres = [{} for _ in DIMENSIONES_ESTADISTICAS]
+
+    grupos = {}
+    for i in range(len(tabla)):
+        valores = []
+        for columna, nombres_dimension in zip(columnas, nombres):
+            codigo = columna[i]
+            valores.append(normalizados[codigo])
+            nombres_dimension.setdefault(normalizados[codigo], tabla.textos[codigo])
+        precios = [(franja, tabla.precios[franja][i]) for franja in FRANJAS]
+
+        for mascara in range(2 ** len(DIMENSIONES_ESTADISTICAS)):
+            clave = tuple(
+                valor if mascara & (1 << n) else None for n, valor in enumerate(valores)
+            )
+            grupo = grupos.setdefault(
+                clave, {"estaciones": 0, **{f: [] for f in FRANJAS}}
+            )
+            grupo["estaciones"] += 1
+            for franja, precio in precios:
+                if precio == precio:  # NaN: sin precio en esa franja
+                    grupo[franja].append(precio)
+
+    return {
+        clave: {
+            **{
+                d: None if valor is None else nombres[n][valor]
+                for n, (d, valor) in enumerate(zip(DIMENSIONES_ESTADISTICAS, clave))
+            },
+            "estaciones": grupo["estaciones"],
+            "precios": {franja: _resumen(grupo[franja]) for franja in FRANJAS},
+        }
+        for clave, grupo in grupos.items()
+    }
+
+
+def get_estadisticas_tabla() -> dict:
+    try:
+        return registry.get(LATEST_PATH, _cargar_estadisticas)
+    except FileNotFoundError:
+        raise FileNotFoundError("No existe latest.json para combustibles")
+
+
+def get_estadisticas(provincia=None, combustible=None, empresa=None):
+    """
+    Estadísticas de precios del recorte pedido (los filtros omitidos abarcan
+    todos los valores), o None si no hay estaciones que lo cumplan.
+    """
+    filtros = (provincia, combustible, empresa)
+    clave = tuple(normalizar(valor) if valor else None for valor in filtros)
+
+    return get_estadisticas_tabla().get(clave)
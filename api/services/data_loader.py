@@ -1,67 +1,90 @@
-import json
 from pathlib import Path
-import unicodedata
-from datetime import datetime
+
+from api.services.dataset_registry import registry
+from api.services.timeseries import MES, SERIES, TimeSeries, register
+from api.utils.normalizacion import normalizar
 
 BASE_DATA_PATH = Path(__file__).resolve().parents[2] / "data"
 
 
 def _load_latest(category: str):
     path = BASE_DATA_PATH / category / "latest.json"
-    if not path.exists():
+    try:
+        return registry.get(path)
+    except FileNotFoundError:
         raise FileNotFoundError(f"No existe latest.json para {category}")
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-# -------- COMBUSTIBLES --------
-
-
-def get_combustibles():
-    return _load_latest("combustibles")
-
-
-def get_combustibles_by_provincia(provincia: str):
-    provincia = provincia.lower()
-    return [
-        c for c in get_combustibles() if c.get("provincia", "").lower() == provincia
-    ]
-
 
-def get_combustibles_by_empresa(empresa: str):
-    empresa = empresa.lower()
-    return [c for c in get_combustibles() if c.get("empresa", "").lower() == empresa]
 
+# -------- SERIES --------
+
+# Series diarias {fecha, valor} con serie.bin (ver scrapers/utils.py)
+SERIE_EMPAQUETADA = {"value_fields": {"valor": "valor"}, "packed": True}
+
+ICL = register(TimeSeries("icl", BASE_DATA_PATH / "icl", **SERIE_EMPAQUETADA))
+UVI = register(TimeSeries("uvi", BASE_DATA_PATH / "uvi", **SERIE_EMPAQUETADA))
+UVA = register(TimeSeries("uva", BASE_DATA_PATH / "uva", **SERIE_EMPAQUETADA))
+CER = register(TimeSeries("cer", BASE_DATA_PATH / "cer", **SERIE_EMPAQUETADA))
+
+IPC = register(
+    TimeSeries(
+        "ipc",
+        BASE_DATA_PATH / "ipc",
+        date_field=("anio", "mes"),
+        granularity=MES,
+        value_fields={
+            "mes": "mes",
+            "anio": "anio",
+            "nombre_mes": "nombre_mes",
+            "valor": "indice_ipc",
+        },
+        required=("indice_ipc", "mes"),
+    )
+)
+
+SMVM = register(
+    TimeSeries(
+        "smvm",
+        BASE_DATA_PATH / "smvm",
+        date_field="vigente_desde",
+        value_fields={
+            "smvm": "smvm",
+            "smvm_dia": "smvm_dia",
+            "smvm_hora": "smvm_hora",
+            "fuente": "fuente",
+        },
+    )
+)
+
+# Canasta: cada archivo es el período completo, se devuelve tal cual
+CANASTA = register(
+    TimeSeries(
+        "canasta", BASE_DATA_PATH / "canasta", date_field="periodo", granularity=MES
+    )
+)
+
+
+def get_dataset_version(category: str):
+    """
+    Firma (mtime + tamaño) de los datos detrás del histórico de una categoría,
+    para invalidar cachés de respuestas. None si la categoría no existe.
+    """
+    return SERIES[category].version()
 
-def _normalize(text: str) -> str:
-    text = text.lower().strip()
-    text = unicodedata.normalize("NFD", text)
-    text = "".join(c for c in text if unicodedata.category(c) != "Mn")
-    return text.replace("-", " ")
-
-
-def get_promedio_combustible(provincia: str, combustible: str):
-    provincia_norm = _normalize(provincia)
-    combustible_norm = _normalize(combustible)
-
-    precios = []
-
-    for item in get_combustibles():
-        if _normalize(item.get("provincia", "")) != provincia_norm:
-            continue
-
-        if _normalize(item.get("combustible", "")) != combustible_norm:
-            continue
 
-        valores = item.get("precios", {})
-        for v in valores.values():
-            if isinstance(v, (int, float)):
-                precios.append(v)
+def get_history_last(category: str, n: int):
+    """Últimos n puntos del histórico de una categoría."""
+    return SERIES[category].last(n)
 
-    if not precios:
-        return None
 
-    return round(sum(precios) / len(precios), 2)
+def get_history_page(category: str, limit: int, cursor=None, desde=None, hasta=None):
+    """
+    Página del histórico de una categoría (ver TimeSeries.page).
+    Devuelve (items, siguiente_cursor); ([], None) si las fechas no son válidas.
+    """
+    try:
+        return SERIES[category].page(limit, cursor=cursor, desde=desde, hasta=hasta)
+    except ValueError:
+        return [], None
 
 
 # -------- ICL --------
@@ -76,56 +99,11 @@ def get_icl():
 
 
 def get_icl_history():
-    icl_path = BASE_DATA_PATH / "icl"
-
-    if not icl_path.exists():
-        return []
-
-    files = [
-        f for f in icl_path.iterdir() if f.suffix == ".json" and f.name != "latest.json"
-    ]
-
-    result = []
-
-    for file in files:
-        try:
-            with open(file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if not data:
-                continue
-
-            item = data[0]
-            result.append(
-                {"fecha": item.get("fecha") or file.stem, "valor": item.get("valor")}
-            )
-
-        except Exception:
-            continue
-
-    # orden cronológico
-    result.sort(key=lambda x: datetime.strptime(x["fecha"], "%d/%m/%Y"))
-    return result
+    return ICL.history()
 
 
 def get_icl_range(desde: str, hasta: str):
-    historico = get_icl_history()
-
-    try:
-        d_desde = datetime.strptime(desde, "%Y-%m-%d").date()
-        d_hasta = datetime.strptime(hasta, "%Y-%m-%d").date()
-    except ValueError:
-        return []
-
-    result = []
-
-    for item in historico:
-        fecha = datetime.strptime(item["fecha"], "%d/%m/%Y").date()
-
-        if d_desde <= fecha <= d_hasta:
-            result.append(item)
-
-    return result
+    return ICL.range(desde, hasta)
 
 
 # -------- IPC --------
@@ -137,78 +115,11 @@ def get_ipc():
 
 
 def get_ipc_history():
-    ipc_path = BASE_DATA_PATH / "ipc"
-
-    if not ipc_path.exists():
-        return []
-
-    files = [
-        f for f in ipc_path.iterdir() if f.suffix == ".json" and f.name != "latest.json"
-    ]
-
-    result = []
-
-    for file in files:
-        try:
-            with open(file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if not data:
-                continue
-
-            item = data[0]
-
-            indice = item.get("indice_ipc")
-            mes = item.get("mes")
-            anio = item.get("anio")
-            nombre_mes = item.get("nombre_mes")
-
-            if indice is None or mes is None:
-                continue
-
-            result.append(
-                {
-                    "mes": mes,
-                    "anio": anio,
-                    "nombre_mes": nombre_mes,
-                    "valor": indice,
-                }
-            )
-
-        except Exception:
-            continue
-
-    # ordenar por anio y mes
-    result.sort(key=lambda x: (x["anio"], x["mes"]))
-    return result
+    return IPC.history()
 
 
 def get_ipc_range(desde: str, hasta: str):
-    historico = get_ipc_history()
-
-    try:
-        desde_dt = datetime.strptime(desde, "%Y-%m")
-        hasta_dt = datetime.strptime(hasta, "%Y-%m")
-    except ValueError:
-        return []
-
-    result = []
-
-    for item in historico:
-        anio = item.get("anio")
-        mes = item.get("mes")
-
-        if not anio or not mes:
-            continue
-
-        fecha_ipc = datetime(anio, mes, 1)
-
-        if desde_dt <= fecha_ipc <= hasta_dt:
-            result.append(item)
-
-    # ya viene ordenado, pero por las dudas
-    result.sort(key=lambda x: (x["anio"], x["mes"]))
-    return result
+    return IPC.range(desde, hasta)
 
 
 # -------- UVI --------
@@ -223,59 +134,11 @@ def get_uvi():
 
 
 def get_uvi_history():
-    uvi_path = BASE_DATA_PATH / "uvi"
-
-    if not uvi_path.exists():
-        return []
-
-    files = [
-        f for f in uvi_path.iterdir() if f.suffix == ".json" and f.name != "latest.json"
-    ]
-
-    result = []
-
-    for file in files:
-        try:
-            with open(file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if not data:
-                continue
-
-            item = data[0]
-            result.append(
-                {
-                    "fecha": item.get("fecha") or file.stem,
-                    "valor": item.get("valor"),
-                }
-            )
-
-        except Exception:
-            continue
-
-    # orden cronológico
-    result.sort(key=lambda x: datetime.strptime(x["fecha"], "%d/%m/%Y"))
-    return result
+    return UVI.history()
 
 
 def get_uvi_range(desde: str, hasta: str):
-    historico = get_uvi_history()
-
-    try:
-        d_desde = datetime.strptime(desde, "%Y-%m-%d").date()
-        d_hasta = datetime.strptime(hasta, "%Y-%m-%d").date()
-    except ValueError:
-        return []
-
-    result = []
-
-    for item in historico:
-        fecha = datetime.strptime(item["fecha"], "%d/%m/%Y").date()
-
-        if d_desde <= fecha <= d_hasta:
-            result.append(item)
-
-    return result
+    return UVI.range(desde, hasta)
 
 
 # -------- UVA --------
@@ -290,57 +153,11 @@ def get_uva():
 
 
 def get_uva_history():
-    uva_path = BASE_DATA_PATH / "uva"
-
-    if not uva_path.exists():
-        return []
-
-    files = [
-        f for f in uva_path.iterdir() if f.suffix == ".json" and f.name != "latest.json"
-    ]
-
-    result = []
-
-    for file in files:
-        try:
-            with open(file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if not data:
-                continue
-
-            item = data[0]
-            result.append(
-                {
-                    "fecha": item.get("fecha") or file.stem,
-                    "valor": item.get("valor"),
-                }
-            )
-
-        except Exception:
-            continue
-
-    result.sort(key=lambda x: datetime.strptime(x["fecha"], "%d/%m/%Y"))
-    return result
+    return UVA.history()
 
 
 def get_uva_range(desde: str, hasta: str):
-    historico = get_uva_history()
-
-    try:
-        d_desde = datetime.strptime(desde, "%Y-%m-%d").date()
-        d_hasta = datetime.strptime(hasta, "%Y-%m-%d").date()
-    except ValueError:
-        return []
-
-    result = []
-
-    for item in historico:
-        fecha = datetime.strptime(item["fecha"], "%d/%m/%Y").date()
-        if d_desde <= fecha <= d_hasta:
-            result.append(item)
-
-    return result
+    return UVA.range(desde, hasta)
 
 
 # -------- CER --------
@@ -355,57 +172,11 @@ def get_cer():
 
 
 def get_cer_history():
-    cer_path = BASE_DATA_PATH / "cer"
-
-    if not cer_path.exists():
-        return []
-
-    files = [
-        f for f in cer_path.iterdir() if f.suffix == ".json" and f.name != "latest.json"
-    ]
-
-    result = []
-
-    for file in files:
-        try:
-            with open(file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if not data:
-                continue
-
-            item = data[0]
-            result.append(
-                {
-                    "fecha": item.get("fecha") or file.stem,
-                    "valor": item.get("valor"),
-                }
-            )
-
-        except Exception:
-            continue
-
-    result.sort(key=lambda x: datetime.strptime(x["fecha"], "%d/%m/%Y"))
-    return result
+    return CER.history()
 
 
 def get_cer_range(desde: str, hasta: str):
-    historico = get_cer_history()
-
-    try:
-        d_desde = datetime.strptime(desde, "%Y-%m-%d").date()
-        d_hasta = datetime.strptime(hasta, "%Y-%m-%d").date()
-    except ValueError:
-        return []
-
-    result = []
-
-    for item in historico:
-        fecha = datetime.strptime(item["fecha"], "%d/%m/%Y").date()
-        if d_desde <= fecha <= d_hasta:
-            result.append(item)
-
-    return result
+    return CER.range(desde, hasta)
 
 
 # -------- RIOS --------
@@ -421,18 +192,37 @@ def get_rios():
     return data[0]
 
 
-def get_rio_by_nombre(nombre: str):
-    data = get_rios()
-    if not data:
-        return None
+def _indice_rios(path: Path) -> dict:
+    """
+    {"rios": {nombre normalizado: río}, "puertos": {nombre normalizado: puerto}}
+    del snapshot de ríos. Cada puerto lleva además el nombre de su río.
+    """
+    data = registry.get(path)
+    rios = data[0].get("rios", []) if data else []
+    return {
+        "rios": {normalizar(rio.get("nombre") or ""): rio for rio in rios},
+        "puertos": {
+            normalizar(puerto.get("nombre") or ""): {"rio": rio.get("nombre"), **puerto}
+            for rio in rios
+            for puerto in rio.get("puertos", [])
+        },
+    }
+
+
+def get_indice_rios() -> dict:
+    path = BASE_DATA_PATH / "rios" / "latest.json"
+    try:
+        return registry.get(path, _indice_rios)
+    except FileNotFoundError:
+        raise FileNotFoundError("No existe latest.json para rios")
 
-    nombre_norm = _normalize(nombre)
 
-    for rio in data.get("rios", []):
-        if _normalize(rio.get("nombre", "")) == nombre_norm:
-            return rio
+def get_rio_by_nombre(nombre: str):
+    return get_indice_rios()["rios"].get(normalizar(nombre))
+
 
-    return None
+def get_puerto_by_nombre(nombre: str):
+    return get_indice_rios()["puertos"].get(normalizar(nombre))
 
 
 # -------- CONSTRUCCIÓN (ICC) --------
@@ -469,46 +259,11 @@ def get_canasta():
 
 
 def get_canasta_history():
-    canasta_path = BASE_DATA_PATH / "canasta"
-
-    if not canasta_path.exists():
-        return []
-
-    files = [
-        f
-        for f in canasta_path.iterdir()
-        if f.suffix == ".json" and f.name != "latest.json"
-    ]
-
-    result = []
-
-    for file in files:
-        try:
-            with open(file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if not data:
-                continue
-
-            result.append(data)
-
-        except Exception:
-            continue
-
-    result.sort(key=lambda x: x["periodo"])
-    return result
+    return CANASTA.history()
 
 
 def get_canasta_range(desde: str, hasta: str):
-    historico = get_canasta_history()
-
-    try:
-        datetime.strptime(desde, "%Y-%m")
-        datetime.strptime(hasta, "%Y-%m")
-    except ValueError:
-        return []
-
-    return [item for item in historico if desde <= item["periodo"] <= hasta]
+    return CANASTA.range(desde, hasta)
 
 
 # -------- SMVM --------
@@ -520,65 +275,11 @@ def get_smvm():
 
 
 def get_smvm_history():
-    smvm_path = BASE_DATA_PATH / "smvm"
-
-    if not smvm_path.exists():
-        return []
-
-    files = [
-        f
-        for f in smvm_path.iterdir()
-        if f.suffix == ".json" and f.name != "latest.json"
-    ]
-
-    result = []
-
-    for file in files:
-        try:
-            with open(file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if not data:
-                continue
-
-            item = data[0]
-
-            result.append(
-                {
-                    "vigente_desde": item.get("vigente_desde") or file.stem,
-                    "smvm": item.get("smvm"),
-                    "smvm_dia": item.get("smvm_dia"),
-                    "smvm_hora": item.get("smvm_hora"),
-                    "fuente": item.get("fuente"),
-                }
-            )
-
-        except Exception:
-            continue
-
-    # ordenar cronológicamente
-    result.sort(key=lambda x: datetime.strptime(x["vigente_desde"], "%d/%m/%Y"))
-    return result
+    return SMVM.history()
 
 
 def get_smvm_range(desde: str, hasta: str):
-    historico = get_smvm_history()
-
-    try:
-        d_desde = datetime.strptime(desde, "%Y-%m-%d").date()
-        d_hasta = datetime.strptime(hasta, "%Y-%m-%d").date()
-    except ValueError:
-        return []
-
-    result = []
-
-    for item in historico:
-        fecha = datetime.strptime(item["vigente_desde"], "%d/%m/%Y").date()
-
-        if d_desde <= fecha <= d_hasta:
-            result.append(item)
-
-    return result
+    return SMVM.range(desde, hasta)
 
 
 # -------- ICL ADELANTO --------
@@ -0,0 +1,157 @@
+import json
+import os
+import pickle  # nosec B403 - solo se leen bundles generados en el build de la imagen
+import threading
+from pathlib import Path
+
+ROOT_PATH = Path(__file__).resolve().parents[2]
+
+
+def read_json(path: Path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def archivos_snapshot(path: Path) -> list:
+    """Snapshots YYYY-MM-DD.json del directorio, en orden cronológico."""
+    return sorted(Path(path).glob("????-??-??.json"))
+
+
+def leer_snapshots(path: Path):
+    """(fecha YYYY-MM-DD, contenido) de cada snapshot, en orden cronológico."""
+    for file in archivos_snapshot(path):
+        yield file.stem, read_json(file)
+
+
+def _relative(path) -> str:
+    """Ruta relativa a la raíz del proyecto, igual en el build y en Lambda."""
+    return Path(path).resolve().relative_to(ROOT_PATH).as_posix()
+
+
+def _loader_id(loader) -> str:
+    return f"{loader.__module__}.{loader.__qualname__}"
+
+
+class DatasetRegistry:
+    """
+    Cache de datasets por proceso.
+
+    Cada dataset se parsea una sola vez y se revalida en cada acceso con un
+    stat() (mtime + tamaño). Si el archivo cambió, se vuelve a cargar y la
+    entrada nueva reemplaza a la anterior en una sola asignación, así que los
+    requests concurrentes ven la versión vieja o la nueva, nunca una a medias.
+
+    Si se cargó un bundle (ver api/services/bundle.py), los datasets que no
+    existen en disco se sirven desde el bundle con la versión del build.
+
+    Los objetos devueltos se comparten entre requests: no deben modificarse.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.RLock()
+        self._bundle_entries = {}
+        self._bundle_versions = {}
+        self._dependencias = set()
+
+    def version(self, path: Path) -> tuple:
+        """
+        Firma barata del dataset. Para un directorio se combina el mtime del
+        directorio (archivos agregados/borrados) con el de su latest.json.
+        Lanza FileNotFoundError si no existe (ni en disco ni en el bundle).
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            if self._bundle_versions:
+                firma = self._bundle_versions.get(_relative(path))
+                if firma is not None:
+                    return firma
+            raise
+
+        firma = (st.st_mtime_ns, st.st_size)
+
+        if os.path.isdir(path):
+            try:
+                latest = os.stat(os.path.join(path, "latest.json"))
+                firma += (latest.st_mtime_ns, latest.st_size)
+            except FileNotFoundError:
+                pass
+
+        return firma
+
+    def exists(self, path: Path) -> bool:
+        try:
+            self.version(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def get(self, path: Path, loader=read_json, depende_de=()):
+        """
+        Devuelve loader(path), reutilizando el resultado mientras no cambie.
+        `depende_de`: otros datasets que el loader también lee; si cambia
+        cualquiera de ellos el resultado se vuelve a calcular.
+        """
+        key = (str(path), loader)
+        firma = self.version(path)
+        for dependencia in depende_de:
+            firma += self.version(dependencia)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == firma:
+            return entry[1]
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == firma:
+                return entry[1]
+
+            bundled = None
+            if self._bundle_entries:
+                bundled = self._bundle_entries.get(
+                    (_relative(path), _loader_id(loader))
+                )
+            if bundled is not None and bundled[0] == firma:
+                value = bundled[1]
+            else:
+                value = loader(path)
+            self._entries[key] = (firma, value)
+            self._dependencias.update(str(d) for d in depende_de)
+
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+
+    # -------- bundle --------
+
+    def dump_bundle(self, out_path: Path):
+        """Serializa todo lo cargado hasta ahora (ver bundle.build)."""
+        with self._lock:
+            entries = {
+                (_relative(path), _loader_id(loader)): entry
+                for (path, loader), entry in self._entries.items()
+            }
+            paths = {path for path, _ in self._entries} | self._dependencias
+            versions = {_relative(path): self.version(path) for path in paths}
+
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, "wb") as f:
+            pickle.dump(
+                {"entries": entries, "versions": versions},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+
+    def load_bundle(self, path: Path):
+        with open(path, "rb") as f:
+            bundle = pickle.load(f)  # nosec B301 - generado por bundle.build
+
+        with self._lock:
+            self._bundle_entries = bundle["entries"]
+            self._bundle_versions = bundle["versions"]
+
+
+registry = DatasetRegistry()
@@ -1,44 +1,41 @@
 # api/services/diputados_service.py
-import json
 import os
-import unicodedata
+
+from api.services.dataset_registry import registry
+from api.utils.normalizacion import indexar, normalizar
 
 DATA_PATH = os.path.join(
     os.path.dirname(__file__), "..", "..", "data", "diputados", "diputados.json"
 )
 
 
-def normalizar(texto):
-    texto = (
-        unicodedata.normalize("NFD", texto)
-        .encode("ascii", "ignore")
-        .decode("utf-8")
-        .lower()
-    )
-    return " ".join(texto.split())
+def _cargar(path) -> dict:
+    """El dataset junto con los índices por distrito y bloque normalizados."""
+    data = registry.get(path)
+    return {
+        "data": data,
+        "distrito": indexar(data["datos"], "distrito"),
+        "bloque": indexar(data["datos"], "bloque"),
+    }
 
 
 def get_diputados(distrito=None, bloque=None):
-    if not os.path.exists(DATA_PATH):
+    try:
+        cargado = registry.get(DATA_PATH, _cargar)
+    except FileNotFoundError:
         raise FileNotFoundError("No hay datos de diputados disponibles.")
 
-    with open(DATA_PATH, encoding="utf-8") as f:
-        data = json.load(f)
-
+    data = cargado["data"]
     diputados = data["datos"]
 
-    if distrito:
-        distrito_normalizado = normalizar(distrito.replace("-", " "))
-        diputados = [
-            d for d in diputados if normalizar(d["distrito"]) == distrito_normalizado
-        ]
-
-    if bloque:
-        bloque_normalizado = normalizar(bloque.replace("-", " "))
-        diputados = [
-            d
-            for d in diputados
-            if normalizar(d["bloque"].replace("-", " ")) == bloque_normalizado
-        ]
+    posiciones = None
+    for campo, valor in (("distrito", distrito), ("bloque", bloque)):
+        if not valor:
+            continue
+        encontradas = set(cargado[campo].get(normalizar(valor), ()))
+        posiciones = encontradas if posiciones is None else posiciones & encontradas
+
+    if posiciones is not None:
+        diputados = [diputados[i] for i in sorted(posiciones)]
 
     return {"total": len(diputados), "fuente": data["fuente"], "datos": diputados}
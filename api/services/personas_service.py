@@ -1,6 +1,7 @@
-import json
 import os
 
+from api.services.dataset_registry import registry
+
 DATA_DIR = os.path.join(
     os.path.dirname(__file__), "..", "..", "data", "personas_desaparecidas"
 )
@@ -8,10 +9,10 @@ DATA_DIR = os.path.join(
 
 def _load_latest() -> dict:
     path = os.path.join(DATA_DIR, "latest.json")
-    if not os.path.exists(path):
+    try:
+        return registry.get(path)
+    except FileNotFoundError:
         raise FileNotFoundError("No hay datos disponibles. Ejecutá el scraper primero.")
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
 
 
 def get_resumen() -> dict:
@@ -0,0 +1,309 @@
+# api/services/provincias_service.py
+import re
+from bisect import bisect_left
+from pathlib import Path
+
+from api.services.dataset_registry import registry
+from api.utils.geo import GrillaEspacial
+from api.utils.normalizacion import normalizar
+
+DATA_PATH = Path(__file__).resolve().parents[2] / "data" / "provincias" / "latest.json"
+
+# Búsqueda por nombre: similitud mínima (trigramas del texto buscado que
+# aparecen en el nombre) para considerar un nombre como candidato aproximado, y
+# errores de tipeo tolerados por palabra (uno cada LETRAS_POR_ERROR letras,
+# al menos uno) para devolverlo
+SIMILITUD_MINIMA = 0.25
+LETRAS_POR_ERROR = 3
+
+# Campos de cada municipio en las respuestas resumidas (consultas por lote)
+CAMPOS_RESUMIDOS = ("id", "nombre", "provincia")
+
+_PALABRA = re.compile(r"[a-z0-9]+")
+
+
+def _trigramas(texto: str) -> set:
+    """Trigramas de cada palabra, con bordes (' sa', 'san', 'an ')."""
+    return {
+        f" {palabra} "[i : i + 3]
+        for palabra in _PALABRA.findall(texto)
+        for i in range(len(palabra))
+    }
+
+
+def _distancia_edicion(a: str, b: str, maximo: int) -> int:
+    """
+    Damerau-Levenshtein (alineación óptima): inserciones, borrados, cambios y
+    transposiciones de letras vecinas ('cuatro' → 'cuarto') cuentan un error.
+    Deja de calcular apenas se pasa de `maximo`: si la distancia es mayor,
+    solo se garantiza que el resultado también lo sea.
+    """
+    anterior, previa = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        letra = a[i - 1]
+        actual = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            distancia = previa[j - 1] + (letra != b[j - 1])
+            if previa[j] + 1 < distancia:
+                distancia = previa[j] + 1
+            if actual[j - 1] + 1 < distancia:
+                distancia = actual[j - 1] + 1
+            if (
+                i > 1
+                and j > 1
+                and letra == b[j - 2]
+                and a[i - 2] == b[j - 1]
+                and anterior[j - 2] + 1 < distancia
+            ):
+                distancia = anterior[j - 2] + 1
+            actual[j] = distancia
+        # una fila no baja de su mínimo: con la anterior alcanza para una transposición
+        if min(actual) > maximo and min(previa) > maximo:
+            return maximo + 1
+        anterior, previa = previa, actual
+    return previa[len(b)]
+
+
+def _errores(buscadas: list, nombre: str, distancias: dict):
+    """
+    Errores de tipeo entre las palabras buscadas y las del nombre (cada una
+    contra la palabra más parecida), o None si superan lo tolerado.
+    `distancias`: memo de (buscada, palabra) → (errores, máximo con el que se
+    calcularon), por búsqueda. Si errores > máximo es solo una cota inferior.
+    """
+    palabras = _PALABRA.findall(nombre)
+    tolerados = sum(max(1, len(b) // LETRAS_POR_ERROR) for b in buscadas)
+    errores = 0
+    for buscada in buscadas:
+        margen = tolerados - errores
+        minimo = margen + 1
+        for palabra in palabras:
+            # la distancia es al menos la diferencia de largo
+            if abs(len(palabra) - len(buscada)) >= minimo:
+                continue
+            clave = (buscada, palabra)
+            distancia, maximo = distancias.get(clave, (None, None))
+            if distancia is None or maximo < distancia <= margen:
+                distancia = _distancia_edicion(buscada, palabra, margen)
+                distancias[clave] = distancia, margen
+            minimo = min(minimo, distancia)
+        errores += minimo
+        if errores > tolerados:
+            return None
+    return errores
+
+
+class BuscadorLugares:
+    """
+    Índice de nombres de provincias y municipios para autocompletar, sin
+    tildes ni mayúsculas:
+
+    - prefijos: lista ordenada de (palabra, posición del lugar); cada palabra
+      buscada se resuelve con bisect sobre esa lista.
+    - aproximada (errores de tipeo): trigramas de cada palabra → lugares
+      candidatos, que se ordenan por distancia de edición. Solo se usa si los
+      prefijos no alcanzan para completar el límite.
+
+    Orden: nombre exacto, nombre que empieza con lo buscado, alguna palabra
+    que empieza con lo buscado, aproximados por cantidad de errores y
+    similitud; dentro de cada grupo, provincias primero y después por
+    población.
+    """
+
+    __slots__ = ("lugares", "nombres", "pesos", "palabras", "trigramas")
+
+    def __init__(self, lugares: list):
+        """`lugares`: [(resultado público, población o None)]."""
+        self.lugares = [lugar for lugar, _ in lugares]
+        self.nombres = [normalizar(lugar["nombre"] or "") for lugar in self.lugares]
+        self.pesos = [
+            float("-inf") if lugar["tipo"] == "provincia" else -(poblacion or 0)
+            for lugar, poblacion in lugares
+        ]
+
+        self.palabras = sorted(
+            (palabra, i)
+            for i, nombre in enumerate(self.nombres)
+            for palabra in set(_PALABRA.findall(nombre))
+        )
+
+        trigramas = {}
+        for i, nombre in enumerate(self.nombres):
+            for trigrama in _trigramas(nombre):
+                trigramas.setdefault(trigrama, []).append(i)
+        self.trigramas = {t: tuple(posiciones) for t, posiciones in trigramas.items()}
+
+    def _con_prefijo(self, prefijo: str) -> set:
+        inicio = bisect_left(self.palabras, (prefijo,))
+        encontrados = set()
+        for palabra, i in self.palabras[inicio:]:
+            if not palabra.startswith(prefijo):
+                break
+            encontrados.add(i)
+        return encontrados
+
+    def _aproximados(self, texto: str, excluir: set) -> dict:
+        """{posición: similitud} de los lugares parecidos a `texto`."""
+        buscados = _trigramas(texto)
+        if not buscados:
+            return {}
+
+        compartidos = {}
+        for trigrama in buscados:
+            for i in self.trigramas.get(trigrama, ()):
+                compartidos[i] = compartidos.get(i, 0) + 1
+
+        return {
+            i: cantidad / len(buscados)
+            for i, cantidad in compartidos.items()
+            if i not in excluir and cantidad / len(buscados) >= SIMILITUD_MINIMA
+        }
+
+    def buscar(self, texto: str, limite: int) -> list:
+        texto = normalizar(texto)
+        palabras = _PALABRA.findall(texto)
+        if not palabras:
+            return []
+
+        encontrados = self._con_prefijo(palabras[0])
+        for palabra in palabras[1:]:
+            encontrados &= self._con_prefijo(palabra)
+
+        ranking = []
+        for i in encontrados:
+            nombre = self.nombres[i]
+            grupo = 0 if nombre == texto else 1 if nombre.startswith(texto) else 2
+            ranking.append((grupo, 0, 0, self.pesos[i], nombre, i))
+
+        if len(ranking) < limite:
+            distancias = {}
+            for i, similitud in self._aproximados(texto, encontrados).items():
+                errores = _errores(palabras, self.nombres[i], distancias)
+                if errores is not None:
+                    ranking.append(
+                        (3, errores, -similitud, self.pesos[i], self.nombres[i], i)
+                    )
+
+        ranking.sort()
+        return [self.lugares[i] for *_, i in ranking[:limite]]
+
+
+class IndiceProvincias:
+    """
+    Provincias y municipios del dataset indexados por ID. Las provincias se
+    guardan sin la lista de municipios (con su cantidad) y los municipios de
+    cada provincia por separado, así una consulta no arrastra todo el censo.
+    Los centroides de los municipios van además a una grilla espacial y los
+    nombres de todos los lugares a un BuscadorLugares.
+    """
+
+    __slots__ = (
+        "provincias",
+        "nombres",
+        "municipios",
+        "por_provincia",
+        "grilla",
+        "buscador",
+    )
+
+    def __init__(self, data: list):
+        self.provincias = {}
+        self.nombres = {}
+        self.municipios = {}
+        self.por_provincia = {}
+
+        for provincia in data:
+            municipios = provincia.get("municipios", [])
+            self.provincias[provincia["id"]] = {
+                **{k: v for k, v in provincia.items() if k != "municipios"},
+                "cantidad_municipios": len(municipios),
+            }
+            self.nombres[normalizar(provincia.get("nombre") or "")] = provincia["id"]
+            self.por_provincia[provincia["id"]] = municipios
+            for municipio in municipios:
+                self.municipios[municipio["id"]] = municipio
+
+        self.grilla = GrillaEspacial(
+            (m["centroide"]["lat"], m["centroide"]["lon"], id_municipio)
+            for id_municipio, m in self.municipios.items()
+            if (m.get("centroide") or {}).get("lat") is not None
+        )
+
+        self.buscador = BuscadorLugares(
+            [
+                ({"tipo": "provincia", "id": p["id"], "nombre": p["nombre"]}, None)
+                for p in self.provincias.values()
+            ]
+            + [
+                (
+                    {
+                        "tipo": "municipio",
+                        "id": m["id"],
+                        "nombre": m["nombre"],
+                        "provincia": m.get("provincia"),
+                    },
+                    (m.get("censo_2022") or {}).get("poblacion"),
+                )
+                for m in self.municipios.values()
+            ]
+        )
+
+    def id_provincia(self, provincia: str):
+        """ID de la provincia a partir de su ID o su nombre, o None."""
+        if provincia in self.provincias:
+            return provincia
+        return self.nombres.get(normalizar(provincia))
+
+
+def _cargar_indice(path: Path) -> IndiceProvincias:
+    return IndiceProvincias(registry.get(path))
+
+
+def get_indice() -> IndiceProvincias:
+    try:
+        return registry.get(DATA_PATH, _cargar_indice)
+    except FileNotFoundError:
+        raise FileNotFoundError("No hay datos geográficos disponibles")
+
+
+def get_version():
+    """Firma del dataset, para cachear las respuestas ya serializadas."""
+    return registry.version(DATA_PATH)
+
+
+def get_provincia(provincia: str):
+    """Provincia (por ID o nombre) sin sus municipios, o None."""
+    indice = get_indice()
+    return indice.provincias.get(indice.id_provincia(provincia))
+
+
+def get_municipios_de_provincia(provincia: str):
+    """Municipios de la provincia (por ID o nombre), o None si no existe."""
+    indice = get_indice()
+    return indice.por_provincia.get(indice.id_provincia(provincia))
+
+
+def get_municipio(id_municipio: str):
+    return get_indice().municipios.get(id_municipio)
+
+
+def get_municipios_cercanos(
+    lat: float, lon: float, limite: int = 1, resumido: bool = False
+) -> list:
+    """
+    Los `limite` municipios con el centroide más cercano al punto. Con
+    `resumido` solo se devuelven CAMPOS_RESUMIDOS (consultas por lote).
+    """
+    indice = get_indice()
+    resultado = []
+    for distancia, _, _, id_municipio in indice.grilla.mas_cercanos(lat, lon, limite):
+        municipio = indice.municipios[id_municipio]
+        if resumido:
+            municipio = {campo: municipio.get(campo) for campo in CAMPOS_RESUMIDOS}
+        resultado.append({"distancia_km": round(distancia, 2), **municipio})
+    return resultado
+
+
+def buscar_lugares(texto: str, limite: int = 10) -> list:
+    """Provincias y municipios cuyo nombre coincide con `texto` (ver BuscadorLugares)."""
+    return get_indice().buscador.buscar(texto, limite)
@@ -1,25 +1,44 @@
+import math
+from array import array
+from bisect import bisect_left, bisect_right
 from pathlib import Path
-import json
+
+from api.services.dataset_registry import leer_snapshots, registry
+from api.services.timeseries import formatear_ordinal, ordinal_fecha, rango_ordinales
+from api.utils.normalizacion import normalizar
+from api.utils.numeros import SIN_DATO, a_float, a_json
 
 DATA_PATH = (
     Path(__file__).resolve().parents[2] / "data" / "rios_comahue" / "latest.json"
 )
 
+HISTORICO_PATH = DATA_PATH.parent
+
 RIOS_VALIDOS = {"limay", "neuquen", "negro"}
 
+# Mediciones que se acumulan en el histórico de cada estación
+CAMPOS_SERIE = (
+    "altura_rio_m",
+    "caudal_m3s",
+    "precipitacion_mm",
+    "temperatura_minima_c",
+    "temperatura_maxima_c",
+    "temperatura_media_c",
+)
+
 
 def _load() -> dict:
-    if not DATA_PATH.exists():
+    try:
+        return registry.get(DATA_PATH)
+    except FileNotFoundError:
         raise FileNotFoundError("No hay datos de ríos Comahue disponibles.")
-    with open(DATA_PATH, encoding="utf-8") as f:
-        return json.load(f)
 
 
 def get_rios_comahue(rio: str | None = None) -> dict:
     data = _load()
 
     if rio:
-        rio = rio.lower()
+        rio = normalizar(rio)
         if rio not in RIOS_VALIDOS:
             raise ValueError(
                 f"Río inválido. Válidos: {', '.join(sorted(RIOS_VALIDOS))}"
@@ -32,4 +51,189 @@ def get_rios_comahue(rio: str | None = None) -> dict:
             "estaciones": data["rios"].get(rio, []),
         }
 
-    return data
\ No newline at end of file
+    return data
+
+
+# -------- HISTÓRICO --------
+
+
+class SerieEstacion:
+    """
+    Mediciones de una estación ordenadas por fecha de actualización: ordinales
+    del día (array 'I') y un array 'd' por campo de CAMPOS_SERIE (NaN = sin
+    dato).
+    """
+
+    __slots__ = ("rio", "estacion_id", "nombre", "tipo", "ordinales", "valores")
+
+    def __init__(self, rio: str, registro: dict, mediciones: dict):
+        """`mediciones`: {ordinal: registro del snapshot}."""
+        self.rio = rio
+        self.estacion_id = registro.get("estacion_id")
+        self.nombre = registro.get("nombre")
+        self.tipo = registro.get("tipo")
+        self.ordinales = array("I", sorted(mediciones))
+        self.valores = {
+            campo: array(
+                "d", (a_float(mediciones[o].get(campo)) for o in self.ordinales)
+            )
+            for campo in CAMPOS_SERIE
+        }
+
+
+class ResumenComahue:
+    """
+    Agregados diarios de un río: por cada campo de CAMPOS_SERIE, cantidad de
+    estaciones con dato, mínimo, máximo y promedio.
+    """
+
+    __slots__ = ("ordinales", "campos")
+
+    def __init__(self, series: list):
+        por_dia = {}
+        for serie in series:
+            for n, ordinal in enumerate(serie.ordinales):
+                dia = por_dia.setdefault(ordinal, {campo: [] for campo in CAMPOS_SERIE})
+                for campo in CAMPOS_SERIE:
+                    valor = serie.valores[campo][n]
+                    if not math.isnan(valor):
+                        dia[campo].append(valor)
+
+        self.ordinales = array("I", sorted(por_dia))
+        self.campos = {
+            campo: (array("H"), array("d"), array("d"), array("d"))
+            for campo in CAMPOS_SERIE
+        }
+
+        for ordinal in self.ordinales:
+            for campo, (cantidades, minimos, maximos, promedios) in self.campos.items():
+                valores = por_dia[ordinal][campo]
+                cantidades.append(len(valores))
+                minimos.append(min(valores, default=SIN_DATO))
+                maximos.append(max(valores, default=SIN_DATO))
+                promedios.append(sum(valores) / len(valores) if valores else SIN_DATO)
+
+    def dia(self, i: int) -> dict:
+        resultado = {"fecha": formatear_ordinal(self.ordinales[i])}
+        for campo, (cantidades, minimos, maximos, promedios) in self.campos.items():
+            resultado[campo] = {
+                "cantidad": cantidades[i],
+                "minimo": a_json(minimos[i], 2),
+                "maximo": a_json(maximos[i], 2),
+                "promedio": a_json(promedios[i], 2),
+            }
+        return resultado
+
+
+class HistorialComahue:
+    """
+    Mediciones de cada estación de la AIC a lo largo de los snapshots de
+    data/rios_comahue/YYYY-MM-DD.json, indexadas por estación y por fecha de
+    actualización (si la AIC no actualizó una estación, la medición repetida
+    se guarda una sola vez), más los agregados diarios de cada río.
+    """
+
+    __slots__ = ("series", "nombres", "resumenes")
+
+    def __init__(self, snapshots):
+        """`snapshots`: iterable de (fecha YYYY-MM-DD, snapshot) en orden."""
+        mediciones = {}
+        ultimos = {}
+
+        for fecha, snapshot in snapshots:
+            for rio, estaciones in snapshot.get("rios", {}).items():
+                for registro in estaciones:
+                    clave = (rio, registro.get("estacion_id"))
+                    actualizacion = registro.get("fecha_actualizacion") or ""
+                    ordinal = ordinal_fecha(
+                        actualizacion if actualizacion.count("/") == 2 else fecha
+                    )
+                    mediciones.setdefault(clave, {})[ordinal] = registro
+                    ultimos[clave] = registro
+
+        self.series = {
+            clave[1]: SerieEstacion(clave[0], ultimos[clave], mediciones[clave])
+            for clave in sorted(mediciones, key=lambda c: (c[0], str(c[1])))
+        }
+        self.nombres = {
+            normalizar(serie.nombre or ""): estacion_id
+            for estacion_id, serie in self.series.items()
+        }
+
+        por_rio = {}
+        for serie in self.series.values():
+            por_rio.setdefault(serie.rio, []).append(serie)
+        self.resumenes = {
+            rio: ResumenComahue(series) for rio, series in por_rio.items()
+        }
+
+    def buscar(self, estacion: str):
+        """Serie de la estación por ID o por nombre, o None."""
+        estacion_id = int(estacion) if estacion.isdigit() else None
+        if estacion_id not in self.series:
+            estacion_id = self.nombres.get(normalizar(estacion))
+        return self.series.get(estacion_id)
+
+    def estacion(self, estacion: str, desde: int, hasta: int):
+        """Mediciones de la estación entre los ordinales desde y hasta, o None."""
+        serie = self.buscar(estacion)
+        if serie is None:
+            return None
+
+        inicio = bisect_left(serie.ordinales, desde)
+        fin = bisect_right(serie.ordinales, hasta)
+
+        return {
+            "estacion_id": serie.estacion_id,
+            "nombre": serie.nombre,
+            "tipo": serie.tipo,
+            "rio": serie.rio,
+            "mediciones": [
+                {
+                    "fecha": formatear_ordinal(serie.ordinales[i]),
+                    **{
+                        campo: a_json(serie.valores[campo][i], 2)
+                        for campo in CAMPOS_SERIE
+                    },
+                }
+                for i in range(inicio, fin)
+            ],
+        }
+
+    def resumen(self, rio: str, desde: int, hasta: int) -> dict:
+        resumen = self.resumenes.get(rio)
+        if resumen is None:
+            return {"rio": rio, "dias": []}
+
+        inicio = bisect_left(resumen.ordinales, desde)
+        fin = bisect_right(resumen.ordinales, hasta)
+        return {"rio": rio, "dias": [resumen.dia(i) for i in range(inicio, fin)]}
+
+
+def _cargar_historico(path: Path) -> HistorialComahue:
+    return HistorialComahue(leer_snapshots(path))
+
+
+def get_historico_indice() -> HistorialComahue:
+    try:
+        return registry.get(HISTORICO_PATH, _cargar_historico)
+    except FileNotFoundError:
+        raise FileNotFoundError("No hay histórico de ríos Comahue disponible.")
+
+
+def get_historico_estacion(estacion: str, desde=None, hasta=None):
+    """
+    Mediciones de una estación (ID o nombre), o None si no existe.
+    Lanza ValueError si las fechas no son válidas.
+    """
+    desde, hasta = rango_ordinales(desde, hasta)
+    return get_historico_indice().estacion(estacion, desde, hasta)
+
+
+def get_resumen_comahue(rio: str, desde=None, hasta=None) -> dict:
+    """Agregados diarios de un río. Lanza ValueError (río o fechas inválidos)."""
+    rio = normalizar(rio)
+    if rio not in RIOS_VALIDOS:
+        raise ValueError(f"Río inválido. Válidos: {', '.join(sorted(RIOS_VALIDOS))}")
+    desde, hasta = rango_ordinales(desde, hasta)
+    return get_historico_indice().resumen(rio, desde, hasta)
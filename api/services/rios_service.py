@@ -0,0 +1,185 @@
+# api/services/rios_service.py
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+from api.services.dataset_registry import leer_snapshots, registry
+from api.services.timeseries import formatear_ordinal, ordinal_fecha, rango_ordinales
+from api.utils.normalizacion import normalizar
+from api.utils.numeros import a_float, a_json
+
+DATA_PATH = Path(__file__).resolve().parents[2] / "data" / "rios"
+
+
+class SeriePuerto:
+    """
+    Lecturas de un puerto en columnas paralelas, ordenadas por fecha de la
+    lectura: ordinales del día (array 'I'), altura y variación (array 'd',
+    NaN = sin dato) y el código de estado (array 'B').
+    """
+
+    __slots__ = ("rio", "puerto", "ordinales", "alturas", "variaciones", "estados")
+
+    def __init__(self, rio: str, puerto: str, lecturas: dict, codigos: dict):
+        """`lecturas`: {ordinal: (altura, variación, estado)}."""
+        self.rio = rio
+        self.puerto = puerto
+        self.ordinales = array("I", sorted(lecturas))
+        self.alturas = array("d")
+        self.variaciones = array("d")
+        self.estados = array("B")
+
+        for ordinal in self.ordinales:
+            altura, variacion, estado = lecturas[ordinal]
+            self.alturas.append(altura)
+            self.variaciones.append(variacion)
+            self.estados.append(codigos.setdefault(estado, len(codigos)))
+
+    def rango(self, desde: int, hasta: int) -> range:
+        """Posiciones con ordinal en [desde, hasta]."""
+        return range(
+            bisect_left(self.ordinales, desde), bisect_right(self.ordinales, hasta)
+        )
+
+
+class ResumenRio:
+    """Mínimo, máximo y promedio diario de la altura de los puertos de un río."""
+
+    __slots__ = ("rio", "ordinales", "puertos", "minimos", "maximos", "promedios")
+
+    def __init__(self, rio: str, series: list):
+        alturas_por_dia = {}
+        for serie in series:
+            for ordinal, altura in zip(serie.ordinales, serie.alturas):
+                if not math.isnan(altura):
+                    alturas_por_dia.setdefault(ordinal, []).append(altura)
+
+        self.rio = rio
+        self.ordinales = array("I", sorted(alturas_por_dia))
+        self.puertos = array("H")
+        self.minimos = array("d")
+        self.maximos = array("d")
+        self.promedios = array("d")
+
+        for ordinal in self.ordinales:
+            alturas = alturas_por_dia[ordinal]
+            self.puertos.append(len(alturas))
+            self.minimos.append(min(alturas))
+            self.maximos.append(max(alturas))
+            self.promedios.append(round(sum(alturas) / len(alturas), 2))
+
+
+class HistorialRios:
+    """
+    Alturas de todos los puertos a lo largo de los snapshots de
+    data/rios/YYYY-MM-DD.json, indexadas por puerto y por fecha de lectura.
+
+    Prefectura repite la última lectura de los puertos que no reportaron: si
+    una misma lectura aparece en varios snapshots se guarda una sola vez (la
+    del snapshot más nuevo). El resumen diario por río se calcula al indexar.
+    """
+
+    __slots__ = ("estados", "series", "resumenes")
+
+    def __init__(self, snapshots):
+        """`snapshots`: iterable de (fecha YYYY-MM-DD, snapshot) en orden."""
+        lecturas = {}
+        nombres = {}
+
+        for fecha, snapshot in snapshots:
+            if isinstance(snapshot, list):
+                snapshot = snapshot[0] if snapshot else {}
+
+            for rio in snapshot.get("rios", []):
+                for puerto in rio.get("puertos", []):
+                    clave = normalizar(puerto.get("nombre") or "")
+                    nombres[clave] = (rio.get("nombre"), puerto.get("nombre"))
+                    ordinal = ordinal_fecha(puerto.get("fecha") or fecha)
+                    lecturas.setdefault(clave, {})[ordinal] = (
+                        a_float(puerto.get("altura_m")),
+                        a_float(puerto.get("variacion_m")),
+                        puerto.get("estado"),
+                    )
+
+        codigos = {}
+        self.series = {
+            clave: SeriePuerto(*nombres[clave], lecturas[clave], codigos)
+            for clave in sorted(lecturas)
+        }
+        self.estados = tuple(codigos)
+
+        por_rio = {}
+        for serie in self.series.values():
+            por_rio.setdefault(serie.rio, []).append(serie)
+
+        self.resumenes = {
+            normalizar(rio or ""): ResumenRio(rio, series)
+            for rio, series in por_rio.items()
+        }
+
+    def puerto(self, nombre: str, desde: int, hasta: int):
+        """Lecturas del puerto entre los ordinales desde y hasta, o None."""
+        serie = self.series.get(normalizar(nombre))
+        if serie is None:
+            return None
+
+        return {
+            "puerto": serie.puerto,
+            "rio": serie.rio,
+            "lecturas": [
+                {
+                    "fecha": formatear_ordinal(serie.ordinales[i]),
+                    "altura_m": a_json(serie.alturas[i]),
+                    "variacion_m": a_json(serie.variaciones[i]),
+                    "estado": self.estados[serie.estados[i]],
+                }
+                for i in serie.rango(desde, hasta)
+            ],
+        }
+
+    def resumen(self, rio: str, desde: int, hasta: int):
+        """Resumen diario del río entre los ordinales desde y hasta, o None."""
+        resumen = self.resumenes.get(normalizar(rio))
+        if resumen is None:
+            return None
+
+        inicio = bisect_left(resumen.ordinales, desde)
+        fin = bisect_right(resumen.ordinales, hasta)
+
+        return {
+            "rio": resumen.rio,
+            "dias": [
+                {
+                    "fecha": formatear_ordinal(resumen.ordinales[i]),
+                    "puertos_con_dato": resumen.puertos[i],
+                    "altura_min_m": resumen.minimos[i],
+                    "altura_max_m": resumen.maximos[i],
+                    "altura_promedio_m": resumen.promedios[i],
+                }
+                for i in range(inicio, fin)
+            ],
+        }
+
+
+def _cargar_historico(path: Path) -> HistorialRios:
+    return HistorialRios(leer_snapshots(path))
+
+
+def get_historico_indice() -> HistorialRios:
+    try:
+        return registry.get(DATA_PATH, _cargar_historico)
+    except FileNotFoundError:
+        raise FileNotFoundError("No hay histórico de ríos")
+
+
+def get_historico_puerto(puerto: str, desde=None, hasta=None):
+    """Serie de alturas de un puerto, o None si no existe. Lanza ValueError."""
+    desde, hasta = rango_ordinales(desde, hasta)
+    return get_historico_indice().puerto(puerto, desde, hasta)
+
+
+def get_resumen_diario_rio(rio: str, desde=None, hasta=None):
+    """Mín/máx/promedio diario de un río, o None si no existe. Lanza ValueError."""
+    desde, hasta = rango_ordinales(desde, hasta)
+    return get_historico_indice().resumen(rio, desde, hasta)
@@ -0,0 +1,316 @@
+import json
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from pathlib import Path
+
+from api.services.dataset_registry import registry
+
+# Archivo con el histórico completo de las series diarias. Lo escribe
+# escribir_serie_empaquetada() de scrapers/utils.py (los scrapers no importan la
+# API, así que el formato está en los dos lados); test/test_serie_empaquetada.py
+# verifica que lo que lee la API coincida con el histórico de los JSON.
+PACKED_SERIES_FILE = "serie.bin"
+_PACKED_MAGIC = b"ARG1"
+_PACKED_HEADER = struct.Struct("<4sI")
+
+DIA = "dia"
+MES = "mes"
+
+SERIES = {}
+
+
+def register(serie):
+    SERIES[serie.dataset] = serie
+    return serie
+
+
+# -------- CLAVES --------
+
+
+def ordinal_fecha(fecha: str) -> int:
+    """'DD/MM/YYYY' (o 'YYYY-MM-DD') → ordinal del día."""
+    if "/" in fecha:
+        dia, mes, anio = fecha.split("/")
+    else:
+        anio, mes, dia = fecha.split("-")
+    return date(int(anio), int(mes), int(dia)).toordinal()
+
+
+def formatear_ordinal(ordinal: int) -> str:
+    """Ordinal del día → 'DD/MM/YYYY' (formato público), sin strftime."""
+    d = date.fromordinal(ordinal)
+    return f"{d.day:02d}/{d.month:02d}/{d.year:04d}"
+
+
+def rango_ordinales(desde: str | None, hasta: str | None) -> tuple:
+    """desde/hasta YYYY-MM-DD (opcionales) → (ordinal, ordinal). Lanza ValueError."""
+    try:
+        return (
+            date.fromisoformat(desde).toordinal() if desde else 1,
+            date.fromisoformat(hasta).toordinal() if hasta else date.max.toordinal(),
+        )
+    except ValueError:
+        raise ValueError("Fecha inválida (formato: YYYY-MM-DD)")
+
+
+def clave_mes(anio: int, mes: int) -> int:
+    return anio * 12 + mes
+
+
+def clave_periodo(periodo: str) -> int:
+    """'YYYY-MM' → clave mensual."""
+    anio, mes = periodo.split("-")
+    return clave_mes(int(anio), int(mes))
+
+
+def _clave_mes_de_ordinal(ordinal: int) -> int:
+    d = date.fromordinal(ordinal)
+    return clave_mes(d.year, d.month)
+
+
+def _format_param(clave: int, granularity: str) -> str:
+    """Inversa de _parse_param: clave → YYYY-MM-DD o YYYY-MM."""
+    if granularity == DIA:
+        return date.fromordinal(clave).isoformat()
+    anio, mes = divmod(clave - 1, 12)
+    return f"{anio:04d}-{mes + 1:02d}"
+
+
+def _parse_param(valor: str, granularity: str) -> int:
+    """Parámetro de query (YYYY-MM-DD o YYYY-MM) → clave. Lanza ValueError."""
+    if granularity == DIA:
+        return date.fromisoformat(valor).toordinal()
+    return clave_periodo(valor)
+
+
+# -------- SERIE --------
+
+
+class TimeSeries:
+    """
+    Serie temporal de un dataset versionado en data/<dataset>/YYYY-MM-DD.json.
+
+    - date_field: campo con la fecha ('DD/MM/YYYY' o 'YYYY-MM'), o una tupla
+      (campo_anio, campo_mes) para series mensuales con año y mes separados.
+    - granularity: DIA (clave = ordinal del día) o MES (clave = anio * 12 + mes).
+    - value_fields: {campo_salida: campo_origen} a copiar de cada registro.
+      Si es None se devuelve el registro completo.
+    - required: campos de origen sin los cuales el registro se descarta.
+    - packed: si existe data/<dataset>/serie.bin se lee de ahí (solo series
+      {fecha, valor}). Los valores se devuelven como float en los dos caminos,
+      aunque la fuente los haya publicado como string.
+
+    La serie se indexa una vez por versión del dataset (ver dataset_registry)
+    como listas paralelas (claves, items) ordenadas por clave.
+    """
+
+    def __init__(
+        self,
+        dataset: str,
+        path: Path,
+        date_field="fecha",
+        granularity: str = DIA,
+        value_fields: dict | None = None,
+        required: tuple = (),
+        packed: bool = False,
+    ):
+        self.dataset = dataset
+        self.path = path
+        self.date_field = date_field
+        self.granularity = granularity
+        self.value_fields = value_fields
+        self.required = required
+        self.packed = packed
+
+    # -------- carga --------
+
+    @property
+    def _packed_path(self) -> Path:
+        return self.path / PACKED_SERIES_FILE
+
+    def _source(self):
+        """(path, loader) de donde sale la serie."""
+        if self.packed and registry.exists(self._packed_path):
+            return self._packed_path, self._read_packed
+        return self.path, self._build
+
+    def index(self):
+        """(claves, items) ordenados por clave."""
+        path, loader = self._source()
+        try:
+            return registry.get(path, loader)
+        except FileNotFoundError:
+            return [], []
+
+    def version(self):
+        """Firma de los datos detrás de la serie, o None si no existen."""
+        try:
+            return registry.version(self._source()[0])
+        except FileNotFoundError:
+            return None
+
+    def _read_packed(self, path: Path):
+        """
+        Lee serie.bin con una sola lectura. Formato (little-endian):
+          "ARG1" | n (uint32) | n ordinales (int32) | n valores (float64)
+        """
+        with open(path, "rb") as f:
+            raw = f.read()
+
+        magic, n = _PACKED_HEADER.unpack_from(raw)
+        if magic != _PACKED_MAGIC:
+            return self._build(self.path)
+
+        inicio = _PACKED_HEADER.size
+        ordinales = array("i")
+        ordinales.frombytes(raw[inicio : inicio + n * 4])
+        valores = array("d")
+        valores.frombytes(raw[inicio + n * 4 : inicio + n * 12])
+
+        if sys.byteorder == "big":
+            ordinales.byteswap()
+            valores.byteswap()
+
+        items = [
+            {self.date_field: formatear_ordinal(o), "valor": v}
+            for o, v in zip(ordinales, valores)
+        ]
+        return ordinales, items
+
+    def _build(self, path: Path):
+        files = [
+            f for f in path.iterdir() if f.suffix == ".json" and f.name != "latest.json"
+        ]
+
+        result = []
+
+        for file in files:
+            try:
+                with open(file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+
+                if not data:
+                    continue
+
+                record = data[0] if isinstance(data, list) else data
+                entry = self._entry(record, file.stem)
+                if entry is not None:
+                    result.append(entry)
+
+            except Exception:
+                continue
+
+        # orden cronológico
+        result.sort(key=lambda x: x[0])
+        return [clave for clave, _ in result], [item for _, item in result]
+
+    def _entry(self, record: dict, stem: str):
+        """(clave, item) de un registro, o None si le faltan campos."""
+        if any(record.get(campo) is None for campo in self.required):
+            return None
+
+        if isinstance(self.date_field, tuple):
+            campo_anio, campo_mes = self.date_field
+            clave = clave_mes(record[campo_anio], record[campo_mes])
+            fecha = None
+        else:
+            fecha = record.get(self.date_field) or stem
+            if self.granularity == DIA:
+                clave = ordinal_fecha(fecha)
+            else:
+                clave = clave_periodo(fecha)
+
+        if self.value_fields is None:
+            return clave, record
+
+        item = {} if fecha is None else {self.date_field: fecha}
+        for salida, origen in self.value_fields.items():
+            item[salida] = record.get(origen)
+        if self.packed:
+            # como en serie.bin, que guarda float64
+            item["valor"] = float(item["valor"])
+        return clave, item
+
+    # -------- consultas --------
+
+    def history(self):
+        return self.index()[1]
+
+    def slice(self, desde: int, hasta: int):
+        """Items con clave en [desde, hasta] en O(log n) + tamaño del resultado."""
+        claves, items = self.index()
+        return items[bisect_left(claves, desde) : bisect_right(claves, hasta)]
+
+    def range(self, desde: str, hasta: str):
+        """Rango con desde/hasta como YYYY-MM-DD (diarias) o YYYY-MM (mensuales)."""
+        try:
+            d_desde = _parse_param(desde, self.granularity)
+            d_hasta = _parse_param(hasta, self.granularity)
+        except ValueError:
+            return []
+
+        return self.slice(d_desde, d_hasta)
+
+    def page(self, limit: int, cursor=None, desde=None, hasta=None):
+        """
+        Hasta `limit` puntos posteriores a `cursor`, dentro de [desde, hasta]
+        si se pasan (mismo formato que range()). Devuelve (items, cursor de la
+        página siguiente o None si es la última). Lanza ValueError.
+        """
+        claves, items = self.index()
+
+        inicio = 0
+        if desde is not None:
+            inicio = bisect_left(claves, _parse_param(desde, self.granularity))
+        if cursor is not None:
+            inicio = max(
+                inicio, bisect_right(claves, _parse_param(cursor, self.granularity))
+            )
+
+        fin = len(claves)
+        if hasta is not None:
+            fin = bisect_right(claves, _parse_param(hasta, self.granularity))
+
+        corte = min(fin, inicio + limit)
+        if corte <= inicio:
+            return [], None
+
+        siguiente = None
+        if corte < fin:
+            siguiente = _format_param(claves[corte - 1], self.granularity)
+
+        return items[inicio:corte], siguiente
+
+    def last(self, n: int):
+        """Últimos n puntos."""
+        if n <= 0:
+            return []
+        return self.index()[1][-n:]
+
+    def resample(self, granularity: str):
+        """
+        Lleva una serie diaria a mensual quedándose con el último dato de cada
+        mes. Si la granularidad pedida es la propia, devuelve la serie tal cual.
+        """
+        claves, items = self.index()
+        if granularity == self.granularity:
+            return items
+        if granularity != MES or self.granularity != DIA:
+            raise ValueError(
+                f"No se puede pasar de '{self.granularity}' a '{granularity}'"
+            )
+
+        result = []
+        mes_actual = None
+        for clave, item in zip(claves, items):
+            mes = _clave_mes_de_ordinal(clave)
+            if mes == mes_actual:
+                result[-1] = item
+            else:
+                result.append(item)
+                mes_actual = mes
+
+        return result
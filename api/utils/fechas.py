@@ -0,0 +1,30 @@
+# api/utils/fechas.py
+import re
+
+from flask import request
+
+from api.utils.responses import error
+
+FORMATO_FECHA = re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$")
+
+
+def validar_rango(params_validos):
+    """
+    Valida la query de los endpoints con rango desde/hasta (YYYY-MM-DD).
+    Devuelve el error por parámetros desconocidos o fechas mal formadas, o None.
+    """
+    params_invalidos = set(request.args.keys()) - params_validos
+    if params_invalidos:
+        return error(
+            f"Parámetro(s) no reconocido(s): {', '.join(params_invalidos)}. Parámetros válidos: {', '.join(params_validos)}",
+            400,
+        )
+
+    for nombre in ("desde", "hasta"):
+        valor = request.args.get(nombre)
+        if valor is not None and not FORMATO_FECHA.match(valor):
+            return error(
+                f"El parámetro '{nombre}' debe tener formato YYYY-MM-DD (ej: 2026-03-01)",
+                400,
+            )
+    return None
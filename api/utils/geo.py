@@ -0,0 +1,115 @@
+import math
+
+RADIO_TIERRA_KM = 6371.0088
+# Margen de la caja de búsqueda para el redondeo (~0,1 mm)
+MARGEN_GRADOS = 1e-9
+# Mitad de la circunferencia: ningún punto puede estar más lejos
+DISTANCIA_MAX_KM = math.pi * RADIO_TIERRA_KM
+
+
+def distancia_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Distancia haversine entre dos puntos (grados decimales) en km."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * RADIO_TIERRA_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def leer_coordenadas(args):
+    """
+    Valida lat/lon de un request. Devuelve (lat, lon, mensaje de error o None).
+    """
+    try:
+        lat = float(args.get("lat", ""))
+        lon = float(args.get("lon", ""))
+    except (TypeError, ValueError):
+        return None, None, "Los parámetros 'lat' y 'lon' son requeridos y numéricos"
+
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return None, None, "Coordenadas fuera de rango (lat: -90 a 90, lon: -180 a 180)"
+
+    return lat, lon, None
+
+
+class GrillaEspacial:
+    """
+    Índice espacial por grilla regular: cada punto (lat, lon, valor) se guarda
+    en la celda de `celda` grados que lo contiene. Una búsqueda por radio solo
+    mide la distancia a los puntos de las celdas que cubren el radio.
+    """
+
+    def __init__(self, puntos, celda: float = 0.25):
+        self.celda = celda
+        self.celdas = {}
+        self.total = 0
+
+        for lat, lon, valor in puntos:
+            self.celdas.setdefault(self._celda(lat, lon), []).append((lat, lon, valor))
+            self.total += 1
+
+    def _celda(self, lat: float, lon: float) -> tuple:
+        return math.floor(lat / self.celda), math.floor(lon / self.celda)
+
+    @staticmethod
+    def _caja(lat: float, radio_km: float) -> tuple:
+        """
+        (delta_lat, delta_lon) en grados de la caja que contiene el círculo. En
+        longitud el círculo es más ancho del lado del polo que en `lat`: el
+        máximo es asin(sin(d) / cos(lat)), con d el radio en radianes. Si el
+        círculo llega a un polo abarca todas las longitudes. Usa el mismo
+        radio que distancia_km para no perder puntos justo en el borde.
+        """
+        angulo = radio_km / RADIO_TIERRA_KM
+        delta_lat = math.degrees(angulo) + MARGEN_GRADOS
+
+        cos_lat = math.cos(math.radians(lat))
+        if angulo < math.pi / 2 and math.sin(angulo) < cos_lat:
+            delta_lon = math.degrees(math.asin(math.sin(angulo) / cos_lat))
+            return delta_lat, delta_lon + MARGEN_GRADOS
+        return delta_lat, 360.0
+
+    def cercanos(self, lat: float, lon: float, radio_km: float) -> list:
+        """[(distancia_km, lat, lon, valor)] dentro del radio, del más cercano al más lejano."""
+        delta_lat, delta_lon = self._caja(lat, radio_km)
+
+        fila_min, col_min = self._celda(lat - delta_lat, lon - delta_lon)
+        fila_max, col_max = self._celda(lat + delta_lat, lon + delta_lon)
+
+        if (fila_max - fila_min + 1) * (col_max - col_min + 1) > len(self.celdas):
+            # radio grande: conviene recorrer solo las celdas ocupadas
+            celdas = [
+                puntos
+                for (fila, col), puntos in self.celdas.items()
+                if fila_min <= fila <= fila_max and col_min <= col <= col_max
+            ]
+        else:
+            celdas = [
+                self.celdas.get((fila, col), ())
+                for fila in range(fila_min, fila_max + 1)
+                for col in range(col_min, col_max + 1)
+            ]
+
+        resultado = []
+        for puntos in celdas:
+            for p_lat, p_lon, valor in puntos:
+                distancia = distancia_km(lat, lon, p_lat, p_lon)
+                if distancia <= radio_km:
+                    resultado.append((distancia, p_lat, p_lon, valor))
+
+        resultado.sort(key=lambda x: x[0])
+        return resultado
+
+    def mas_cercanos(self, lat: float, lon: float, n: int, radio_km: float = 10.0):
+        """
+        Los n puntos más cercanos, sin límite de distancia: busca en un radio
+        que se duplica hasta encontrar n puntos. Es exacto porque cercanos()
+        devuelve todos los puntos a distancia <= radio: ninguno de afuera
+        puede estar más cerca que los n encontrados.
+        """
+        while True:
+            resultado = self.cercanos(lat, lon, radio_km)
+            if len(resultado) >= n or radio_km >= DISTANCIA_MAX_KM:
+                return resultado[:n]
+            radio_km *= 2
@@ -0,0 +1,26 @@
+import unicodedata
+from functools import lru_cache
+
+# Los textos que se normalizan salen de conjuntos chicos (provincias,
+# combustibles, ríos, distritos, bloques...), así que casi todos los llamados
+# son aciertos de la caché.
+MAX_CACHE = 4096
+
+
+@lru_cache(maxsize=MAX_CACHE)
+def normalizar(texto: str) -> str:
+    """
+    Clave de comparación para nombres: minúsculas, sin tildes ni diacríticos,
+    guiones como espacios y espacios colapsados ('Río-Negro ' → 'rio negro').
+    """
+    texto = unicodedata.normalize("NFD", texto.lower())
+    texto = "".join(c for c in texto if unicodedata.category(c) != "Mn")
+    return " ".join(texto.replace("-", " ").split())
+
+
+def indexar(registros, campo: str) -> dict:
+    """{valor normalizado de `campo`: [posiciones]} para filtrar con un lookup."""
+    indice = {}
+    for i, registro in enumerate(registros):
+        indice.setdefault(normalizar(registro.get(campo) or ""), []).append(i)
+    return indice
@@ -0,0 +1,24 @@
+# api/utils/numeros.py
+import math
+
+# Los arrays de floats ('d') de los índices guardan los valores faltantes como NaN
+SIN_DATO = float("nan")
+
+
+def a_float(valor) -> float:
+    """Número del JSON para un array 'd'; lo que no es número queda SIN_DATO."""
+    return float(valor) if isinstance(valor, (int, float)) else SIN_DATO
+
+
+def a_json(numero, decimales: int | None = None):
+    """
+    Valor de un array 'd' para la respuesta: None si es NaN, redondeado a
+    `decimales` si se pasa y como int si es entero (como vienen en los JSON).
+    """
+    if math.isnan(numero):
+        return None
+    if decimales is not None:
+        numero = round(numero, decimales)
+    if isinstance(numero, float) and numero.is_integer():
+        return int(numero)
+    return numero
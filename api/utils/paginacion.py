@@ -0,0 +1,81 @@
+from api.utils.responses import error
+
+PARAMS_PAGINACION = {"limit", "cursor", "ultimos"}
+MAX_LIMIT = 1000
+
+
+def _entero_positivo(valor, nombre):
+    try:
+        numero = int(valor)
+    except (TypeError, ValueError):
+        numero = 0
+
+    if numero < 1 or numero > MAX_LIMIT:
+        return None, error(
+            f"El parámetro '{nombre}' debe ser un entero entre 1 y {MAX_LIMIT}", 400
+        )
+    return numero, None
+
+
+def leer_paginacion(args, validar_fecha):
+    """
+    Valida limit/cursor/ultimos de los endpoints de series.
+
+    - ultimos=N: últimos N puntos; no se combina con otros parámetros.
+    - limit=N[&cursor=fecha]: página de N puntos sobre historico=true o
+      desde/hasta, empezando después de `cursor` (mismo formato de fecha
+      que desde/hasta).
+
+    Devuelve (limit, cursor, ultimos, error).
+    """
+    params = set(args.keys())
+    limit = cursor = ultimos = None
+
+    if "ultimos" in params:
+        otros = params - {"ultimos"}
+        if otros:
+            return (
+                None,
+                None,
+                None,
+                error(
+                    f"El parámetro 'ultimos' no se puede combinar con: {', '.join(sorted(otros))}",
+                    400,
+                ),
+            )
+        ultimos, err = _entero_positivo(args.get("ultimos"), "ultimos")
+        return None, None, ultimos, err
+
+    if "cursor" in params and "limit" not in params:
+        return (
+            None,
+            None,
+            None,
+            error(
+                "El parámetro 'cursor' requiere 'limit' (ej: ?historico=true&limit=100&cursor=2024-01-15)",
+                400,
+            ),
+        )
+
+    if "limit" in params:
+        if not params & {"historico", "desde", "hasta"}:
+            return (
+                None,
+                None,
+                None,
+                error(
+                    "El parámetro 'limit' se usa junto con 'historico=true' o 'desde' y 'hasta'",
+                    400,
+                ),
+            )
+        limit, err = _entero_positivo(args.get("limit"), "limit")
+        if err:
+            return None, None, None, err
+
+    if "cursor" in params:
+        cursor = args.get("cursor", "")
+        err = validar_fecha(cursor, "cursor")
+        if err:
+            return None, None, None, err
+
+    return limit, cursor, None, None
@@ -1,9 +1,202 @@
-from flask import jsonify
+import gzip
+import threading
+import zlib
+from collections import OrderedDict
 
+from flask import Response, current_app, jsonify, request
 
-def success(data, status=200):
-    return jsonify({"data": data}), status
+try:
+    import brotli
+except ImportError:  # flask-compress la instala, pero no es obligatoria
+    brotli = None
+
+# Respuestas ya serializadas de los endpoints cacheables; las versiones
+# comprimidas (br/gzip) se agregan recién cuando algún cliente las pide.
+# Clave: (endpoint, params de la ruta y de la query, versión del dataset, status).
+# La caché se limita por bytes (identity + comprimidas de todas las entradas).
+RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+COMPRESS_MIN_SIZE = 500
+
+# Parámetros de query con los que una respuesta se cachea. El resto (rangos,
+# cursores, límites) los elige el cliente: cada combinación sería una entrada
+# nueva, así que esas respuestas se serializan en cada request.
+PARAMS_CACHEABLES = {("historico", "true")}
+
+# Tamaño aproximado de cada chunk en las respuestas streaming
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_response_cache = OrderedDict()
+_response_cache_bytes = 0
+_response_cache_lock = threading.Lock()
+
+
+def success(data, status=200, version=None, paginacion=None):
+    """
+    Respuesta {"data": ...} (más {"paginacion": ...} si se pasa). Si se pasa
+    `version` (firma del dataset) y la query solo tiene PARAMS_CACHEABLES, los
+    bytes finales se cachean y los requests siguientes con los mismos
+    parámetros y la misma versión no vuelven a serializar ni comprimir.
+    """
+    payload = {"data": data}
+    if paginacion is not None:
+        payload["paginacion"] = paginacion
+
+    if version is None or not _cacheable():
+        return jsonify(payload), status
+
+    key = (
+        request.endpoint,
+        tuple(sorted((request.view_args or {}).items())),
+        tuple(sorted(request.args.items(multi=True))),
+        version,
+        status,
+    )
+
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is not None:
+            _response_cache.move_to_end(key)
+            body = entry["identity"]
+
+    if entry is None:
+        body = current_app.json.response(payload).get_data()
+        _cachear(key, "identity", body)
+
+    return _cached_response(key, body, status)
+
+
+def clear_response_cache():
+    global _response_cache_bytes
+    with _response_cache_lock:
+        _response_cache.clear()
+        _response_cache_bytes = 0
+
+
+def _cacheable() -> bool:
+    return all(param in PARAMS_CACHEABLES for param in request.args.items(multi=True))
+
+
+def _cachear(key, encoding: str, body: bytes):
+    """Agrega una codificación a la entrada `key` y desaloja las más viejas."""
+    global _response_cache_bytes
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            if encoding != "identity":
+                return  # la entrada se desalojó mientras se comprimía
+            entry = _response_cache[key] = {}
+        elif encoding in entry:
+            return
+
+        entry[encoding] = body
+        _response_cache_bytes += len(body)
+
+        while _response_cache_bytes > RESPONSE_CACHE_MAX_BYTES:
+            _, desalojada = _response_cache.popitem(last=False)
+            _response_cache_bytes -= sum(len(b) for b in desalojada.values())
+
+
+def success_stream(items, status=200):
+    """
+    Variante de success() para listas grandes: codifica y comprime de a
+    chunks a medida que se recorre `items`, sin armar el JSON completo en
+    memoria. Solo con STREAM_RESPONSES activo (gunicorn); en Lambda apig-wsgi
+    junta el body entero igual, así que se responde con success().
+    """
+    if not current_app.config.get("STREAM_RESPONSES"):
+        return success(list(items), status)
+
+    algorithm = request.accept_encodings.best_match(
+        ["br", "gzip"] if brotli is not None else ["gzip"]
+    )
+
+    response = Response(
+        _compress_stream(_encode_stream(items, current_app.json.dumps), algorithm),
+        status=status,
+        mimetype="application/json",
+    )
+    response.headers["Vary"] = "Accept-Encoding"
+    if algorithm:
+        response.headers["Content-Encoding"] = algorithm
+
+    return response
 
 
 def error(message, status=400):
     return jsonify({"error": message}), status
+
+
+def _compress(body: bytes, algorithm: str) -> bytes:
+    if algorithm == "br":
+        return brotli.compress(body, quality=4)
+    return gzip.compress(body, compresslevel=6)
+
+
+def _cached_response(key, body: bytes, status: int) -> Response:
+    """Respuesta con la codificación que acepta el cliente, comprimida una vez."""
+    algorithm = None
+    if len(body) >= COMPRESS_MIN_SIZE:
+        algorithm = request.accept_encodings.best_match(
+            ["br", "gzip"] if brotli is not None else ["gzip"]
+        )
+
+    if algorithm:
+        with _response_cache_lock:
+            compressed = (_response_cache.get(key) or {}).get(algorithm)
+        if compressed is None:
+            compressed = _compress(body, algorithm)
+            _cachear(key, algorithm, compressed)
+        body = compressed
+
+    response = Response(body, status=status, mimetype="application/json")
+    response.headers["Vary"] = "Accept-Encoding"
+    if algorithm:
+        # flask-compress no recomprime respuestas con Content-Encoding
+        response.headers["Content-Encoding"] = algorithm
+
+    return response
+
+
+def _encode_stream(items, dumps):
+    """
+    Genera {"data": [...]} en chunks de ~STREAM_CHUNK_SIZE bytes. Recibe
+    `dumps` ya resuelto porque el generador corre fuera del app context.
+    """
+    buffer = ['{"data":[']
+    size = 0
+    first = True
+
+    for item in items:
+        chunk = dumps(item)
+        buffer.append(chunk if first else "," + chunk)
+        size += len(chunk)
+        first = False
+
+        if size >= STREAM_CHUNK_SIZE:
+            yield "".join(buffer).encode("utf-8")
+            buffer = []
+            size = 0
+
+    buffer.append("]}\n")
+    yield "".join(buffer).encode("utf-8")
+
+
+def _compress_stream(chunks, algorithm):
+    if algorithm is None:
+        yield from chunks
+        return
+
+    if algorithm == "br":
+        compressor = brotli.Compressor(quality=4)
+        for chunk in chunks:
+            yield compressor.process(chunk)
+        yield compressor.finish()
+        return
+
+    # gzip: wbits=31 agrega header y trailer gzip
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
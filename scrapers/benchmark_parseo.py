@@ -0,0 +1,69 @@
+"""
+Micro-benchmark del parseo de HTML: html.parser sobre el documento completo
+(como parseaban antes los scrapers) contra parsear_html() de utils.py.
+
+    python scrapers/benchmark_parseo.py [--solo table] [--repeticiones 20] pagina.html ...
+
+Sin archivos usa una página sintética con el formato de combustibles.ar
+(navegación, scripts y una tabla de 50 filas). Para medir con páginas reales
+guardarlas antes, ej: curl -s https://combustibles.ar/precios/chaco > chaco.html
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from utils import PARSER_HTML, parsear_html
+
+FILA = (
+    "<tr><td><a href='/empresa/shell'>SHELL</a></td>"
+    "<td><a href='/localidad/{n}'>LOCALIDAD {n}</a></td>"
+    "<td><span>Dirección:</span>AV. SIEMPRE VIVA {n}</td>"
+    "<td><a href='/combustible/nafta'>Nafta Súper</a></td>"
+    "<td>Precio:$1.899 (Día)$1.950 (Noche)</td>"
+    "<td>Fecha:16/05/2026</td></tr>"
+)
+
+
+def pagina_sintetica(filas=50):
+    nav = "".join(f"<li><a href='/p/{n}'>Link {n}</a></li>" for n in range(300))
+    scripts = "<script>var x = 1;</script>" * 30
+    tabla = "".join(FILA.format(n=n) for n in range(filas))
+    return (
+        f"<html><head>{scripts}</head><body><nav><ul>{nav}</ul></nav>"
+        f"<table><thead><tr><th>Empresa</th></tr></thead><tbody>{tabla}</tbody></table>"
+        f"<footer>{nav}</footer></body></html>"
+    )
+
+
+def medir(funcion, repeticiones):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("archivos", nargs="*", type=Path)
+    parser.add_argument("--solo", default="table", help="tag a parsear (SoupStrainer)")
+    parser.add_argument("--repeticiones", type=int, default=20)
+    args = parser.parse_args()
+
+    paginas = [(f.name, f.read_text(encoding="utf-8")) for f in args.archivos]
+    if not paginas:
+        paginas = [("sintética (combustibles, 50 filas)", pagina_sintetica())]
+
+    print(f"Parser rápido: {PARSER_HTML} | solo: <{args.solo}>")
+    print(f"{'página':40} {'antes (ms)':>12} {'completo':>12} {'solo':>12}")
+
+    for nombre, html in paginas:
+        antes = medir(lambda: BeautifulSoup(html, "html.parser"), args.repeticiones)
+        completo = medir(lambda: parsear_html(html), args.repeticiones)
+        solo = medir(lambda: parsear_html(html, args.solo), args.repeticiones)
+        print(f"{nombre[:40]:40} {antes:12.2f} {completo:12.2f} {solo:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Cambios de precios entre snapshots consecutivos de combustibles.
+
+Por cada snapshot nuevo se guarda data/combustibles/cambios/YYYY-MM-DD.json
+con las estaciones-combustible que subieron, bajaron, cambiaron, aparecieron
+o desaparecieron respecto del snapshot anterior.
+
+Para generar los cambios de todos los snapshots ya guardados:
+
+    python scrapers/cambios_combustibles.py
+"""
+
+import json
+import os
+from pathlib import Path
+
+from utils import id_estacion
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data" / "combustibles"
+CAMBIOS_DIR = DATA_DIR / "cambios"
+
+CAMPOS_ESTACION = ("provincia", "empresa", "localidad", "direccion")
+
+
+def _clave(registro):
+    id_ = registro.get("id_estacion") or id_estacion(
+        *(registro.get(c) for c in CAMPOS_ESTACION)
+    )
+    return id_, registro.get("combustible")
+
+
+def _tipo(anteriores, nuevos):
+    """sube / baja / cambia según cómo se movieron los precios de cada franja."""
+    subas = bajas = 0
+    for franja in set(anteriores) | set(nuevos):
+        antes, ahora = anteriores.get(franja), nuevos.get(franja)
+        if antes is None or ahora is None:
+            return "cambia"
+        subas += ahora > antes
+        bajas += ahora < antes
+
+    if subas and not bajas:
+        return "sube"
+    if bajas and not subas:
+        return "baja"
+    return "cambia"
+
+
+def calcular_cambios(anterior, nuevo):
+    """
+    Compara dos snapshots (listas de registros) por (id_estacion, combustible).
+    Devuelve la lista de cambios, ordenada por provincia, empresa y estación.
+    """
+    previos = {_clave(r): r for r in anterior}
+    actuales = {_clave(r): r for r in nuevo}
+
+    cambios = []
+
+    for clave, registro in actuales.items():
+        previo = previos.get(clave)
+        precios = registro.get("precios") or {}
+
+        if previo is None:
+            tipo, precios_anteriores = "nueva", None
+        else:
+            precios_anteriores = previo.get("precios") or {}
+            if precios_anteriores == precios:
+                continue
+            tipo = _tipo(precios_anteriores, precios)
+
+        cambios.append(_cambio(tipo, clave, registro, precios_anteriores, precios))
+
+    for clave, previo in previos.items():
+        if clave not in actuales:
+            cambios.append(
+                _cambio("eliminada", clave, previo, previo.get("precios") or {}, None)
+            )
+
+    cambios.sort(
+        key=lambda c: (c["provincia"] or "", c["empresa"] or "", c["id_estacion"])
+    )
+    return cambios
+
+
+def _cambio(tipo, clave, registro, precios_anteriores, precios):
+    id_, combustible = clave
+    return {
+        "tipo": tipo,
+        "id_estacion": id_,
+        **{campo: registro.get(campo) for campo in CAMPOS_ESTACION},
+        "combustible": combustible,
+        "precios_anteriores": precios_anteriores,
+        "precios": precios,
+    }
+
+
+def guardar_cambios(fecha_anterior, anterior, fecha, nuevo):
+    """Escribe cambios/<fecha>.json (de forma atómica)."""
+    cambios = calcular_cambios(anterior, nuevo)
+
+    resumen = {"sube": 0, "baja": 0, "cambia": 0, "nueva": 0, "eliminada": 0}
+    for cambio in cambios:
+        resumen[cambio["tipo"]] += 1
+
+    data = {
+        "desde": fecha_anterior,
+        "hasta": fecha,
+        "resumen": resumen,
+        "cambios": cambios,
+    }
+
+    CAMBIOS_DIR.mkdir(parents=True, exist_ok=True)
+    path = CAMBIOS_DIR / f"{fecha}.json"
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+    print(f"🔁 {len(cambios)} cambios entre {fecha_anterior} y {fecha}")
+
+
+def ultimo_snapshot(antes_de):
+    """(fecha, registros) del último YYYY-MM-DD.json anterior a `antes_de`."""
+    fechas = sorted(
+        f.stem for f in DATA_DIR.glob("????-??-??.json") if f.stem < antes_de
+    )
+    if not fechas:
+        return None, None
+
+    with (DATA_DIR / f"{fechas[-1]}.json").open("r", encoding="utf-8") as f:
+        return fechas[-1], json.load(f)
+
+
+def backfill():
+    """Genera los cambios de todos los pares de snapshots consecutivos."""
+    fechas = sorted(f.stem for f in DATA_DIR.glob("????-??-??.json"))
+    anterior = None
+
+    for fecha in fechas:
+        with (DATA_DIR / f"{fecha}.json").open("r", encoding="utf-8") as f:
+            nuevo = json.load(f)
+        if anterior is not None:
+            guardar_cambios(anterior[0], anterior[1], fecha, nuevo)
+        anterior = (fecha, nuevo)
+
+
+if __name__ == "__main__":
+    backfill()
@@ -8,7 +8,7 @@ import tempfile
 from calendar import monthrange
 
 import pdfplumber
-from bs4 import BeautifulSoup
+from utils import parsear_html
 
 INDEC_PAGE = "https://www.indec.gob.ar/Nivel3/Tema/4/43"
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data", "canasta")
@@ -83,7 +83,7 @@ def _get_pdf_url() -> str:
         capture_output=True,
         timeout=30,
     )
-    soup = BeautifulSoup(result.stdout, "html.parser")
+    soup = parsear_html(result.stdout, "a")
     hrefs = [a["href"] for a in soup.find_all("a", href=True)]
 
     for pattern in _PDF_PATTERNS:
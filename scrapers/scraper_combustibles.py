@@ -1,8 +1,15 @@
-import requests
-from bs4 import BeautifulSoup
-import time
+import os
 import re
-from utils import save_dataset_json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from cambios_combustibles import guardar_cambios, ultimo_snapshot
+from utils import (
+    LimitadorDeRitmo,
+    id_estacion,
+    parsear_html,
+    save_dataset_json,
+    sesion_por_hilo,
+)
 
 # CONFIGURACIÓN
 
@@ -37,6 +44,17 @@ BASE_URL = "https://combustibles.ar/precios"
 
 HEADERS = {"User-Agent": "Mozilla/5.0 (FuelScraper/1.0)"}
 
+# Provincias en paralelo y ritmo máximo contra combustibles.ar (todas juntas).
+# El scraper secuencial original esperaba 1 s más la latencia de cada página
+# (~0,6 requests por segundo). Por defecto se permiten 2 por segundo, una cada
+# 500 ms: unas 3 veces más rápido sin pasar de un cliente que navega. Con tres
+# hilos siempre hay un request listo aunque cada página tarde más de 1 s.
+# Se pueden ajustar con COMBUSTIBLES_HILOS y COMBUSTIBLES_REQUESTS_POR_SEGUNDO.
+MAX_WORKERS = int(os.environ.get("COMBUSTIBLES_HILOS", "3"))
+REQUESTS_POR_SEGUNDO = float(os.environ.get("COMBUSTIBLES_REQUESTS_POR_SEGUNDO", "2"))
+
+LIMITADOR = LimitadorDeRitmo(REQUESTS_POR_SEGUNDO)
+
 
 # HELPERS
 
@@ -84,11 +102,11 @@ def make_key(provincia, empresa, localidad, direccion, combustible):
 
 # SCRAPER
 
-resultados = {}
-resultados.clear()  # IMPORTANTE para entornos persistentes
 
-for provincia in PROVINCIAS:
-    print(f"\n=== PROVINCIA: {provincia.upper()} ===")
+def scrapear_provincia(provincia):
+    """Recorre todas las páginas de una provincia. Devuelve {clave: registro}."""
+    session = sesion_por_hilo(HEADERS)
+    resultados = {}
     page = 1
 
     while True:
@@ -99,11 +117,12 @@ for provincia in PROVINCIAS:
 
         print(f"Scrapeando: {url}")
 
-        resp = requests.get(url, headers=HEADERS, timeout=10)
+        LIMITADOR.esperar()  # para no saturar el sitio
+        resp = session.get(url, timeout=10)
         if resp.status_code != 200:
             break
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = parsear_html(resp.text, "table")
         rows = soup.select("table tbody tr")
 
         if not rows:
@@ -133,6 +152,8 @@ for provincia in PROVINCIAS:
             )
 
             resultados[key] = {
+                # la estación sin el combustible: el mismo ID en todos sus precios
+                "id_estacion": id_estacion(*key[:4]),
                 "provincia": provincia,
                 "empresa": empresa,
                 "localidad": localidad,
@@ -143,8 +164,34 @@ for provincia in PROVINCIAS:
             }
 
         page += 1
-        time.sleep(1)  # para no saturar el sitio
 
-# EXPORTAR JSON (REEMPLAZA SIEMPRE)
+    print(f"=== {provincia.upper()}: {len(resultados)} registros ===")
+    return resultados
+
+
+def main():
+    resultados = {}
+
+    # Las provincias se scrapean en paralelo; el limitador reparte el ritmo
+    # de requests entre todos los hilos. map() devuelve en el orden de
+    # PROVINCIAS, así que la salida es la misma que en secuencial.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for por_provincia in executor.map(scrapear_provincia, PROVINCIAS):
+            resultados.update(por_provincia)
+
+    # EXPORTAR JSON (REEMPLAZA SIEMPRE)
+
+    hoy = date.today().isoformat()
+    fecha_anterior, anterior = ultimo_snapshot(antes_de=hoy)
+    datos = list(resultados.values())
+
+    save_dataset_json(dataset="combustibles", data=datos)
+
+    # CAMBIOS RESPECTO DEL SNAPSHOT ANTERIOR
+
+    if anterior is not None:
+        guardar_cambios(fecha_anterior, anterior, hoy, datos)
+
 
-save_dataset_json(dataset="combustibles", data=list(resultados.values()))
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,9 @@
-from bs4 import BeautifulSoup
 import requests
 import re
 import json
 import os
 from datetime import datetime
-from utils import save_dataset_json
+from utils import parsear_html, save_dataset_json
 
 # Configuración
 URL = "https://www.indec.gob.ar/Nivel4/Tema/3/5/33"
@@ -35,7 +34,7 @@ def normalizar_fecha(fecha: str | None) -> str | None:
 
 response = requests.get(URL, headers=HEADERS, timeout=20)
 response.raise_for_status()
-soup = BeautifulSoup(response.text, "html.parser")
+soup = parsear_html(response.text)
 
 # 1. Periodo del dato (Mes vencido)
 texto_pagina = soup.get_text()
@@ -1,20 +1,22 @@
-import requests
 import urllib3
-from utils import save_dataset_json, formatear_fecha_bcra
+from utils import SIN_CAMBIOS, EstadoHTTP, save_dataset_json, formatear_fecha_bcra
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 ICL_ID = "7988"
 
 
-def obtener_icl_actual():
+def obtener_icl_actual(estado):
     url = "https://www.bcra.gob.ar/api/endpoints/principales-variables-ultimas.php"
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     }
 
     try:
-        response = requests.get(url, headers=headers, verify=False)
+        response = estado.get(url, headers=headers, verify=False)
+        if response is None:
+            return SIN_CAMBIOS
+
         response.raise_for_status()
         data = response.json()
 
@@ -49,7 +51,13 @@ def merge_icl(historico, nuevo_dato):
 
 
 if __name__ == "__main__":
+    estado = EstadoHTTP("icl")
+    icl_data = obtener_icl_actual(estado)
+    if icl_data is SIN_CAMBIOS:
+        print("ℹ ICL sin cambios en el BCRA, no se guarda")
+        exit(0)
+
     historico = []
-    icl_data = obtener_icl_actual()
     historico = merge_icl(historico, icl_data)
     save_dataset_json(dataset="icl", data=historico)
+    estado.guardar()
@@ -1,8 +1,7 @@
 import json
-import requests
 from datetime import datetime, timedelta
 from pathlib import Path
-from utils import save_dataset_json
+from utils import SIN_CAMBIOS, EstadoHTTP, save_dataset_json
 
 BCRA_V4_URL = "https://api.bcra.gob.ar/estadisticas/v4.0/Monetarias/40"
 TIMEOUT = 15
@@ -11,17 +10,19 @@ LATEST_PATH = (
 )
 
 
-def obtener_icl_adelanto():
+def obtener_icl_adelanto(estado):
     hoy = datetime.now().date()
-    desde = hoy.strftime("%Y-%m-%d")
-    hasta = (hoy + timedelta(days=20)).strftime("%Y-%m-%d")
+    desde = hoy.isoformat()
+    hasta = (hoy + timedelta(days=20)).isoformat()
 
     try:
-        resp = requests.get(
+        resp = estado.get(
             BCRA_V4_URL,
             params={"Desde": desde, "Hasta": hasta},
             timeout=TIMEOUT,
         )
+        if resp is None:
+            return SIN_CAMBIOS
         resp.raise_for_status()
         data = resp.json()
     except Exception as e:
@@ -35,10 +36,11 @@ def obtener_icl_adelanto():
 
     detalle = resultados[0].get("detalle", [])
 
+    # fechas ISO: la comparación de strings respeta el orden cronológico
     futuros = [
         {"fecha": item["fecha"], "valor": item["valor"]}
         for item in detalle
-        if datetime.strptime(item["fecha"], "%Y-%m-%d").date() > hoy
+        if item["fecha"][:10] > desde
     ]
 
     futuros.sort(key=lambda x: x["fecha"])
@@ -57,7 +59,12 @@ def cargar_fechas_existentes() -> set[str]:
 
 
 if __name__ == "__main__":
-    nuevos = obtener_icl_adelanto()
+    estado = EstadoHTTP("icl_adelanto")
+    nuevos = obtener_icl_adelanto(estado)
+
+    if nuevos is SIN_CAMBIOS:
+        print("ℹ La proyección del BCRA no cambió, no se procesa")
+        exit(0)
 
     if not nuevos:
         print("ℹ Sin proyección disponible todavía, no se actualiza")
@@ -68,9 +75,11 @@ if __name__ == "__main__":
 
     if fechas_nuevas <= fechas_existentes:
         print("ℹ No hay fechas nuevas en la proyección, se omite el guardado")
+        estado.guardar()
         exit(0)
 
     save_dataset_json(dataset="icl_adelanto", data=nuevos)
+    estado.guardar()
     print(
         f"✔ ICL adelanto actualizado: {len(nuevos)} valores futuros "
         f"({nuevos[0]['fecha']} a {nuevos[-1]['fecha']})"
@@ -1,9 +1,7 @@
-from bs4 import BeautifulSoup
-import requests
 import re
 import json
 from pathlib import Path
-from utils import save_dataset_json
+from utils import EstadoHTTP, parsear_html, save_dataset_json
 
 ARCHIVO_JSON = "ipc_historico.json"
 
@@ -79,10 +77,14 @@ MESES = {
 
 # REQUEST
 
-response = requests.get(URL, headers=HEADERS, timeout=20)
+estado = EstadoHTTP("ipc")
+response = estado.get(URL, headers=HEADERS, timeout=20)
+if response is None:
+    print("ℹ La página del INDEC no cambió, no se procesa")
+    exit(0)
 response.raise_for_status()
 
-soup = BeautifulSoup(response.text, "html.parser")
+soup = parsear_html(response.text)
 
 # FECHA DE PUBLICACIÓN
 
@@ -164,3 +166,5 @@ if not ya_existe:
     save_dataset_json(dataset="ipc", data=[resultado])
 else:
     print("ℹ El registro ya existe, no se agregó")
+
+estado.guardar()
@@ -13,6 +13,7 @@ import time
 from datetime import datetime
 
 from bs4 import BeautifulSoup
+from utils import parsear_html
 
 BASE_URL = "https://www.argentina.gob.ar"
 LIST_URL = f"{BASE_URL}/seguridad/personasextraviadas"
@@ -55,7 +56,7 @@ def _fetch(url: str, retries: int = 3, delay: float = 1.5) -> bytes:
 def _get_total_pages() -> int:
     """Determina cuántas páginas tiene el listado."""
     html = _fetch(LIST_URL)
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parsear_html(html, "a")
 
     # Los links de paginación tienen el patrón ?page=N
     page_links = soup.select("a[href*='page=']")
@@ -74,7 +75,7 @@ def _parse_list_page(html: bytes) -> list[dict]:
     Extrae los slugs y nombres de una página del listado.
     Devuelve lista de {"nombre": str, "url": str, "slug": str}
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parsear_html(html, "a")
     personas = []
 
     for a in soup.select("a[href^='/persona-buscada/']"):
@@ -392,7 +393,7 @@ def _scrape_detalle(stub: dict) -> dict:
     except ConnectionError:
         return fallback
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parsear_html(html)
 
     fecha = _extraer_fecha_desaparicion(soup)
     anio = int(fecha[:4]) if fecha else None
@@ -1,10 +1,9 @@
 import os
 import requests
-from bs4 import BeautifulSoup
 from datetime import datetime, timezone
 from collections import defaultdict
 import urllib3
-from utils import save_dataset_json
+from utils import SIN_CAMBIOS, EstadoHTTP, parsear_html, save_dataset_json
 
 # Desactivar advertencias, aunque ScraperAPI maneja el SSL, es buena práctica mantenerlo
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -76,7 +75,7 @@ def normalizar_estado(raw):
     return "s/e", raw_clean
 
 
-def obtener_estado_rios():
+def obtener_estado_rios(estado):
     if not SCRAPERAPI_KEY:
         print("Error: No se encontró la variable SCRAPERAPI_KEY")
         return None
@@ -99,9 +98,17 @@ def obtener_estado_rios():
 
     try:
         # Llamamos a ScraperAPI, no directamente a Prefectura
-        res = requests.get(
-            "http://api.scraperapi.com", params=payload, headers=headers, timeout=60
+        # ScraperAPI no siempre reenvía los headers condicionales: el estado
+        # se guarda por la URL de Prefectura y compara también el contenido
+        res = estado.get(
+            "http://api.scraperapi.com",
+            clave=TARGET_URL,
+            params=payload,
+            headers=headers,
+            timeout=60,
         )
+        if res is None:
+            return SIN_CAMBIOS
 
         if res.status_code != 200:
             print(f"Error en la petición: Status {res.status_code}")
@@ -112,7 +119,7 @@ def obtener_estado_rios():
         print(f"Error de conexión con ScraperAPI: {e}")
         return None
 
-    soup = BeautifulSoup(res.text, "html.parser")
+    soup = parsear_html(res.text, "table")
     table = soup.find("table")
 
     if not table:
@@ -207,9 +214,13 @@ def obtener_estado_rios():
 
 
 if __name__ == "__main__":
-    data = obtener_estado_rios()
-    if data:
+    estado = EstadoHTTP("rios")
+    data = obtener_estado_rios(estado)
+    if data is SIN_CAMBIOS:
+        print("ℹ Las alturas de Prefectura no cambiaron, no se guarda")
+    elif data:
         save_dataset_json(dataset="rios", data=[data])
+        estado.guardar()
     else:
         # Forzamos error para que GitHub Actions te avise
         exit(1)
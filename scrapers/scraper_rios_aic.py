@@ -50,13 +50,16 @@ dejaron AFUERA a propósito. Antes de sumar una estación nueva, confirmá
 con la AIC: https://www.aic.gob.ar/sitio/contacto.aspx
 """
 
+import json
 import re
 import time
-import requests
-from bs4 import BeautifulSoup
-from utils import save_dataset_json
+from pathlib import Path
+from utils import SIN_CAMBIOS, EstadoHTTP, parsear_html, save_dataset_json
 
 BASE_URL = "https://www.aic.gob.ar/sitio/estaciones-detalle"
+LATEST_PATH = (
+    Path(__file__).resolve().parents[1] / "data" / "rios_comahue" / "latest.json"
+)
 HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -127,16 +130,33 @@ def _parse_numero(valor_raw: str):
     return float(match.group(0).replace(",", "."))
 
 
-def obtener_estacion(estacion: dict) -> dict | None:
+def _estaciones_previas() -> dict:
+    """{estacion_id: registro} del último latest.json guardado."""
+    try:
+        with LATEST_PATH.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {
+        registro["estacion_id"]: registro
+        for registros in data.get("rios", {}).values()
+        for registro in registros
+    }
+
+
+def obtener_estacion(estacion: dict, estado: EstadoHTTP) -> dict | None:
     url = f"{BASE_URL}?a={estacion['id']}&z={estacion['z']}"
     try:
-        resp = requests.get(
+        resp = estado.get(
             url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=False
         )
     except Exception as e:
         print(f"⚠ Estación {estacion['id']} ({estacion['nombre']}): error de red: {e}")
         return None
 
+    if resp is None:
+        return SIN_CAMBIOS
+
     if resp.status_code == 302:
         print(
             f"⚠ Estación {estacion['id']} ({estacion['nombre']}): redirigió a "
@@ -149,7 +169,7 @@ def obtener_estacion(estacion: dict) -> dict | None:
         print(f"⚠ Estación {estacion['id']} ({estacion['nombre']}): HTTP {resp.status_code}")
         return None
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = parsear_html(resp.text)
 
     valores = {campo: SIN_DATO for campo in CAMPOS_ESTANDAR}
     mediciones_originales = []  # todo lo que reportó la estación, sin filtrar
@@ -217,7 +237,12 @@ def obtener_estacion(estacion: dict) -> dict | None:
     }
 
 
-def obtener_rios_aic() -> dict:
+def obtener_rios_aic(estado: EstadoHTTP) -> dict:
+    """
+    Las estaciones cuya página no cambió desde la última corrida se toman del
+    latest.json anterior sin volver a parsearlas. Si no cambió ninguna,
+    devuelve SIN_CAMBIOS.
+    """
     resultado = {
         "fuente": "AIC - Autoridad Interjurisdiccional de Cuencas",
         "url_fuente": "https://www.aic.gob.ar/sitio/estaciones",
@@ -234,11 +259,19 @@ def obtener_rios_aic() -> dict:
         "rios": {},
     }
 
+    previas = _estaciones_previas()
+    hubo_cambios = False
+
     for rio, estaciones in ESTACIONES.items():
         lista_rio = []
         for est in estaciones:
-            datos = obtener_estacion(est)
+            datos = obtener_estacion(est, estado)
             time.sleep(0.5)  # cortesía al servidor
+            if datos is SIN_CAMBIOS:
+                if est["id"] in previas:
+                    lista_rio.append(previas[est["id"]])
+                continue
+            hubo_cambios = True
             if datos is None:
                 continue
             lista_rio.append(
@@ -252,14 +285,22 @@ def obtener_rios_aic() -> dict:
             )
         resultado["rios"][rio] = lista_rio
 
+    if not hubo_cambios:
+        return SIN_CAMBIOS
+
     return resultado
 
 
 if __name__ == "__main__":
-    data = obtener_rios_aic()
+    estado = EstadoHTTP("rios_comahue")
+    data = obtener_rios_aic(estado)
+    if data is SIN_CAMBIOS:
+        print("ℹ Ninguna estación de la AIC cambió, no se guarda")
+        exit(0)
     total = sum(len(v) for v in data["rios"].values())
     if total == 0:
         print("❌ No se obtuvo ningún dato de ninguna estación, no se guarda")
         exit(1)
     save_dataset_json(dataset="rios_comahue", data=data)
+    estado.guardar()
     print(f"✔ Rios Comahue actualizado: {total} estaciones con datos")
\ No newline at end of file
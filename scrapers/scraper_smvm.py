@@ -1,9 +1,9 @@
 import requests
 import csv
 import json
-from datetime import datetime
 from pathlib import Path
 from decimal import Decimal, ROUND_HALF_UP
+from utils import fecha_iso_a_publica
 
 URL = "https://infra.datos.gob.ar/catalog/sspm/dataset/57/distribution/57.1/download/indice-salario-minimo-vital-movil-valores-mensuales-pesos-corrientes-desde-1988.csv"
 
@@ -39,12 +39,12 @@ def parsear_csv(texto_csv: str):
 
     for row in reader:
         try:
-            fecha_dt = datetime.strptime(row["indice_tiempo"], "%Y-%m-%d")
+            fecha_iso = row["indice_tiempo"][:10]
 
             registros.append(
                 {
-                    "fecha_dt": fecha_dt,
-                    "vigente_desde": fecha_dt.strftime("%d/%m/%Y"),
+                    "fecha_iso": fecha_iso,
+                    "vigente_desde": fecha_iso_a_publica(fecha_iso),
                     "smvm": a_dos_decimales(row["salario_minimo_vital_movil_mensual"]),
                     "smvm_dia": a_dos_decimales(
                         row["salario_minimo_vital_movil_diario"]
@@ -60,8 +60,8 @@ def parsear_csv(texto_csv: str):
     if not registros:
         raise ValueError("No se pudieron parsear registros del CSV")
 
-    # ordenar por fecha descendente
-    registros.sort(key=lambda x: x["fecha_dt"], reverse=True)
+    # ordenar por fecha descendente (ISO ordena igual que cronológicamente)
+    registros.sort(key=lambda x: x["fecha_iso"], reverse=True)
 
     return registros[0]
 
@@ -106,7 +106,7 @@ def main():
     ultimo = parsear_csv(csv_text)
 
     # limpiar campo auxiliar
-    ultimo.pop("fecha_dt")
+    fecha_file = ultimo.pop("fecha_iso")
     ultimo["fuente"] = FUENTE
 
     print("✔ Último SMVM detectado:")
@@ -129,10 +129,6 @@ def main():
     # ------------------------
     # VERSIONADO
     # ------------------------
-    fecha_file = datetime.strptime(ultimo["vigente_desde"], "%d/%m/%Y").strftime(
-        "%Y-%m-%d"
-    )
-
     version_file = DATA_DIR / f"{fecha_file}.json"
 
     guardar_json(version_file, ultimo)
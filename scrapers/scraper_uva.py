@@ -1,20 +1,22 @@
-import requests
 import urllib3
-from utils import save_dataset_json, formatear_fecha_bcra
+from utils import SIN_CAMBIOS, EstadoHTTP, save_dataset_json, formatear_fecha_bcra
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 UVA_ID = "7913"
 
 
-def obtener_uva_actual():
+def obtener_uva_actual(estado):
     url = "https://www.bcra.gob.ar/api/endpoints/principales-variables-ultimas.php"
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     }
 
     try:
-        response = requests.get(url, headers=headers, verify=False)
+        response = estado.get(url, headers=headers, verify=False)
+        if response is None:
+            return SIN_CAMBIOS
+
         response.raise_for_status()
         serie = response.json().get("series", {}).get(UVA_ID)
 
@@ -48,7 +50,13 @@ def merge_uva(historico, nuevo):
 
 
 if __name__ == "__main__":
+    estado = EstadoHTTP("uva")
+    uva_data = obtener_uva_actual(estado)
+    if uva_data is SIN_CAMBIOS:
+        print("ℹ UVA sin cambios en el BCRA, no se guarda")
+        exit(0)
+
     historico = []
-    uva_data = obtener_uva_actual()
     historico = merge_uva(historico, uva_data)
     save_dataset_json(dataset="uva", data=historico)
+    estado.guardar()
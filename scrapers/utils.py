@@ -1,12 +1,280 @@
 from pathlib import Path
 from datetime import date
+from array import array
+import hashlib
 import json
-from datetime import datetime
+import os
+import struct
+import sys
+import threading
+import time
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+
+    PARSER_HTML = "lxml"
+except ImportError:  # sin lxml se usa el parser de la stdlib
+    PARSER_HTML = "html.parser"
+
+# Series diarias (fecha DD/MM/YYYY + valor) que además del JSON por día
+# mantienen un archivo empaquetado con todo el histórico. La API lo lee con
+# TimeSeries._read_packed (api/services/timeseries.py), que repite el formato;
+# test/test_serie_empaquetada.py verifica que los dos lados coincidan.
+SERIES_EMPAQUETADAS = {"cer", "icl", "uva", "uvi"}
+
+SERIE_ARCHIVO = "serie.bin"
+SERIE_MAGIC = b"ARG1"
+SERIE_HEADER = struct.Struct("<4sI")
+
+
+# Las fechas se normalizan una sola vez al ingerirlas: ISO (YYYY-MM-DD) o
+# número de día (date.toordinal()). DD/MM/YYYY es solo el formato público
+# que se escribe en los JSON.
+
+
+def fecha_iso_a_publica(fecha_iso):
+    """Convierte YYYY-MM-DD (o YYYY-MM-DDThh:mm...) a DD/MM/YYYY."""
+    anio, mes, dia = fecha_iso[:10].split("-")
+    return f"{dia}/{mes}/{anio}"
 
 
 def formatear_fecha_bcra(fecha_str):
     """Convierte fecha de YYYY-MM-DD a DD/MM/YYYY."""
-    return datetime.strptime(fecha_str, "%Y-%m-%d").strftime("%d/%m/%Y")
+    return fecha_iso_a_publica(fecha_str)
+
+
+def _ordinal_desde_fecha(fecha_str):
+    """Convierte DD/MM/YYYY o YYYY-MM-DD al número de día (date.toordinal())."""
+    if "/" in fecha_str:
+        dia, mes, anio = fecha_str.split("/")
+    else:
+        anio, mes, dia = fecha_str[:10].split("-")
+    return date(int(anio), int(mes), int(dia)).toordinal()
+
+
+def id_estacion(provincia, empresa, localidad, direccion):
+    """
+    ID estable de una estación de combustible: hash de su clave lógica
+    (make_key sin el combustible). La API usa la misma fórmula para los
+    snapshots que no lo tienen.
+    """
+    clave = "|".join(v or "" for v in (provincia, empresa, localidad, direccion))
+    return hashlib.blake2b(clave.encode("utf-8"), digest_size=6).hexdigest()
+
+
+def leer_serie_empaquetada(path: Path) -> dict:
+    """
+    Lee data/<dataset>/serie.bin y devuelve {ordinal: valor}.
+
+    Formato (little-endian):
+      "ARG1" | n (uint32) | n ordinales (int32) | n valores (float64)
+
+    Los valores se guardan como float aunque la fuente los publique como
+    string (ej: "766.61438000358"); la API los devuelve igual.
+    """
+    raw = path.read_bytes()
+    magic, n = SERIE_HEADER.unpack_from(raw)
+    if magic != SERIE_MAGIC:
+        raise ValueError(f"Formato de serie desconocido en {path}")
+
+    inicio = SERIE_HEADER.size
+    ordinales = array("i")
+    ordinales.frombytes(raw[inicio : inicio + n * 4])
+    valores = array("d")
+    valores.frombytes(raw[inicio + n * 4 : inicio + n * 12])
+
+    if sys.byteorder == "big":
+        ordinales.byteswap()
+        valores.byteswap()
+
+    return dict(zip(ordinales, valores))
+
+
+def escribir_serie_empaquetada(path: Path, serie: dict):
+    """Escribe {ordinal: valor} ordenado por fecha, de forma atómica."""
+    claves = sorted(serie)
+    ordinales = array("i", claves)
+    valores = array("d", (serie[k] for k in claves))
+
+    if sys.byteorder == "big":
+        ordinales.byteswap()
+        valores.byteswap()
+
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("wb") as f:
+        f.write(SERIE_HEADER.pack(SERIE_MAGIC, len(claves)))
+        f.write(ordinales.tobytes())
+        f.write(valores.tobytes())
+    os.replace(tmp, path)
+
+
+def _serie_desde_versionados(out_dir: Path) -> dict:
+    """Reconstruye la serie completa a partir de los YYYY-MM-DD.json."""
+    serie = {}
+
+    for file in sorted(out_dir.glob("*.json")):
+        if file.name == "latest.json":
+            continue
+        try:
+            with file.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            for item in data:
+                serie[_ordinal_desde_fecha(item["fecha"])] = float(item["valor"])
+        except Exception:
+            continue
+
+    return serie
+
+
+def actualizar_serie_empaquetada(out_dir: Path, data):
+    """
+    Incorpora los registros {fecha, valor} al serie.bin del dataset.
+    Si el archivo no existe lo genera desde los JSON versionados.
+    """
+    path = out_dir / SERIE_ARCHIVO
+
+    if path.exists():
+        serie = leer_serie_empaquetada(path)
+    else:
+        serie = _serie_desde_versionados(out_dir)
+
+    for item in data:
+        try:
+            serie[_ordinal_desde_fecha(item["fecha"])] = float(item["valor"])
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    escribir_serie_empaquetada(path, serie)
+
+
+def parsear_html(html, solo=None, **atributos):
+    """
+    BeautifulSoup con el parser más rápido disponible (lxml si está
+    instalado). Con `solo` (nombre de tag o lista de nombres, más atributos
+    opcionales) se arma el árbol únicamente con esos elementos y su contenido
+    (SoupStrainer), salteando el resto de la página.
+    """
+    parse_only = SoupStrainer(solo, attrs=atributos or {}) if solo else None
+    return BeautifulSoup(html, PARSER_HTML, parse_only=parse_only)
+
+
+class LimitadorDeRitmo:
+    """
+    Limita los requests a un mismo sitio a `por_segundo`, repartidos entre
+    todos los hilos que lo comparten: cada llamada a esperar() reserva el
+    siguiente turno libre y duerme hasta que llegue.
+    """
+
+    def __init__(self, por_segundo):
+        self.intervalo = 1 / por_segundo
+        self._proximo = 0.0
+        self._lock = threading.Lock()
+
+    def esperar(self):
+        with self._lock:
+            ahora = time.monotonic()
+            turno = max(ahora, self._proximo)
+            self._proximo = turno + self.intervalo
+        time.sleep(max(0.0, turno - ahora))
+
+
+_sesiones = threading.local()
+
+
+def sesion_por_hilo(headers=None):
+    """requests.Session propia del hilo actual (keep-alive, sin compartir)."""
+    session = getattr(_sesiones, "session", None)
+    if session is None:
+        session = _sesiones.session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+ESTADO_HTTP = ".http_estado"
+
+# Lo devuelven los scrapers cuando la fuente no cambió desde la última corrida
+SIN_CAMBIOS = object()
+
+
+class EstadoHTTP:
+    """
+    Requests condicionales a las fuentes de un dataset. Por cada URL guarda en
+    data/<dataset>/.http_estado el ETag, el Last-Modified y el sha256 del
+    último contenido procesado.
+
+    get() manda If-None-Match / If-Modified-Since y devuelve None si la fuente
+    respondió 304 o si el contenido es idéntico al último procesado (para los
+    servidores que ignoran esos headers). El estado nuevo se escribe recién
+    con guardar(), una vez guardado el dataset: si el scraper falla a mitad
+    de camino, la próxima corrida vuelve a procesar la fuente.
+    """
+
+    def __init__(self, dataset: str, data_dir: Path | None = None):
+        data_dir = data_dir or Path(__file__).resolve().parents[1] / "data"
+        out_dir = data_dir / dataset
+        self.path = out_dir / ESTADO_HTTP
+        self._estados = {}
+        self._pendientes = {}
+
+        # sin latest.json no hay nada que conservar: se pide todo de nuevo
+        if self.path.exists() and (out_dir / "latest.json").exists():
+            try:
+                with self.path.open("r", encoding="utf-8") as f:
+                    self._estados = json.load(f)
+            except (OSError, ValueError):
+                self._estados = {}
+
+    def get(self, url, session=None, clave=None, **kwargs):
+        """
+        requests.get (o session.get) condicional. `clave` identifica la fuente
+        cuando `url` no es la URL real (ej: un proxy como ScraperAPI).
+        """
+        clave = clave or url
+        previo = self._estados.get(clave, {})
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if previo.get("etag"):
+            headers["If-None-Match"] = previo["etag"]
+        if previo.get("last_modified"):
+            headers["If-Modified-Since"] = previo["last_modified"]
+
+        response = (session or requests).get(url, headers=headers, **kwargs)
+
+        if response.status_code == 304:
+            print(f"ℹ {clave}: sin cambios (304)")
+            return None
+        if response.status_code != 200:
+            return response
+
+        sha256 = hashlib.sha256(response.content).hexdigest()
+        if sha256 == previo.get("sha256"):
+            print(f"ℹ {clave}: sin cambios (mismo contenido)")
+            return None
+
+        self._pendientes[clave] = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "sha256": sha256,
+        }
+        return response
+
+    def guardar(self):
+        """Persiste el estado de las fuentes procesadas (escritura atómica)."""
+        if not self._pendientes:
+            return
+
+        self._estados.update(self._pendientes)
+        self._pendientes = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(self._estados, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
 
 
 def save_dataset_json(dataset: str, data, versioned: bool = True):
@@ -30,4 +298,7 @@ def save_dataset_json(dataset: str, data, versioned: bool = True):
     with latest_file.open("w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
+    if dataset in SERIES_EMPAQUETADAS:
+        actualizar_serie_empaquetada(out_dir, data)
+
     print(f"📁 Dataset '{dataset}' guardado en {out_dir}")
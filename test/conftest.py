@@ -0,0 +1,25 @@
+import json
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from api.services.timeseries import TimeSeries
+
+# Los scrapers se ejecutan como scripts (python scrapers/x.py) e importan
+# `from utils import ...`: los tests los importan igual
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scrapers"))
+
+INICIO = date(2024, 1, 1)
+
+
+@pytest.fixture
+def serie_diaria(tmp_path):
+    """Serie diaria de 10 días (01/01/2024 a 10/01/2024, valor = día del mes)."""
+    for n in range(10):
+        dia = INICIO + timedelta(days=n)
+        registro = [{"fecha": dia.strftime("%d/%m/%Y"), "valor": float(dia.day)}]
+        (tmp_path / f"{dia.isoformat()}.json").write_text(json.dumps(registro))
+
+    return TimeSeries("prueba", tmp_path, value_fields={"valor": "valor"})
@@ -0,0 +1,89 @@
+import pytest
+
+from api.services.provincias_service import BuscadorLugares, _distancia_edicion
+
+
+def _lugar(tipo, nombre, poblacion=None):
+    return {"tipo": tipo, "id": nombre, "nombre": nombre}, poblacion
+
+
+@pytest.fixture(scope="module")
+def buscador():
+    return BuscadorLugares(
+        [
+            _lugar("provincia", "Córdoba"),
+            _lugar("provincia", "Tierra del Fuego"),
+            _lugar("municipio", "Córdoba", 1_500_000),
+            _lugar("municipio", "Río Cuarto", 177_000),
+            _lugar("municipio", "Colonia Las Cuatro Esquinas", 1_000),
+            _lugar("municipio", "Ushuaia", 82_000),
+            _lugar("municipio", "Usuahia Chico", 10),
+            _lugar("municipio", "San Salvador de Jujuy", 320_000),
+            _lugar("municipio", "San Salvador", 15_000),
+            _lugar("municipio", "Villa María", 90_000),
+        ]
+    )
+
+
+def _nombres(buscador, texto, limite=5):
+    return [
+        (lugar["tipo"], lugar["nombre"]) for lugar in buscador.buscar(texto, limite)
+    ]
+
+
+@pytest.mark.parametrize(
+    "a, b, distancia",
+    [
+        ("cuatro", "cuarto", 1),
+        ("usuahia", "ushuaia", 2),
+        ("cordova", "cordoba", 1),
+        ("posadsa", "posadas", 1),
+        ("", "abc", 3),
+        ("rio", "rio", 0),
+    ],
+)
+def test_distancia_edicion(a, b, distancia):
+    assert _distancia_edicion(a, b, 10) == distancia
+
+
+def test_distancia_edicion_corta_al_pasar_el_maximo():
+    assert _distancia_edicion("ushuaia", "zzzzzzz", 1) > 1
+
+
+def test_exacto_primero_y_provincias_antes_que_municipios(buscador):
+    assert _nombres(buscador, "cordoba") == [
+        ("provincia", "Córdoba"),
+        ("municipio", "Córdoba"),
+    ]
+
+
+def test_prefijo_por_poblacion(buscador):
+    assert _nombres(buscador, "san salv") == [
+        ("municipio", "San Salvador de Jujuy"),
+        ("municipio", "San Salvador"),
+    ]
+
+
+def test_transposicion_ordena_por_errores(buscador):
+    assert _nombres(buscador, "rio cuatro")[0] == ("municipio", "Río Cuarto")
+
+
+def test_errores_de_tipeo(buscador):
+    assert _nombres(buscador, "usuaia")[0] == ("municipio", "Ushuaia")
+    assert _nombres(buscador, "cordova")[:2] == [
+        ("provincia", "Córdoba"),
+        ("municipio", "Córdoba"),
+    ]
+    assert _nombres(buscador, "villa marai") == [("municipio", "Villa María")]
+
+
+def test_prefijo_exacto_antes_que_aproximado(buscador):
+    assert _nombres(buscador, "usuahia") == [
+        ("municipio", "Usuahia Chico"),
+        ("municipio", "Ushuaia"),
+    ]
+
+
+def test_sin_resultados(buscador):
+    assert buscador.buscar("xyzw", 5) == []
+    assert buscador.buscar("  ¿? ", 5) == []
@@ -0,0 +1,111 @@
+import cambios_combustibles
+import pytest
+
+from api.services import combustibles_service
+from api.services.combustibles_service import get_cambios
+
+
+def _estacion(provincia, direccion, combustible, **precios):
+    return {
+        "provincia": provincia,
+        "empresa": "YPF",
+        "localidad": "CAPITAL",
+        "direccion": direccion,
+        "combustible": combustible,
+        "precios": precios,
+    }
+
+
+ANTERIOR = [
+    _estacion("CHACO", "Ruta 11 km 1", "GNC", día=800),
+    _estacion("CHACO", "Ruta 11 km 1", "Nafta Súper", día=1800, noche=1800),
+    _estacion("SALTA", "Belgrano 10", "Gasoil", día=1700),
+    _estacion("SALTA", "Belgrano 20", "Gasoil", día=1650),
+    _estacion("SALTA", "Belgrano 30", "Gasoil", día=1600),
+]
+
+NUEVO = [
+    _estacion("CHACO", "Ruta 11 km 1", "GNC", día=850),
+    _estacion("CHACO", "Ruta 11 km 1", "Nafta Súper", día=1790, noche=1810),
+    _estacion("SALTA", "Belgrano 10", "Gasoil", día=1650),
+    _estacion("SALTA", "Belgrano 30", "Gasoil", día=1600),
+    _estacion("SALTA", "Belgrano 40", "Gasoil", día=1620),
+]
+
+
+def _tipos(cambios):
+    return sorted((c["direccion"], c["combustible"], c["tipo"]) for c in cambios)
+
+
+def test_calcular_cambios():
+    cambios = cambios_combustibles.calcular_cambios(ANTERIOR, NUEVO)
+
+    assert _tipos(cambios) == [
+        ("Belgrano 10", "Gasoil", "baja"),
+        ("Belgrano 20", "Gasoil", "eliminada"),
+        ("Belgrano 40", "Gasoil", "nueva"),
+        ("Ruta 11 km 1", "GNC", "sube"),
+        ("Ruta 11 km 1", "Nafta Súper", "cambia"),
+    ]
+    sube = next(c for c in cambios if c["tipo"] == "sube")
+    assert (sube["precios_anteriores"], sube["precios"]) == ({"día": 800}, {"día": 850})
+
+
+def test_franja_nueva_es_cambia():
+    anterior = [_estacion("CHACO", "Ruta 11 km 1", "GNC", día=800)]
+    nuevo = [_estacion("CHACO", "Ruta 11 km 1", "GNC", día=800, noche=820)]
+
+    (cambio,) = cambios_combustibles.calcular_cambios(anterior, nuevo)
+
+    assert cambio["tipo"] == "cambia"
+
+
+@pytest.fixture
+def feed(tmp_path, monkeypatch):
+    """Cambios escritos por el scraper en un directorio temporal."""
+    monkeypatch.setattr(cambios_combustibles, "CAMBIOS_DIR", tmp_path)
+    monkeypatch.setattr(combustibles_service, "CAMBIOS_PATH", tmp_path)
+
+    cambios_combustibles.guardar_cambios("2025-01-01", ANTERIOR, "2025-01-16", NUEVO)
+    cambios_combustibles.guardar_cambios("2025-01-16", NUEVO, "2025-02-01", ANTERIOR)
+
+
+def test_feed_completo(feed):
+    resultado = get_cambios()
+
+    assert [(c["desde"], c["hasta"]) for c in resultado] == [
+        ("2025-01-01", "2025-01-16"),
+        ("2025-01-16", "2025-02-01"),
+    ]
+    assert resultado[0]["resumen"] == {
+        "sube": 1,
+        "baja": 1,
+        "cambia": 1,
+        "nueva": 1,
+        "eliminada": 1,
+    }
+
+
+def test_feed_desde_una_fecha(feed):
+    assert [c["hasta"] for c in get_cambios(desde="2025-01-16")] == ["2025-02-01"]
+    assert [c["hasta"] for c in get_cambios(desde="2025-01-10")] == [
+        "2025-01-16",
+        "2025-02-01",
+    ]
+    assert get_cambios(desde="2025-02-01") == []
+
+
+def test_feed_filtrado_recalcula_el_resumen(feed):
+    primero, _ = get_cambios(provincia="chaco")
+
+    assert _tipos(primero["cambios"]) == [
+        ("Ruta 11 km 1", "GNC", "sube"),
+        ("Ruta 11 km 1", "Nafta Súper", "cambia"),
+    ]
+    assert primero["resumen"] == {
+        "sube": 1,
+        "baja": 0,
+        "cambia": 1,
+        "nueva": 0,
+        "eliminada": 0,
+    }
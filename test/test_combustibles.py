@@ -0,0 +1,92 @@
+import json
+
+from api.services.combustibles_service import (
+    CercaniaEstaciones,
+    CombustiblesIndex,
+    HistorialPrecios,
+    TablaEstaciones,
+    _cargar_estadisticas,
+)
+
+ESTACION = {
+    "provincia": "CHACO",
+    "empresa": "YPF",
+    "localidad": "RESISTENCIA",
+    "direccion": "AV. SARMIENTO 1000",
+    "combustible": "Nafta Súper",
+    "fecha_vigencia": "01/01/2025",
+}
+
+
+def _snapshot(precios):
+    return [{**ESTACION, "precios": precios}]
+
+
+def test_historial_conserva_precios_con_decimales():
+    historial = HistorialPrecios(
+        [
+            ("2025-01-01", _snapshot({"día": 1899.5, "noche": 1899})),
+            ("2025-01-16", _snapshot({"día": 1899.99})),
+            ("2025-02-01", _snapshot({"día": 1950, "noche": 1949.01})),
+        ]
+    )
+
+    (clave,) = historial.claves(provincia="chaco")
+    assert historial.serie(clave)["precios"] == [
+        {"fecha": "01/01/2025", "día": 1899.5, "noche": 1899},
+        {"fecha": "16/01/2025", "día": 1899.99},
+        {"fecha": "01/02/2025", "día": 1950, "noche": 1949.01},
+    ]
+
+
+def test_cercania_ubica_localidades_por_alias():
+    provincias = [
+        {
+            "nombre": "Buenos Aires",
+            "municipios": [
+                {
+                    "nombre": "General Pueyrredón",
+                    "centroide": {"lat": -38.0, "lon": -57.6, "localidad": "Camet"},
+                }
+            ],
+        },
+        {"nombre": "Santiago del Estero", "municipios": []},
+    ]
+    estaciones = [
+        {**ESTACION, "provincia": "BUENOS AIRES", "localidad": "MAR DEL PLATA"},
+        {**ESTACION, "provincia": "SANTIAGO DEL ESTERO", "localidad": "LA BANDA"},
+        {**ESTACION, "provincia": "BUENOS AIRES", "localidad": "ATLANTIDA"},
+    ]
+
+    cercania = CercaniaEstaciones(
+        CombustiblesIndex(TablaEstaciones(estaciones)), provincias
+    )
+
+    ((_, _, _, (municipio, ids)),) = cercania.grilla.cercanos(-38.0, -57.6, 1)
+    assert (municipio, ids) == ("General Pueyrredón", [0])
+    assert [valor[0] for *_, valor in cercania.grilla.cercanos(-27.7, -64.2, 10)] == [
+        "La Banda"
+    ]
+    assert cercania.sin_ubicacion == 1
+
+
+def test_estadisticas_devuelven_los_nombres_originales(tmp_path):
+    path = tmp_path / "latest.json"
+    path.write_text(
+        json.dumps(
+            [
+                {**ESTACION, "provincia": "buenos-aires", "precios": {"día": 1500}},
+                {**ESTACION, "provincia": "buenos-aires", "precios": {"día": 1600}},
+            ]
+        )
+    )
+
+    tabla = _cargar_estadisticas(path)
+
+    fila = tabla[("buenos aires", "nafta super", None)]
+    assert (fila["provincia"], fila["combustible"], fila["empresa"]) == (
+        "buenos-aires",
+        "Nafta Súper",
+        None,
+    )
+    assert fila["estaciones"] == 2
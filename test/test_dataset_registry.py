@@ -0,0 +1,84 @@
+import json
+import os
+
+import pytest
+
+from api.services.dataset_registry import DatasetRegistry
+
+
+def _escribir(path, data, mtime_ns):
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def contador():
+    llamadas = []
+
+    def loader(path):
+        llamadas.append(path)
+        return json.loads(path.read_text())
+
+    loader.llamadas = llamadas
+    return loader
+
+
+def test_parsea_una_sola_vez_mientras_no_cambie(tmp_path, contador):
+    registry = DatasetRegistry()
+    path = tmp_path / "latest.json"
+    _escribir(path, [1, 2], 1_000_000_000)
+
+    primero = registry.get(path, contador)
+    assert registry.get(path, contador) is primero
+    assert len(contador.llamadas) == 1
+
+
+def test_revalida_cuando_cambia_el_archivo(tmp_path, contador):
+    registry = DatasetRegistry()
+    path = tmp_path / "latest.json"
+    _escribir(path, [1, 2], 1_000_000_000)
+    version = registry.version(path)
+    registry.get(path, contador)
+
+    _escribir(path, [1, 2, 3], 2_000_000_000)
+
+    assert registry.version(path) != version
+    assert registry.get(path, contador) == [1, 2, 3]
+    assert len(contador.llamadas) == 2
+
+
+def test_directorio_cambia_de_version_con_su_latest(tmp_path):
+    registry = DatasetRegistry()
+    _escribir(tmp_path / "latest.json", [1], 1_000_000_000)
+    version = registry.version(tmp_path)
+
+    _escribir(tmp_path / "latest.json", [2], 2_000_000_000)
+
+    assert registry.version(tmp_path) != version
+
+
+def test_revalida_cuando_cambia_una_dependencia(tmp_path):
+    registry = DatasetRegistry()
+    base = tmp_path / "base.json"
+    extra = tmp_path / "extra.json"
+    _escribir(base, [1], 1_000_000_000)
+    _escribir(extra, [10], 1_000_000_000)
+
+    def loader(path):
+        return json.loads(path.read_text()) + json.loads(extra.read_text())
+
+    assert registry.get(base, loader, depende_de=(extra,)) == [1, 10]
+
+    _escribir(extra, [20], 2_000_000_000)
+
+    assert registry.get(base, loader, depende_de=(extra,)) == [1, 20]
+
+
+def test_dataset_inexistente(tmp_path, contador):
+    registry = DatasetRegistry()
+    path = tmp_path / "no-existe.json"
+
+    with pytest.raises(FileNotFoundError):
+        registry.get(path, contador)
+    assert not registry.exists(path)
+    assert contador.llamadas == []
@@ -0,0 +1,136 @@
+import hashlib
+import json
+
+import pytest
+from utils import EstadoHTTP
+
+URL = "https://www.bcra.gob.ar/cer"
+
+
+class Respuesta:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class Sesion:
+    """Devuelve las respuestas en orden y guarda los headers de cada pedido."""
+
+    def __init__(self, *respuestas):
+        self.respuestas = list(respuestas)
+        self.headers = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.headers.append(headers)
+        return self.respuestas.pop(0)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    (tmp_path / "cer").mkdir()
+    (tmp_path / "cer" / "latest.json").write_text("[]")
+    return tmp_path
+
+
+def _procesado(data_dir, content=b"v1"):
+    """Estado guardado después de procesar `content` con ETag y Last-Modified."""
+    estado = EstadoHTTP("cer", data_dir)
+    estado.get(
+        URL,
+        session=Sesion(
+            Respuesta(
+                200,
+                content,
+                {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            )
+        ),
+    )
+    estado.guardar()
+
+
+def test_primera_corrida_pide_todo_y_guarda_el_estado(data_dir):
+    sesion = Sesion(Respuesta(200, b"v1", {"ETag": '"abc"'}))
+    estado = EstadoHTTP("cer", data_dir)
+
+    response = estado.get(URL, session=sesion)
+
+    assert response.content == b"v1"
+    assert sesion.headers == [{}]
+    assert not estado.path.exists()  # recién con guardar()
+
+    estado.guardar()
+    guardado = json.loads(estado.path.read_text())
+    assert guardado[URL]["etag"] == '"abc"'
+    assert guardado[URL]["sha256"] == hashlib.sha256(b"v1").hexdigest()
+
+
+def test_manda_headers_condicionales_y_304_es_sin_cambios(data_dir):
+    _procesado(data_dir)
+    sesion = Sesion(Respuesta(304))
+
+    assert EstadoHTTP("cer", data_dir).get(URL, session=sesion) is None
+    assert sesion.headers == [
+        {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+    ]
+
+
+def test_mismo_contenido_es_sin_cambios(data_dir):
+    _procesado(data_dir)
+    sesion = Sesion(Respuesta(200, b"v1"))
+
+    assert EstadoHTTP("cer", data_dir).get(URL, session=sesion) is None
+
+
+def test_contenido_nuevo_se_procesa(data_dir):
+    _procesado(data_dir)
+    estado = EstadoHTTP("cer", data_dir)
+
+    response = estado.get(URL, session=Sesion(Respuesta(200, b"v2")))
+
+    assert response.content == b"v2"
+    estado.guardar()
+    guardado = json.loads(estado.path.read_text())
+    assert guardado[URL]["sha256"] == hashlib.sha256(b"v2").hexdigest()
+
+
+def test_sin_guardar_la_proxima_corrida_reprocesa(data_dir):
+    _procesado(data_dir)
+    EstadoHTTP("cer", data_dir).get(URL, session=Sesion(Respuesta(200, b"v2")))
+
+    # el scraper falló antes de guardar(): v2 se vuelve a procesar
+    response = EstadoHTTP("cer", data_dir).get(
+        URL, session=Sesion(Respuesta(200, b"v2"))
+    )
+    assert response is not None
+
+
+def test_sin_latest_se_ignora_el_estado(data_dir):
+    _procesado(data_dir)
+    (data_dir / "cer" / "latest.json").unlink()
+    sesion = Sesion(Respuesta(200, b"v1"))
+
+    assert EstadoHTTP("cer", data_dir).get(URL, session=sesion) is not None
+    assert sesion.headers == [{}]
+
+
+def test_error_http_se_devuelve_sin_registrar(data_dir):
+    estado = EstadoHTTP("cer", data_dir)
+
+    response = estado.get(URL, session=Sesion(Respuesta(503)))
+
+    assert response.status_code == 503
+    estado.guardar()
+    assert not estado.path.exists()
+
+
+def test_clave_distinta_de_la_url(data_dir):
+    estado = EstadoHTTP("cer", data_dir)
+    proxy = "https://api.scraperapi.com/?url=" + URL
+    estado.get(proxy, session=Sesion(Respuesta(200, b"v1")), clave=URL)
+    estado.guardar()
+
+    assert list(json.loads(estado.path.read_text())) == [URL]
@@ -0,0 +1,124 @@
+import random
+
+import pytest
+
+from api.utils.geo import GrillaEspacial, distancia_km, leer_coordenadas
+
+
+@pytest.fixture(scope="module")
+def puntos():
+    """Puntos al azar (semilla fija) sobre Argentina, con su índice como valor."""
+    azar = random.Random(2024)
+    return [(azar.uniform(-55, -22), azar.uniform(-73, -54), i) for i in range(2000)]
+
+
+def _fuerza_bruta(puntos, lat, lon):
+    return sorted(
+        (distancia_km(lat, lon, p_lat, p_lon), valor) for p_lat, p_lon, valor in puntos
+    )
+
+
+def test_distancia_km():
+    # Obelisco (CABA) - Plaza San Martín (Córdoba): ~646 km
+    assert distancia_km(-34.6037, -58.3816, -31.4167, -64.1833) == pytest.approx(
+        646, abs=2
+    )
+    assert distancia_km(-34.6, -58.4, -34.6, -58.4) == 0
+
+
+@pytest.mark.parametrize(
+    "args, esperado",
+    [
+        ({"lat": "-34.6", "lon": "-58.4"}, (-34.6, -58.4, None)),
+        ({"lat": "-34.6"}, None),
+        ({"lat": "abc", "lon": "1"}, None),
+        ({"lat": None, "lon": [1]}, None),
+        ({"lat": "91", "lon": "0"}, None),
+        ({"lat": "0", "lon": "-181"}, None),
+    ],
+)
+def test_leer_coordenadas(args, esperado):
+    lat, lon, mensaje = leer_coordenadas(args)
+    if esperado is None:
+        assert lat is None and lon is None and mensaje
+    else:
+        assert (lat, lon, mensaje) == esperado
+
+
+@pytest.mark.parametrize("radio_km", [5, 50, 300, 3000])
+def test_cercanos_coincide_con_fuerza_bruta(puntos, radio_km):
+    grilla = GrillaEspacial(puntos)
+    lat, lon = -34.6, -58.4
+
+    esperado = [
+        (d, valor) for d, valor in _fuerza_bruta(puntos, lat, lon) if d <= radio_km
+    ]
+    resultado = [(d, valor) for d, _, _, valor in grilla.cercanos(lat, lon, radio_km)]
+
+    assert resultado == esperado
+
+
+@pytest.mark.parametrize(
+    "lat, lon, p_lat, p_lon",
+    [(0, 0, 1.0, 0.0), (0, 0, 0.0, -1.0), (-60, -65, -60.5, -64.0)],
+)
+def test_cercanos_incluye_el_borde_del_radio(lat, lon, p_lat, p_lon):
+    # El punto está justo a `radio_km` y sobre el límite de una celda
+    grilla = GrillaEspacial([(p_lat, p_lon, "borde")])
+    radio_km = distancia_km(lat, lon, p_lat, p_lon)
+
+    assert [valor for *_, valor in grilla.cercanos(lat, lon, radio_km)] == ["borde"]
+    assert [valor for *_, valor in grilla.cercanos(lat, lon, radio_km + 0.01)] == [
+        "borde"
+    ]
+
+
+def test_cercanos_sin_puntos_en_el_radio():
+    grilla = GrillaEspacial([(-34.6, -58.4, "caba")])
+    assert grilla.cercanos(-24.8, -65.4, 100) == []
+    assert grilla.total == 1
+
+
+@pytest.mark.parametrize(
+    "lat, lon, n",
+    [(-34.6, -58.4, 1), (-34.6, -58.4, 20), (-54.8, -68.3, 5), (-31.4, -64.2, 200)],
+)
+def test_mas_cercanos_coincide_con_fuerza_bruta(puntos, lat, lon, n):
+    grilla = GrillaEspacial(puntos)
+
+    resultado = [(d, valor) for d, _, _, valor in grilla.mas_cercanos(lat, lon, n)]
+
+    assert resultado == _fuerza_bruta(puntos, lat, lon)[:n]
+
+
+def test_mas_cercanos_con_el_mas_cercano_en_el_borde_de_la_caja():
+    # (1, 0) está a 111,195 km, en la primera fila de celdas fuera de una caja
+    # calculada con 111,32 km por grado; el punto en diagonal, a 111,198 km
+    grilla = GrillaEspacial([(0.7071, 0.70717, "diagonal"), (1.0, 0.0, "norte")])
+
+    resultado = grilla.mas_cercanos(0, 0, 1, radio_km=111.2)
+
+    assert [valor for *_, valor in resultado] == ["norte"]
+
+
+def test_mas_cercanos_lejos_de_todos_los_puntos(puntos):
+    grilla = GrillaEspacial(puntos)
+
+    # Madrid: los puntos más cercanos están a más de 9000 km
+    resultado = grilla.mas_cercanos(40.4, -3.7, 3)
+
+    assert [valor for *_, valor in resultado] == [
+        valor for _, valor in _fuerza_bruta(puntos, 40.4, -3.7)[:3]
+    ]
+
+
+def test_mas_cercanos_con_menos_puntos_que_n():
+    grilla = GrillaEspacial([(-34.6, -58.4, "caba"), (-31.4, -64.2, "cordoba")])
+
+    resultado = grilla.mas_cercanos(-32.9, -68.8, 5)
+
+    assert [valor for *_, valor in resultado] == ["cordoba", "caba"]
+
+
+def test_mas_cercanos_grilla_vacia():
+    assert GrillaEspacial([]).mas_cercanos(0, 0, 3) == []
@@ -0,0 +1,120 @@
+import pytest
+from flask import Flask
+from werkzeug.datastructures import MultiDict
+
+from api.routes.v1.cer import validar_fecha
+from api.utils.paginacion import MAX_LIMIT, leer_paginacion
+
+
+def _dias(items):
+    return [int(item["fecha"][:2]) for item in items]
+
+
+# -------- TimeSeries.page --------
+
+
+def test_page_recorre_toda_la_serie_con_cursor(serie_diaria):
+    paginas = []
+    cursor = None
+    while True:
+        items, cursor = serie_diaria.page(4, cursor=cursor)
+        paginas.append(_dias(items))
+        if cursor is None:
+            break
+
+    assert paginas == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+
+
+def test_page_cursor_es_la_fecha_del_ultimo_item(serie_diaria):
+    items, cursor = serie_diaria.page(3)
+    assert _dias(items) == [1, 2, 3]
+    assert cursor == "2024-01-03"
+
+
+def test_page_ultima_pagina_exacta_no_tiene_siguiente(serie_diaria):
+    items, cursor = serie_diaria.page(10)
+    assert len(items) == 10
+    assert cursor is None
+
+
+def test_page_dentro_de_un_rango(serie_diaria):
+    items, cursor = serie_diaria.page(2, desde="2024-01-04", hasta="2024-01-06")
+    assert (_dias(items), cursor) == ([4, 5], "2024-01-05")
+
+    items, cursor = serie_diaria.page(2, cursor=cursor, hasta="2024-01-06")
+    assert (_dias(items), cursor) == ([6], None)
+
+
+def test_page_cursor_posterior_al_ultimo_dato(serie_diaria):
+    assert serie_diaria.page(5, cursor="2024-02-01") == ([], None)
+
+
+def test_page_con_fecha_invalida(serie_diaria):
+    with pytest.raises(ValueError):
+        serie_diaria.page(5, cursor="2024-13-01")
+
+
+# -------- leer_paginacion --------
+
+
+@pytest.fixture
+def leer():
+    app = Flask(__name__)
+
+    def leer(**params):
+        with app.test_request_context():
+            limit, cursor, ultimos, err = leer_paginacion(
+                MultiDict(params), validar_fecha
+            )
+            if err is not None:
+                response, status = err
+                return status, response.get_json()["error"]
+            return limit, cursor, ultimos
+
+    return leer
+
+
+def test_limit_y_cursor_validos(leer):
+    assert leer(historico="true", limit="100", cursor="2024-01-15") == (
+        100,
+        "2024-01-15",
+        None,
+    )
+    assert leer(desde="2024-01-01", hasta="2024-02-01", limit="1") == (1, None, None)
+
+
+@pytest.mark.parametrize("limit", ["0", "-5", str(MAX_LIMIT + 1), "diez", ""])
+def test_limit_fuera_de_rango(leer, limit):
+    status, mensaje = leer(historico="true", limit=limit)
+    assert status == 400
+    assert f"entre 1 y {MAX_LIMIT}" in mensaje
+
+
+def test_limit_maximo(leer):
+    assert leer(historico="true", limit=str(MAX_LIMIT))[0] == MAX_LIMIT
+
+
+def test_limit_requiere_historico_o_rango(leer):
+    assert leer(limit="10")[0] == 400
+
+
+def test_cursor_requiere_limit(leer):
+    status, mensaje = leer(historico="true", cursor="2024-01-15")
+    assert status == 400
+    assert "requiere 'limit'" in mensaje
+
+
+def test_cursor_con_formato_invalido(leer):
+    assert leer(historico="true", limit="10", cursor="15/01/2024")[0] == 400
+
+
+def test_ultimos(leer):
+    assert leer(ultimos="30") == (None, None, 30)
+    assert leer(ultimos="0")[0] == 400
+    assert leer(ultimos=str(MAX_LIMIT + 1))[0] == 400
+
+
+def test_ultimos_no_se_combina(leer):
+    status, mensaje = leer(ultimos="5", historico="true")
+    assert status == 400
+    assert "historico" in mensaje
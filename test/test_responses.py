@@ -0,0 +1,77 @@
+import gzip
+
+import pytest
+from flask import Flask
+
+from api.utils import responses
+from api.utils.responses import success
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    datos = {"valor": 1, "version": "v1"}
+
+    @app.route("/serie")
+    def serie():
+        return success([datos["valor"]] * 1000, version=datos["version"])
+
+    app.datos = datos
+    responses.clear_response_cache()
+    yield app
+    responses.clear_response_cache()
+
+
+def test_cachea_y_reusa_la_respuesta(app):
+    client = app.test_client()
+    primera = client.get("/serie")
+    app.datos["valor"] = 2  # misma versión: se sirve lo cacheado
+
+    assert client.get("/serie").data == primera.data
+    assert len(responses._response_cache) == 1
+
+
+def test_nueva_version_invalida_la_respuesta(app):
+    client = app.test_client()
+    client.get("/serie")
+    app.datos.update(valor=2, version="v2")
+
+    assert client.get("/serie").get_json()["data"][0] == 2
+
+
+def test_no_cachea_parametros_elegidos_por_el_cliente(app):
+    client = app.test_client()
+    client.get("/serie?desde=2024-01-01")
+    client.get("/serie?limit=5")
+    assert len(responses._response_cache) == 0
+
+    client.get("/serie?historico=true")
+    assert len(responses._response_cache) == 1
+
+
+def test_comprime_solo_cuando_se_pide(app):
+    client = app.test_client()
+    client.get("/serie")
+    (entrada,) = responses._response_cache.values()
+    assert list(entrada) == ["identity"]
+
+    r = client.get("/serie", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(r.data) == entrada["identity"]
+    assert set(entrada) == {"identity", "gzip"}
+    assert responses._response_cache_bytes == sum(map(len, entrada.values()))
+
+
+def test_limite_por_bytes(app, monkeypatch):
+    client = app.test_client()
+    tamanio = len(client.get("/serie").data)
+    monkeypatch.setattr(responses, "RESPONSE_CACHE_MAX_BYTES", tamanio * 2)
+
+    app.datos["version"] = "v2"
+    client.get("/serie")
+    app.datos["version"] = "v3"
+    client.get("/serie")
+
+    assert len(responses._response_cache) == 2
+    assert responses._response_cache_bytes <= tamanio * 2
+    assert [clave[3] for clave in responses._response_cache] == ["v2", "v3"]
@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+
+import utils as scrapers_utils
+
+from api.services.data_loader import SERIE_EMPAQUETADA
+from api.services.timeseries import PACKED_SERIES_FILE, TimeSeries
+
+DESCRIPCION = "Coeficiente de Estabilización de Referencia (CER)"
+
+# (archivo, fecha, valor): desordenados, con un valor publicado como string
+SNAPSHOTS = [
+    ("2026-05-10", "10/05/2026", "766.61438000358"),
+    ("2026-05-08", "08/05/2026", 764.91),
+    ("2026-05-09", "09/05/2026", 765.7604699255),
+]
+
+
+def _escribir_snapshots(out_dir: Path):
+    for archivo, fecha, valor in SNAPSHOTS:
+        registro = [{"fecha": fecha, "valor": valor, "descripcion": DESCRIPCION}]
+        (out_dir / f"{archivo}.json").write_text(json.dumps(registro))
+
+
+def test_la_api_lee_lo_que_escribe_el_scraper(tmp_path):
+    _escribir_snapshots(tmp_path)
+    nuevo = [{"fecha": "11/05/2026", "valor": 767.5, "descripcion": DESCRIPCION}]
+    (tmp_path / "latest.json").write_text(json.dumps(nuevo))
+    scrapers_utils.actualizar_serie_empaquetada(tmp_path, nuevo)
+    assert (tmp_path / PACKED_SERIES_FILE).exists()
+
+    serie = TimeSeries("cer", tmp_path, **SERIE_EMPAQUETADA)
+    assert serie.history() == [
+        {"fecha": "08/05/2026", "valor": 764.91},
+        {"fecha": "09/05/2026", "valor": 765.7604699255},
+        {"fecha": "10/05/2026", "valor": 766.61438000358},
+        {"fecha": "11/05/2026", "valor": 767.5},
+    ]
+
+
+def test_serie_empaquetada_coincide_con_el_historico_json(tmp_path):
+    _escribir_snapshots(tmp_path)
+    scrapers_utils.actualizar_serie_empaquetada(tmp_path, [])
+
+    serie = TimeSeries("cer", tmp_path, **SERIE_EMPAQUETADA)
+    claves, items = serie._read_packed(tmp_path / PACKED_SERIES_FILE)
+    claves_json, items_json = serie._build(tmp_path)
+
+    assert list(claves) == list(claves_json)
+    assert items == items_json
+
+
+def test_lectura_del_scraper_es_inversa_de_la_escritura(tmp_path):
+    path = tmp_path / PACKED_SERIES_FILE
+    serie = {739000: 1.5, 738990: 2.25, 739005: 1e-9}
+
+    scrapers_utils.escribir_serie_empaquetada(path, serie)
+
+    assert scrapers_utils.leer_serie_empaquetada(path) == serie
+    assert path.read_bytes()[:4] == scrapers_utils.SERIE_MAGIC
@@ -0,0 +1,54 @@
+import json
+
+from api.services.timeseries import MES, TimeSeries
+
+
+def _dias(items):
+    return [int(item["fecha"][:2]) for item in items]
+
+
+def test_history_ordenada_por_fecha(serie_diaria):
+    assert _dias(serie_diaria.history()) == list(range(1, 11))
+
+
+def test_range_incluye_los_extremos(serie_diaria):
+    assert _dias(serie_diaria.range("2024-01-03", "2024-01-05")) == [3, 4, 5]
+
+
+def test_range_fuera_de_la_serie_o_invertido(serie_diaria):
+    assert _dias(serie_diaria.range("2023-12-01", "2024-01-02")) == [1, 2]
+    assert serie_diaria.range("2024-02-01", "2024-02-28") == []
+    assert serie_diaria.range("2024-01-05", "2024-01-03") == []
+
+
+def test_range_con_fecha_invalida(serie_diaria):
+    assert serie_diaria.range("2024-13-01", "2024-01-05") == []
+    assert serie_diaria.range("ayer", "hoy") == []
+
+
+def test_last(serie_diaria):
+    assert _dias(serie_diaria.last(3)) == [8, 9, 10]
+    assert _dias(serie_diaria.last(50)) == list(range(1, 11))
+    assert serie_diaria.last(0) == []
+
+
+def test_descarta_registros_sin_campos_requeridos(tmp_path):
+    for n, registro in enumerate([{"periodo": "2024-01", "v": 1}, {"v": 2}], 1):
+        (tmp_path / f"2024-0{n}-01.json").write_text(json.dumps([registro]))
+
+    serie = TimeSeries(
+        "mensual",
+        tmp_path,
+        date_field="periodo",
+        granularity=MES,
+        value_fields={"valor": "v"},
+        required=("periodo",),
+    )
+    assert serie.history() == [{"periodo": "2024-01", "valor": 1}]
+
+
+def test_serie_sin_datos(tmp_path):
+    serie = TimeSeries("vacia", tmp_path / "no-existe")
+    assert serie.history() == []
+    assert serie.last(5) == []
+    assert serie.version() is None